@@ -0,0 +1,29 @@
+"""index pending referral rewards
+
+Revision ID: 20250226_0010
+Revises: 20250225_0009
+Create Date: 2025-11-24 09:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20250226_0010"
+down_revision = "20250225_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_referral_rewards_pending",
+        "referral_rewards",
+        ["reward_type", "rewarded_at", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_referral_rewards_pending", table_name="referral_rewards")
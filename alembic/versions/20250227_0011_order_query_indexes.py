@@ -0,0 +1,33 @@
+"""composite indexes for order list queries
+
+Revision ID: 20250227_0011
+Revises: 20250226_0010
+Create Date: 2025-11-25 10:15:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20250227_0011"
+down_revision = "20250226_0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_orders_user_created", "orders", ["user_id", "created_at"])
+    op.create_index("ix_orders_status_created", "orders", ["status", "created_at"])
+    op.create_index("ix_orders_status_payment_expires", "orders", ["status", "payment_expires_at"])
+    op.create_index("ix_orders_created_at", "orders", ["created_at"])
+    op.create_index("ix_orders_invoice_payload", "orders", ["invoice_payload"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_orders_invoice_payload", table_name="orders")
+    op.drop_index("ix_orders_created_at", table_name="orders")
+    op.drop_index("ix_orders_status_payment_expires", table_name="orders")
+    op.drop_index("ix_orders_status_created", table_name="orders")
+    op.drop_index("ix_orders_user_created", table_name="orders")
@@ -0,0 +1,35 @@
+"""covering index for order payment summaries
+
+Revision ID: 20250227_0012
+Revises: 20250227_0011
+Create Date: 2025-11-25 11:40:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20250227_0012"
+down_revision = "20250227_0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_orders_status_currency_total",
+        "orders",
+        ["status", "currency", "total_amount"],
+    )
+    op.create_index(
+        "ix_orders_status_product_total",
+        "orders",
+        ["status", "product_id", "currency", "total_amount"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_orders_status_product_total", table_name="orders")
+    op.drop_index("ix_orders_status_currency_total", table_name="orders")
@@ -0,0 +1,29 @@
+"""index available instant inventory items
+
+Revision ID: 20250227_0013
+Revises: 20250227_0012
+Create Date: 2025-11-25 12:05:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20250227_0013"
+down_revision = "20250227_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_instant_inventory_items_available",
+        "instant_inventory_items",
+        ["product_id", "is_consumed", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_instant_inventory_items_available", table_name="instant_inventory_items")
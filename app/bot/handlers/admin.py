@@ -61,6 +61,7 @@ from app.infrastructure.db.models import Order, OrderTimeline
 from app.infrastructure.db.repositories.order import OrderRepository
 from app.services.admin_action_log_service import AdminActionLogService
 from app.services.config_service import ConfigService
+from app.services.container import membership_service
 from app.services.coupon_order_service import release_coupon_for_order
 from app.services.crypto_payment_service import CryptoPaymentService, OXAPAY_EXTRA_KEY
 from app.services.fulfillment_task_service import FulfillmentTaskService
@@ -1173,6 +1174,8 @@ async def handle_toggle_subscription(callback: CallbackQuery, session: AsyncSess
     current = await config_service.subscription_required()
     new_value = not current
     await config_service.set_subscription_required(new_value)
+    membership_service.invalidate_access()
+    membership_service.invalidate_channels()
 
     await callback.message.edit_text(
         f"Admin control panel (subscription gate {'enabled' if new_value else 'disabled'}).",
@@ -27,6 +27,7 @@ from app.services.order_fulfillment import ensure_fulfillment
 from app.services.coupon_order_service import release_coupon_for_order
 from app.services.order_notification_service import OrderNotificationService
 from app.services.order_service import OrderService
+from app.services.order_view import build_order_views
 from app.services.loyalty_order_service import refund_loyalty_for_order
 from app.services.referral_order_service import cancel_referral_for_order
 
@@ -242,12 +243,12 @@ async def _render_pending_orders_list(
         has_next=has_more,
     )
     markup = payments_orders_keyboard(
-        orders,
+        build_order_views(orders),
         page=page,
         has_prev=has_prev,
         has_next=has_more,
         source_prefix=ADMIN_PAYMENTS_PENDING_PAGE_PREFIX,
-        back_callback=AdminPaymentsCallback.REFRESH.value,
+        back_callback=AdminPaymentsCallback.REFRESH,
     )
     try:
         await message.edit_text(text, reply_markup=markup, disable_web_page_preview=True)
@@ -284,12 +285,12 @@ async def _render_recent_paid_list(
         has_next=has_more,
     )
     markup = payments_orders_keyboard(
-        orders,
+        build_order_views(orders),
         page=page,
         has_prev=has_prev,
         has_next=has_more,
         source_prefix=ADMIN_PAYMENTS_RECENT_PAGE_PREFIX,
-        back_callback=AdminPaymentsCallback.REFRESH.value,
+        back_callback=AdminPaymentsCallback.REFRESH,
     )
     try:
         await message.edit_text(text, reply_markup=markup, disable_web_page_preview=True)
@@ -12,12 +12,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.bot.keyboards.admin import AdminMenuCallback
 from app.bot.keyboards.admin_referral import (
     ADMIN_REFERRAL_DELETE_PREFIX,
+    ADMIN_REFERRAL_EDIT_DEFAULT_VALUE,
+    ADMIN_REFERRAL_EDIT_RESELLERS,
     ADMIN_REFERRAL_EDIT_REWARD_PREFIX,
     ADMIN_REFERRAL_LINK_PREFIX,
     ADMIN_REFERRAL_LINKS,
     ADMIN_REFERRAL_MARK_PAID_PREFIX,
     ADMIN_REFERRAL_PENDING,
     ADMIN_REFERRAL_SETTINGS,
+    ADMIN_REFERRAL_TOGGLE_AUTO_REWARD,
+    ADMIN_REFERRAL_TOGGLE_DEFAULT_TYPE,
+    ADMIN_REFERRAL_TOGGLE_ENABLED,
+    ADMIN_REFERRAL_TOGGLE_PUBLIC,
     ADMIN_REFERRAL_VIEW_REWARDS_PREFIX,
     referral_admin_dashboard_keyboard,
     referral_admin_link_keyboard,
@@ -86,7 +92,7 @@ async def handle_referral_settings(callback: CallbackQuery, session: AsyncSessio
         await callback.answer()
 
 
-@router.callback_query(F.data == "admin:ref:toggle_enabled")
+@router.callback_query(F.data == ADMIN_REFERRAL_TOGGLE_ENABLED)
 async def handle_toggle_enabled(callback: CallbackQuery, session: AsyncSession) -> None:
     config_service = ConfigService(session)
     settings = await config_service.get_referral_settings()
@@ -96,7 +102,7 @@ async def handle_toggle_enabled(callback: CallbackQuery, session: AsyncSession)
     await callback.answer(f"Program {'enabled' if updated.enabled else 'disabled'}.")
 
 
-@router.callback_query(F.data == "admin:ref:toggle_auto_reward")
+@router.callback_query(F.data == ADMIN_REFERRAL_TOGGLE_AUTO_REWARD)
 async def handle_toggle_auto_reward(callback: CallbackQuery, session: AsyncSession) -> None:
     config_service = ConfigService(session)
     settings = await config_service.get_referral_settings()
@@ -106,7 +112,7 @@ async def handle_toggle_auto_reward(callback: CallbackQuery, session: AsyncSessi
     await callback.answer(f"Auto reward {'enabled' if updated.auto_reward else 'disabled'}.")
 
 
-@router.callback_query(F.data == "admin:ref:toggle_public")
+@router.callback_query(F.data == ADMIN_REFERRAL_TOGGLE_PUBLIC)
 async def handle_toggle_public(callback: CallbackQuery, session: AsyncSession) -> None:
     config_service = ConfigService(session)
     settings = await config_service.get_referral_settings()
@@ -116,7 +122,7 @@ async def handle_toggle_public(callback: CallbackQuery, session: AsyncSession) -
     await callback.answer(f"Public links {'enabled' if updated.allow_public_links else 'disabled'}.")
 
 
-@router.callback_query(F.data == "admin:ref:toggle_default_type")
+@router.callback_query(F.data == ADMIN_REFERRAL_TOGGLE_DEFAULT_TYPE)
 async def handle_toggle_default_type(callback: CallbackQuery, session: AsyncSession) -> None:
     config_service = ConfigService(session)
     settings = await config_service.get_referral_settings()
@@ -130,7 +136,7 @@ async def handle_toggle_default_type(callback: CallbackQuery, session: AsyncSess
     await callback.answer("Default reward type updated.")
 
 
-@router.callback_query(F.data == "admin:ref:edit_default_value")
+@router.callback_query(F.data == ADMIN_REFERRAL_EDIT_DEFAULT_VALUE)
 async def handle_edit_default_value(callback: CallbackQuery, state: FSMContext) -> None:
     await state.set_state(AdminReferralState.edit_default_value)
     await callback.message.answer(
@@ -166,7 +172,7 @@ async def process_edit_default_value(message: Message, session: AsyncSession, st
     await message.answer("Default reward value updated.")
 
 
-@router.callback_query(F.data == "admin:ref:edit_resellers")
+@router.callback_query(F.data == ADMIN_REFERRAL_EDIT_RESELLERS)
 async def handle_edit_resellers(callback: CallbackQuery, state: FSMContext) -> None:
     await state.set_state(AdminReferralState.edit_reseller_ids)
     await callback.message.answer(
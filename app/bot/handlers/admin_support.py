@@ -28,6 +28,8 @@ from app.bot.keyboards.admin_support import (
     admin_support_list_keyboard,
     admin_support_menu_keyboard,
     admin_support_ticket_keyboard,
+    decode_filter_code,
+    decode_priority_code,
     decode_status_code,
 )
 from app.bot.keyboards.support import support_ticket_notification_keyboard
@@ -59,7 +61,7 @@ async def handle_admin_support_settings(callback: CallbackQuery, session: AsyncS
     await _safe_edit_message(
         callback.message,
         _format_antispam_settings(antispam),
-        admin_support_antispam_keyboard(antispam),
+        admin_support_antispam_keyboard(),
     )
     await callback.answer()
 
@@ -100,7 +102,7 @@ async def handle_admin_support_settings_update(callback: CallbackQuery, session:
     await _safe_edit_message(
         callback.message,
         _format_antispam_settings(settings),
-        admin_support_antispam_keyboard(settings),
+        admin_support_antispam_keyboard(),
     )
     await callback.answer("Updated.")
 
@@ -116,9 +118,10 @@ async def handle_admin_support_menu_filter(callback: CallbackQuery, session: Asy
 async def handle_admin_support_list_page(callback: CallbackQuery, session: AsyncSession, state: FSMContext) -> None:
     remainder = callback.data.removeprefix(ADMIN_SUPPORT_LIST_PREFIX)
     try:
-        filter_code, page_val = remainder.split(":")
+        code, page_val = remainder.split(":")
     except ValueError:
-        filter_code, page_val = "open", "0"
+        code, page_val = "", "0"
+    filter_code = decode_filter_code(code)
     try:
         page = max(0, int(page_val))
     except ValueError:
@@ -319,9 +322,8 @@ async def handle_admin_support_assign(callback: CallbackQuery, session: AsyncSes
 async def handle_admin_support_priority(callback: CallbackQuery, session: AsyncSession, state: FSMContext) -> None:
     remainder = callback.data.removeprefix(ADMIN_SUPPORT_PRIORITY_PREFIX)
     ticket_id, priority_val = remainder.split(":")
-    try:
-        priority = SupportTicketPriority(priority_val)
-    except ValueError:
+    priority = decode_priority_code(priority_val)
+    if priority is None:
         await callback.answer("Invalid priority.", show_alert=True)
         return
     service = SupportService(session)
@@ -10,10 +10,9 @@ from aiogram import F, Router
 from aiogram.filters import Command, CommandStart
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.bot.keyboards.main_menu import MainMenuCallback, main_menu_keyboard
+from app.bot.keyboards.main_menu import MainMenuCallback, main_menu_keyboard, profile_keyboard
 from app.bot.keyboards.orders import (
     ORDER_CANCEL_ORDER_PREFIX,
     ORDER_FEEDBACK_RATE_PREFIX,
@@ -27,6 +26,7 @@ from app.bot.keyboards.orders import (
     orders_list_keyboard,
 )
 from app.bot.keyboards.subscription import (
+    SUBSCRIPTION_NO_LINK_CALLBACK,
     SUBSCRIPTION_REFRESH_CALLBACK,
     build_subscription_keyboard,
 )
@@ -36,7 +36,6 @@ from app.core.enums import OrderStatus
 from app.infrastructure.db.models import Order, OrderTimeline
 from app.infrastructure.db.repositories import (
     OrderRepository,
-    RequiredChannelRepository,
     SupportRepository,
     UserRepository,
 )
@@ -181,8 +180,7 @@ async def handle_profile(callback: CallbackQuery, session: AsyncSession, state:
     membership_required = await membership_service.is_subscription_required(session)
     membership_lines: list[str] = []
     if membership_required:
-        channel_repo = RequiredChannelRepository(session)
-        channels = await channel_repo.list_active()
+        channels = await membership_service.get_active_channels(session)
         is_member = await membership_service.user_can_access(
             callback.bot,
             profile.telegram_id,
@@ -258,16 +256,10 @@ async def handle_profile(callback: CallbackQuery, session: AsyncSession, state:
         *referral_lines,
     ]
 
-    builder = InlineKeyboardBuilder()
-    builder.button(text="My orders", callback_data=MainMenuCallback.ACCOUNT.value)
-    builder.button(text="My referrals", callback_data=MainMenuCallback.REFERRAL.value)
-    builder.button(text="Back to menu", callback_data=MainMenuCallback.HOME.value)
-    builder.adjust(1)
-
     await _safe_edit_message(
         callback.message,
         "\n".join(lines),
-        reply_markup=builder.as_markup(),
+        reply_markup=profile_keyboard(),
     )
     await callback.answer()
 
@@ -544,8 +536,7 @@ async def handle_order_reissue(callback: CallbackQuery, session: AsyncSession, s
 
 @router.callback_query(F.data == SUBSCRIPTION_REFRESH_CALLBACK)
 async def handle_subscription_refresh(callback: CallbackQuery, session: AsyncSession) -> None:
-    channel_repo = RequiredChannelRepository(session)
-    channels = await channel_repo.list_active()
+    channels = await membership_service.get_active_channels(session)
 
     is_allowed = await membership_service.user_can_access(
         bot=callback.bot,
@@ -564,7 +555,7 @@ async def handle_subscription_refresh(callback: CallbackQuery, session: AsyncSes
         )
         return
 
-    keyboard = build_subscription_keyboard(list(channels)) if channels else None
+    keyboard = build_subscription_keyboard(channels) if channels else None
     await callback.answer("You still need to join the required channels.", show_alert=True)
     await _safe_edit_message(
         callback.message,
@@ -573,7 +564,7 @@ async def handle_subscription_refresh(callback: CallbackQuery, session: AsyncSes
     )
 
 
-@router.callback_query(F.data == "subscription:no_link")
+@router.callback_query(F.data == SUBSCRIPTION_NO_LINK_CALLBACK)
 async def handle_subscription_no_link(callback: CallbackQuery) -> None:
     await callback.answer(
         "Channel link is not configured. Please contact the administrator.",
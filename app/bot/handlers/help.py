@@ -5,11 +5,17 @@ from typing import Optional
 from aiogram import F, Router
 from aiogram.filters import Command
 from aiogram.types import CallbackQuery, Message
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.bot.keyboards.help import HelpCallback, help_categories_keyboard, help_items_keyboard
-from app.bot.keyboards.main_menu import MainMenuCallback, main_menu_keyboard
+from app.bot.keyboards.help import (
+    HELP_BACK_TO_MENU,
+    HELP_CATEGORY_PREFIX,
+    HELP_ITEM_PREFIX,
+    HELP_MAIN_MENU,
+    help_categories_keyboard,
+    help_items_keyboard,
+)
+from app.bot.keyboards.main_menu import MainMenuCallback, back_keyboard, main_menu_keyboard
 from app.infrastructure.db.repositories import UserRepository
 from app.core.config import get_settings
 
@@ -107,7 +113,7 @@ async def handle_help_menu(callback: CallbackQuery, session: AsyncSession, user_
     await callback.answer()
 
 
-@router.callback_query(F.data == HelpCallback.MAIN_MENU.value)
+@router.callback_query(F.data == HELP_MAIN_MENU)
 async def handle_help_main(callback: CallbackQuery, session: AsyncSession, user_profile) -> None:
     if not _user_is_owner(callback.from_user.id):
         await callback.answer("Help is available to administrators only.", show_alert=True)
@@ -116,7 +122,7 @@ async def handle_help_main(callback: CallbackQuery, session: AsyncSession, user_
     await callback.answer()
 
 
-@router.callback_query(F.data == HelpCallback.BACK_TO_MENU.value)
+@router.callback_query(F.data == HELP_BACK_TO_MENU)
 async def handle_help_back_to_menu(callback: CallbackQuery) -> None:
     await callback.message.edit_text(
         "Main menu",
@@ -125,13 +131,12 @@ async def handle_help_back_to_menu(callback: CallbackQuery) -> None:
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith(f"{HelpCallback.CATEGORY.value}:"))
+@router.callback_query(F.data.startswith(HELP_CATEGORY_PREFIX))
 async def handle_help_category(callback: CallbackQuery) -> None:
     if not _user_is_owner(callback.from_user.id):
         await callback.answer("Help is available to administrators only.", show_alert=True)
         return
-    prefix = f"{HelpCallback.CATEGORY.value}:"
-    cat_id = callback.data[len(prefix):]
+    cat_id = callback.data[len(HELP_CATEGORY_PREFIX):]
     content = ADMIN_HELP_CONTENT.get(cat_id)
     if content is None:
         await callback.answer("Unknown section.", show_alert=True)
@@ -146,13 +151,12 @@ async def handle_help_category(callback: CallbackQuery) -> None:
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith(f"{HelpCallback.ITEM.value}:"))
+@router.callback_query(F.data.startswith(HELP_ITEM_PREFIX))
 async def handle_help_item(callback: CallbackQuery) -> None:
     if not _user_is_owner(callback.from_user.id):
         await callback.answer("Help is available to administrators only.", show_alert=True)
         return
-    prefix = f"{HelpCallback.ITEM.value}:"
-    payload = callback.data[len(prefix):]
+    payload = callback.data[len(HELP_ITEM_PREFIX):]
     try:
         cat_id, item_id = payload.split(":", 1)
     except ValueError:
@@ -167,11 +171,9 @@ async def handle_help_item(callback: CallbackQuery) -> None:
         await callback.answer("Unknown topic.", show_alert=True)
         return
     title, description = item
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Back", callback_data=f"{HelpCallback.CATEGORY.value}:{cat_id}")
     await callback.message.edit_text(
         f"<b>{title}</b>\n{description}",
-        reply_markup=builder.as_markup(),
+        reply_markup=back_keyboard(HELP_CATEGORY_PREFIX + cat_id),
         parse_mode="HTML",
     )
     await callback.answer()
@@ -10,7 +10,6 @@ from aiogram import F, Router
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.bot.keyboards.admin import order_manage_keyboard
@@ -19,6 +18,7 @@ from app.bot.keyboards.orders import (
     ORDER_CANCEL_CALLBACK,
     ORDER_CONFIRM_CALLBACK,
     order_confirm_keyboard,
+    order_payment_keyboard,
 )
 from app.bot.keyboards.products import (
     PRODUCT_BACK_CALLBACK,
@@ -33,7 +33,7 @@ from app.bot.keyboards.products import (
     product_details_keyboard,
     products_list_keyboard,
 )
-from app.bot.keyboards.cart import cart_checkout_confirmation_keyboard
+from app.bot.keyboards.cart import cart_checkout_confirmation_keyboard, cart_item_added_keyboard
 from app.bot.states.order import OrderFlowState
 from app.core.config import get_settings
 from app.core.enums import OrderStatus, ProductQuestionType
@@ -516,15 +516,10 @@ async def _send_related_products(message: Message, session: AsyncSession, produc
     if not related:
         return
 
-    builder = InlineKeyboardBuilder()
-    for product in related:
-        builder.button(
-            text=f"{product.name} - {product.price} {product.currency}",
-            callback_data=f"{PRODUCT_VIEW_PREFIX}{product.id}",
-        )
-    builder.button(text="Back", callback_data=PRODUCT_LIST_BACK_CALLBACK)
-    builder.adjust(1)
-    await message.answer("You might also like:", reply_markup=builder.as_markup())
+    await message.answer(
+        "You might also like:",
+        reply_markup=products_list_keyboard(related, back_callback=PRODUCT_LIST_BACK_CALLBACK),
+    )
 
 
 @router.callback_query(F.data.startswith(PRODUCT_ADD_TO_CART_PREFIX))
@@ -555,13 +550,9 @@ async def handle_add_to_cart(
     await cart_service.refresh_totals(cart)
 
     await callback.answer("Added to cart")
-    builder = InlineKeyboardBuilder()
-    builder.button(text="View cart", callback_data=MainMenuCallback.CART.value)
-    builder.button(text="Continue shopping", callback_data=MainMenuCallback.PRODUCTS.value)
-    builder.adjust(1)
     await callback.message.answer(
         f"Cart update: <b>{product.name}</b> added.\nTotal items: {len(cart.items)}",
-        reply_markup=builder.as_markup(),
+        reply_markup=cart_item_added_keyboard(),
     )
 
 
@@ -1291,16 +1282,9 @@ async def _notify_admins_of_order(
 
 
 def _order_confirmation_keyboard(crypto: CryptoInvoiceResult | None):
-    if crypto is None or not crypto.enabled or not crypto.pay_link:
-        builder = InlineKeyboardBuilder()
-        builder.button(text="Back to menu", callback_data=MainMenuCallback.PRODUCTS.value)
-        builder.adjust(1)
-        return builder.as_markup()
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Pay with crypto", url=crypto.pay_link)
-    builder.button(text="Back to menu", callback_data=MainMenuCallback.PRODUCTS.value)
-    builder.adjust(1)
-    return builder.as_markup()
+    if crypto is None or not crypto.enabled:
+        return order_payment_keyboard(None)
+    return order_payment_keyboard(crypto.pay_link)
 
 
 def _format_cart_summary_for_confirmation(items: list[dict], totals: dict[str, str], currency: str) -> str:
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from enum import StrEnum
+from functools import lru_cache
+
+from app.core.enums import SupportTicketStatus
+
+
+CLOSED_TICKET_STATUSES = frozenset({SupportTicketStatus.RESOLVED, SupportTicketStatus.ARCHIVED})
+
+
+@lru_cache(maxsize=None)
+def status_label(status: StrEnum) -> str:
+    return status.value.replace("_", " ").title()
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+# Every keyboard here is assembled from strings we control, so the markup is
+# built with model_construct and skips pydantic validation of each button.
+
+
+def button(text: str, callback_data: str) -> InlineKeyboardButton:
+    return InlineKeyboardButton.model_construct(text=text, callback_data=callback_data)
+
+
+def url_button(text: str, url: str) -> InlineKeyboardButton:
+    return InlineKeyboardButton.model_construct(text=text, url=url)
+
+
+def column(buttons: Iterable[InlineKeyboardButton]) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=[[item] for item in buttons])
+
+
+def rows_markup(rows: list[list[InlineKeyboardButton]]) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=rows)
+
+
+def grid(buttons: Sequence[InlineKeyboardButton], width: int) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup.model_construct(
+        inline_keyboard=[list(buttons[index : index + width]) for index in range(0, len(buttons), width)]
+    )
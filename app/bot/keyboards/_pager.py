@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from aiogram.types import InlineKeyboardButton
+
+from app.bot.keyboards._markup import button
+
+PREV_TEXT = "◀️ Prev"
+REFRESH_TEXT = "Refresh"
+NEXT_TEXT = "▶️ Next"
+
+
+@lru_cache(maxsize=256)
+def pager_row(
+    prefix: str,
+    page: int,
+    has_prev: bool,
+    has_next: bool,
+) -> tuple[InlineKeyboardButton, ...]:
+    buttons: list[InlineKeyboardButton] = []
+    if has_prev:
+        buttons.append(button(PREV_TEXT, f"{prefix}{page - 1}"))
+    buttons.append(button(REFRESH_TEXT, f"{prefix}{page}"))
+    if has_next:
+        buttons.append(button(NEXT_TEXT, f"{prefix}{page + 1}"))
+    return tuple(buttons)
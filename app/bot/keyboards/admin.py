@@ -1,18 +1,21 @@
 ﻿from __future__ import annotations
 
 from enum import StrEnum
+from functools import lru_cache
+from itertools import chain
 from typing import TYPE_CHECKING, Sequence
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from app.bot.keyboards._labels import status_label
+from app.bot.keyboards._markup import button, column, rows_markup
+from app.bot.keyboards._pager import pager_row
 from app.core.enums import CouponStatus, OrderStatus
-from app.services.crypto_payment_service import OXAPAY_EXTRA_KEY
 from app.services.timeline_status_service import TimelineStatusDefinition, TimelineStatusRegistry
 
 if TYPE_CHECKING:
     from app.services.config_service import ConfigService
-    from app.infrastructure.db.models import AdminActionLog, Order, OrderFulfillmentTask, OrderTimeline
+    from app.infrastructure.db.models import AdminActionLog, Coupon, Order, OrderFulfillmentTask, OrderTimeline
 
 
 class AdminMenuCallback(StrEnum):
@@ -108,293 +111,264 @@ ADMIN_COUPON_DELETE_CONFIRM_PREFIX = "admin:coupon:delete_confirm:"
 ADMIN_COUPON_TOGGLE_AUTO_PREFIX = "admin:coupon:auto:"
 ADMIN_COUPON_EDIT_TYPE_PREFIX = "admin:coupon:edit_type:"
 
-
+_BACK_TO_MAIN_BUTTON = button("Back", AdminMenuCallback.BACK_TO_MAIN.value)
+_ORDERS_BACK_BUTTON = button("Back", AdminOrderCallback.BACK.value)
+_BACK_TO_ORDERS_BUTTON = button("Back to orders", AdminMenuCallback.MANAGE_ORDERS.value)
+_BACK_TO_RECENT_ORDERS_BUTTON = button("Back to orders", AdminOrderCallback.VIEW_RECENT.value)
+_BACK_TO_FILTERS_BUTTON = button("Back to filters", AdminOrderCallback.TIMELINE_FILTERS.value)
+
+_PAID_ONLY_TIMELINE_KEYS = frozenset({"processing", "shipping", "delivered"})
+_PAID_LIKE_STATUSES = frozenset({OrderStatus.PAID, OrderStatus.CANCELLED, OrderStatus.EXPIRED})
+_MARKABLE_PAID_STATUSES = frozenset({OrderStatus.AWAITING_PAYMENT, OrderStatus.CANCELLED, OrderStatus.EXPIRED})
+
+
+# (off, on) label pairs indexed by the boolean setting they describe.
+_TOGGLE_LABELS: dict[str, tuple[str, str]] = {
+    "crypto_enabled": ("Enable crypto payments", "Disable crypto payments"),
+    "mixed_payment": ("Mixed payment: OFF", "Mixed payment: ON"),
+    "fee_payer": ("Fee payer: Merchant", "Fee payer: Customer"),
+    "auto_withdrawal": ("Auto withdrawal: OFF", "Auto withdrawal: ON"),
+    "notify_payment": ("Payment alerts: OFF", "Payment alerts: ON"),
+    "notify_cancellation": ("Cancellation alerts: OFF", "Cancellation alerts: ON"),
+    "notify_expiration": ("Expiration alerts: OFF", "Expiration alerts: ON"),
+    "loyalty_enabled": ("Loyalty program: OFF", "Loyalty program: ON"),
+    "auto_earn": ("Auto-earn: OFF", "Auto-earn: ON"),
+    "auto_prompt": ("Prompt users: OFF", "Prompt users: ON"),
+    "auto_apply": ("Auto-apply: OFF", "Auto-apply: ON"),
+}
+
+
+@lru_cache(maxsize=2)
 def admin_menu_keyboard(subscription_enabled: bool) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text=("Disable subscription gate" if subscription_enabled else "Enable subscription gate"),
-        callback_data=AdminMenuCallback.TOGGLE_SUBSCRIPTION.value,
+    return column(
+        (
+            button(
+                "Disable subscription gate" if subscription_enabled else "Enable subscription gate",
+                AdminMenuCallback.TOGGLE_SUBSCRIPTION.value,
+            ),
+            button("Required channels", AdminMenuCallback.MANAGE_CHANNELS.value),
+            button("Crypto payments", AdminMenuCallback.MANAGE_CRYPTO.value),
+            button("Payments dashboard", AdminMenuCallback.MANAGE_PAYMENTS.value),
+            button("Support desk", AdminMenuCallback.MANAGE_SUPPORT.value),
+            button("Products", AdminMenuCallback.MANAGE_PRODUCTS.value),
+            button("Users", AdminMenuCallback.MANAGE_USERS.value),
+            button("Orders", AdminMenuCallback.MANAGE_ORDERS.value),
+            button("Coupons", AdminMenuCallback.MANAGE_COUPONS.value),
+            button("Loyalty & rewards", AdminMenuCallback.MANAGE_LOYALTY.value),
+            button("Referrals", AdminMenuCallback.MANAGE_REFERRALS.value),
+            button("Back", AdminMenuCallback.BACK_TO_MAIN.value),
+        )
     )
-    builder.button(text="Required channels", callback_data=AdminMenuCallback.MANAGE_CHANNELS.value)
-    builder.button(text="Crypto payments", callback_data=AdminMenuCallback.MANAGE_CRYPTO.value)
-    builder.button(text="Payments dashboard", callback_data=AdminMenuCallback.MANAGE_PAYMENTS.value)
-    builder.button(text="Support desk", callback_data=AdminMenuCallback.MANAGE_SUPPORT.value)
-    builder.button(text="Products", callback_data=AdminMenuCallback.MANAGE_PRODUCTS.value)
-    builder.button(text="Users", callback_data=AdminMenuCallback.MANAGE_USERS.value)
-    builder.button(text="Orders", callback_data=AdminMenuCallback.MANAGE_ORDERS.value)
-    builder.button(text="Coupons", callback_data=AdminMenuCallback.MANAGE_COUPONS.value)
-    builder.button(text="Loyalty & rewards", callback_data=AdminMenuCallback.MANAGE_LOYALTY.value)
-    builder.button(text="Referrals", callback_data=AdminMenuCallback.MANAGE_REFERRALS.value)
-    builder.button(text="Back", callback_data=AdminMenuCallback.BACK_TO_MAIN.value)
-    builder.adjust(1)
-    return builder.as_markup()
 
 
 def admin_channels_keyboard() -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Add channel", callback_data="admin:channel:add")
-    builder.button(text="Back", callback_data=AdminMenuCallback.BACK_TO_MAIN.value)
-    builder.adjust(1)
-    return builder.as_markup()
+    return column(
+        (
+            button("Add channel", "admin:channel:add"),
+            button("Back", AdminMenuCallback.BACK_TO_MAIN.value),
+        )
+    )
+
+
+_CRYPTO_STATIC_ROWS: tuple[tuple[str, str], ...] = (
+    ("Set allowed currencies", AdminCryptoCallback.SET_CURRENCIES.value),
+    ("Set invoice lifetime", AdminCryptoCallback.SET_LIFETIME.value),
+    ("Set underpaid coverage", AdminCryptoCallback.SET_UNDERPAID.value),
+    ("Set settlement currency", AdminCryptoCallback.SET_TO_CURRENCY.value),
+    ("Set return URL", AdminCryptoCallback.SET_RETURN_URL.value),
+    ("Set callback URL", AdminCryptoCallback.SET_CALLBACK_URL.value),
+    ("Set callback secret", AdminCryptoCallback.SET_CALLBACK_SECRET.value),
+    ("Show supported currencies", AdminCryptoCallback.REFRESH_ACCEPTED.value),
+    ("View open invoices", AdminCryptoCallback.VIEW_PENDING.value),
+    ("Sync open invoices", AdminCryptoCallback.SYNC_PENDING.value),
+    ("Back", AdminCryptoCallback.BACK.value),
+)
 
 
 def crypto_settings_keyboard(config: "ConfigService.CryptoSettings") -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text=("Disable crypto payments" if config.enabled else "Enable crypto payments"),
-        callback_data=AdminCryptoCallback.TOGGLE_ENABLED.value,
-    )
-    builder.button(
-        text=(f"Mixed payment: {'ON' if config.mixed_payment else 'OFF'}"),
-        callback_data=AdminCryptoCallback.TOGGLE_MIXED.value,
-    )
-    fee_label = "Fee payer: Customer" if config.fee_payer == "payer" else "Fee payer: Merchant"
-    builder.button(
-        text=fee_label,
-        callback_data=AdminCryptoCallback.TOGGLE_FEE_PAYER.value,
-    )
-    builder.button(
-        text=(f"Auto withdrawal: {'ON' if config.auto_withdrawal else 'OFF'}"),
-        callback_data=AdminCryptoCallback.TOGGLE_AUTO_WITHDRAWAL.value,
-    )
-    builder.button(
-        text="Set allowed currencies",
-        callback_data=AdminCryptoCallback.SET_CURRENCIES.value,
-    )
-    builder.button(
-        text="Set invoice lifetime",
-        callback_data=AdminCryptoCallback.SET_LIFETIME.value,
-    )
-    builder.button(
-        text="Set underpaid coverage",
-        callback_data=AdminCryptoCallback.SET_UNDERPAID.value,
-    )
-    builder.button(
-        text="Set settlement currency",
-        callback_data=AdminCryptoCallback.SET_TO_CURRENCY.value,
+    return _crypto_settings_markup(
+        bool(config.enabled),
+        bool(config.mixed_payment),
+        config.fee_payer == "payer",
+        bool(config.auto_withdrawal),
     )
-    builder.button(
-        text="Set return URL",
-        callback_data=AdminCryptoCallback.SET_RETURN_URL.value,
-    )
-    builder.button(
-        text="Set callback URL",
-        callback_data=AdminCryptoCallback.SET_CALLBACK_URL.value,
-    )
-    builder.button(
-        text="Set callback secret",
-        callback_data=AdminCryptoCallback.SET_CALLBACK_SECRET.value,
-    )
-    builder.button(
-        text="Show supported currencies",
-        callback_data=AdminCryptoCallback.REFRESH_ACCEPTED.value,
-    )
-    builder.button(
-        text="View open invoices",
-        callback_data=AdminCryptoCallback.VIEW_PENDING.value,
-    )
-    builder.button(
-        text="Sync open invoices",
-        callback_data=AdminCryptoCallback.SYNC_PENDING.value,
+
+
+@lru_cache(maxsize=32)
+def _crypto_settings_markup(
+    enabled: bool,
+    mixed_payment: bool,
+    customer_pays_fee: bool,
+    auto_withdrawal: bool,
+) -> InlineKeyboardMarkup:
+    toggles = (
+        (_TOGGLE_LABELS["crypto_enabled"][enabled], AdminCryptoCallback.TOGGLE_ENABLED.value),
+        (_TOGGLE_LABELS["mixed_payment"][mixed_payment], AdminCryptoCallback.TOGGLE_MIXED.value),
+        (_TOGGLE_LABELS["fee_payer"][customer_pays_fee], AdminCryptoCallback.TOGGLE_FEE_PAYER.value),
+        (_TOGGLE_LABELS["auto_withdrawal"][auto_withdrawal], AdminCryptoCallback.TOGGLE_AUTO_WITHDRAWAL.value),
     )
-    builder.button(text="Back", callback_data=AdminCryptoCallback.BACK.value)
-    builder.adjust(1)
-    return builder.as_markup()
+    return column(button(text, callback_data) for text, callback_data in chain(toggles, _CRYPTO_STATIC_ROWS))
 
 
 def order_settings_keyboard(config: "ConfigService.AlertSettings") -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text=f"Payment alerts: {'ON' if config.notify_payment else 'OFF'}",
-        callback_data=AdminOrderCallback.TOGGLE_PAYMENT_ALERT.value,
-    )
-    builder.button(
-        text=f"Cancellation alerts: {'ON' if config.notify_cancellation else 'OFF'}",
-        callback_data=AdminOrderCallback.TOGGLE_CANCEL_ALERT.value,
-    )
-    builder.button(
-        text=f"Expiration alerts: {'ON' if config.notify_expiration else 'OFF'}",
-        callback_data=AdminOrderCallback.TOGGLE_EXPIRE_ALERT.value,
-    )
-    builder.button(
-        text="Review recent orders",
-        callback_data=AdminOrderCallback.VIEW_RECENT.value,
-    )
-    builder.button(
-        text="Timeline filters",
-        callback_data=AdminOrderCallback.TIMELINE_FILTERS.value,
-    )
-    builder.button(
-        text="Timeline statuses",
-        callback_data=AdminOrderCallback.TIMELINE_STATUSES.value,
+    return _order_settings_markup(
+        bool(config.notify_payment),
+        bool(config.notify_cancellation),
+        bool(config.notify_expiration),
     )
-    builder.button(
-        text="Search orders",
-        callback_data=AdminOrderCallback.SEARCH.value,
-    )
-    builder.button(
-        text="Fulfillment queue",
-        callback_data=AdminOrderCallback.FULFILLMENT_TASKS.value,
-    )
-    builder.button(
-        text="Admin activity log",
-        callback_data=AdminOrderCallback.ACTION_LOGS.value,
+
+
+@lru_cache(maxsize=8)
+def _order_settings_markup(
+    notify_payment: bool,
+    notify_cancellation: bool,
+    notify_expiration: bool,
+) -> InlineKeyboardMarkup:
+    return column(
+        (
+            button(
+                _TOGGLE_LABELS["notify_payment"][notify_payment],
+                AdminOrderCallback.TOGGLE_PAYMENT_ALERT.value,
+            ),
+            button(
+                _TOGGLE_LABELS["notify_cancellation"][notify_cancellation],
+                AdminOrderCallback.TOGGLE_CANCEL_ALERT.value,
+            ),
+            button(
+                _TOGGLE_LABELS["notify_expiration"][notify_expiration],
+                AdminOrderCallback.TOGGLE_EXPIRE_ALERT.value,
+            ),
+            button("Review recent orders", AdminOrderCallback.VIEW_RECENT.value),
+            button("Timeline filters", AdminOrderCallback.TIMELINE_FILTERS.value),
+            button("Timeline statuses", AdminOrderCallback.TIMELINE_STATUSES.value),
+            button("Search orders", AdminOrderCallback.SEARCH.value),
+            button("Fulfillment queue", AdminOrderCallback.FULFILLMENT_TASKS.value),
+            button("Admin activity log", AdminOrderCallback.ACTION_LOGS.value),
+            button("Back", AdminOrderCallback.BACK.value),
+        )
     )
-    builder.button(text="Back", callback_data=AdminOrderCallback.BACK.value)
-    builder.adjust(1)
-    return builder.as_markup()
 
 
 def loyalty_settings_keyboard(config: "ConfigService.LoyaltySettings") -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text=f"Loyalty program: {'ON' if config.enabled else 'OFF'}",
-        callback_data=AdminLoyaltyCallback.TOGGLE_ENABLED.value,
-    )
-    builder.button(
-        text=f"Earn rate: {config.points_per_currency:.2f} pts / unit",
-        callback_data=AdminLoyaltyCallback.SET_EARN_RATE.value,
-    )
-    builder.button(
-        text=f"Redeem ratio: {config.redeem_ratio:.4f} currency / pt",
-        callback_data=AdminLoyaltyCallback.SET_REDEEM_RATIO.value,
-    )
-    builder.button(
-        text=f"Minimum redeem: {config.min_redeem_points} pts",
-        callback_data=AdminLoyaltyCallback.SET_MIN_REDEEM.value,
-    )
-    builder.button(
-        text=f"Auto-earn: {'ON' if config.auto_earn else 'OFF'}",
-        callback_data=AdminLoyaltyCallback.TOGGLE_AUTO_EARN.value,
-    )
-    builder.button(
-        text=f"Prompt users: {'ON' if config.auto_prompt else 'OFF'}",
-        callback_data=AdminLoyaltyCallback.TOGGLE_AUTO_PROMPT.value,
+    return _loyalty_settings_markup(
+        bool(config.enabled),
+        config.points_per_currency,
+        config.redeem_ratio,
+        config.min_redeem_points,
+        bool(config.auto_earn),
+        bool(config.auto_prompt),
+    )
+
+
+@lru_cache(maxsize=32)
+def _loyalty_settings_markup(
+    enabled: bool,
+    points_per_currency: float,
+    redeem_ratio: float,
+    min_redeem_points: int,
+    auto_earn: bool,
+    auto_prompt: bool,
+) -> InlineKeyboardMarkup:
+    return column(
+        (
+            button(
+                _TOGGLE_LABELS["loyalty_enabled"][enabled],
+                AdminLoyaltyCallback.TOGGLE_ENABLED.value,
+            ),
+            button(
+                f"Earn rate: {points_per_currency:.2f} pts / unit",
+                AdminLoyaltyCallback.SET_EARN_RATE.value,
+            ),
+            button(
+                f"Redeem ratio: {redeem_ratio:.4f} currency / pt",
+                AdminLoyaltyCallback.SET_REDEEM_RATIO.value,
+            ),
+            button(
+                f"Minimum redeem: {min_redeem_points} pts",
+                AdminLoyaltyCallback.SET_MIN_REDEEM.value,
+            ),
+            button(
+                _TOGGLE_LABELS["auto_earn"][auto_earn],
+                AdminLoyaltyCallback.TOGGLE_AUTO_EARN.value,
+            ),
+            button(
+                _TOGGLE_LABELS["auto_prompt"][auto_prompt],
+                AdminLoyaltyCallback.TOGGLE_AUTO_PROMPT.value,
+            ),
+            button("Back", AdminLoyaltyCallback.BACK.value),
+        )
     )
-    builder.button(text="Back", callback_data=AdminLoyaltyCallback.BACK.value)
-    builder.adjust(1)
-    return builder.as_markup()
 
 
 def coupon_dashboard_keyboard(coupons: Sequence["Coupon"]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Create coupon", callback_data=AdminCouponCallback.CREATE.value)
+    buttons = [button("Create coupon", AdminCouponCallback.CREATE.value)]
     for coupon in coupons:
-        status = coupon.status.value.replace("_", " ").title()
-        builder.button(
-            text=f"{coupon.code} ({status})",
-            callback_data=f"{ADMIN_COUPON_VIEW_PREFIX}{coupon.id}",
+        buttons.append(
+            button(
+                f"{coupon.code} ({status_label(coupon.status)})",
+                f"{ADMIN_COUPON_VIEW_PREFIX}{coupon.id}",
+            )
         )
-    builder.button(text="Refresh list", callback_data=AdminCouponCallback.REFRESH.value)
-    builder.button(text="Back", callback_data=AdminMenuCallback.BACK_TO_MAIN.value)
-    builder.adjust(1)
-    return builder.as_markup()
+    buttons.append(button("Refresh list", AdminCouponCallback.REFRESH.value))
+    buttons.append(_BACK_TO_MAIN_BUTTON)
+    return column(buttons)
 
 
 def coupon_details_keyboard(coupon: "Coupon") -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    toggle_text = "Deactivate" if coupon.status == CouponStatus.ACTIVE else "Activate"
-    builder.button(
-        text=toggle_text,
-        callback_data=f"{ADMIN_COUPON_TOGGLE_PREFIX}{coupon.id}",
-    )
-    builder.button(
-        text=f"Auto-apply: {'ON' if getattr(coupon, 'auto_apply', False) else 'OFF'}",
-        callback_data=f"{ADMIN_COUPON_TOGGLE_AUTO_PREFIX}{coupon.id}",
-    )
-    builder.button(
-        text="Edit fields",
-        callback_data=f"{ADMIN_COUPON_EDIT_MENU_PREFIX}{coupon.id}",
-    )
-    builder.button(
-        text="Usage stats",
-        callback_data=f"{ADMIN_COUPON_USAGE_PREFIX}{coupon.id}",
-    )
-    builder.button(
-        text="Delete coupon",
-        callback_data=f"{ADMIN_COUPON_DELETE_PREFIX}{coupon.id}",
+    coupon_id = coupon.id
+    return column(
+        (
+            button(
+                "Deactivate" if coupon.status == CouponStatus.ACTIVE else "Activate",
+                f"{ADMIN_COUPON_TOGGLE_PREFIX}{coupon_id}",
+            ),
+            button(
+                _TOGGLE_LABELS["auto_apply"][coupon.auto_apply],
+                f"{ADMIN_COUPON_TOGGLE_AUTO_PREFIX}{coupon_id}",
+            ),
+            button("Edit fields", f"{ADMIN_COUPON_EDIT_MENU_PREFIX}{coupon_id}"),
+            button("Usage stats", f"{ADMIN_COUPON_USAGE_PREFIX}{coupon_id}"),
+            button("Delete coupon", f"{ADMIN_COUPON_DELETE_PREFIX}{coupon_id}"),
+            button("Back", AdminCouponCallback.REFRESH.value),
+        )
     )
-    builder.button(text="Back", callback_data=AdminCouponCallback.REFRESH.value)
-    builder.adjust(1)
-    return builder.as_markup()
 
 
 def coupon_edit_keyboard(coupon: "Coupon") -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Change name",
-        callback_data=f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}name:{coupon.id}",
-    )
-    builder.button(
-        text="Change description",
-        callback_data=f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}description:{coupon.id}",
-    )
-    builder.button(
-        text="Change type",
-        callback_data=f"{ADMIN_COUPON_EDIT_TYPE_PREFIX}{coupon.id}",
-    )
-    builder.button(
-        text="Change value",
-        callback_data=f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}value:{coupon.id}",
-    )
-    builder.button(
-        text="Set minimum order",
-        callback_data=f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}min_total:{coupon.id}",
-    )
-    builder.button(
-        text="Set max discount",
-        callback_data=f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}max_discount:{coupon.id}",
-    )
-    builder.button(
-        text="Set total limit",
-        callback_data=f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}max_redemptions:{coupon.id}",
-    )
-    builder.button(
-        text="Set per-user limit",
-        callback_data=f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}per_user_limit:{coupon.id}",
-    )
-    builder.button(
-        text="Set start date",
-        callback_data=f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}start_at:{coupon.id}",
-    )
-    builder.button(
-        text="Set end date",
-        callback_data=f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}end_at:{coupon.id}",
-    )
-    builder.button(
-        text="Back to coupon",
-        callback_data=f"{ADMIN_COUPON_VIEW_PREFIX}{coupon.id}",
+    coupon_id = coupon.id
+    return column(
+        (
+            button("Change name", f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}name:{coupon_id}"),
+            button("Change description", f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}description:{coupon_id}"),
+            button("Change type", f"{ADMIN_COUPON_EDIT_TYPE_PREFIX}{coupon_id}"),
+            button("Change value", f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}value:{coupon_id}"),
+            button("Set minimum order", f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}min_total:{coupon_id}"),
+            button("Set max discount", f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}max_discount:{coupon_id}"),
+            button("Set total limit", f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}max_redemptions:{coupon_id}"),
+            button("Set per-user limit", f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}per_user_limit:{coupon_id}"),
+            button("Set start date", f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}start_at:{coupon_id}"),
+            button("Set end date", f"{ADMIN_COUPON_EDIT_FIELD_PREFIX}end_at:{coupon_id}"),
+            button("Back to coupon", f"{ADMIN_COUPON_VIEW_PREFIX}{coupon_id}"),
+        )
     )
-    builder.adjust(1)
-    return builder.as_markup()
 
 
 def coupon_usage_keyboard(coupon_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Refresh usage",
-        callback_data=f"{ADMIN_COUPON_USAGE_PREFIX}{coupon_id}",
-    )
-    builder.button(
-        text="Back to coupon",
-        callback_data=f"{ADMIN_COUPON_VIEW_PREFIX}{coupon_id}",
+    return column(
+        (
+            button("Refresh usage", f"{ADMIN_COUPON_USAGE_PREFIX}{coupon_id}"),
+            button("Back to coupon", f"{ADMIN_COUPON_VIEW_PREFIX}{coupon_id}"),
+        )
     )
-    builder.adjust(1)
-    return builder.as_markup()
 
 
 def coupon_delete_confirm_keyboard(coupon_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Yes, delete",
-        callback_data=f"{ADMIN_COUPON_DELETE_CONFIRM_PREFIX}{coupon_id}",
-    )
-    builder.button(
-        text="Back to coupon",
-        callback_data=f"{ADMIN_COUPON_VIEW_PREFIX}{coupon_id}",
+    return column(
+        (
+            button("Yes, delete", f"{ADMIN_COUPON_DELETE_CONFIRM_PREFIX}{coupon_id}"),
+            button("Back to coupon", f"{ADMIN_COUPON_VIEW_PREFIX}{coupon_id}"),
+        )
     )
-    builder.adjust(1)
-    return builder.as_markup()
 
 
 def recent_orders_keyboard(
@@ -404,76 +378,30 @@ def recent_orders_keyboard(
     has_prev: bool,
     has_next: bool,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for order in orders:
-        status = order.status.value.replace("_", " ").title()
-        amount = f"{order.total_amount} {order.currency}"
-        builder.button(
-            text=f"{status} • {amount}",
-            callback_data=f"{ADMIN_ORDER_VIEW_PREFIX}{order.public_id}",
-        )
-    nav_buttons: list[InlineKeyboardButton] = []
-    if has_prev:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="◀️ Prev",
-                callback_data=f"{ADMIN_RECENT_ORDERS_PAGE_PREFIX}{page - 1}",
-            )
-        )
-    nav_buttons.append(
-        InlineKeyboardButton(
-            text="Refresh",
-            callback_data=f"{ADMIN_RECENT_ORDERS_PAGE_PREFIX}{page}",
-        )
-    )
-    if has_next:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="▶️ Next",
-                callback_data=f"{ADMIN_RECENT_ORDERS_PAGE_PREFIX}{page + 1}",
+    view_prefix = ADMIN_ORDER_VIEW_PREFIX
+    rows = [
+        [
+            button(
+                f"{status_label(order.status)} • {order.total_amount} {order.currency}",
+                view_prefix + order.public_id,
             )
-        )
-    builder.row(*nav_buttons)
-    builder.button(text="Back", callback_data=AdminOrderCallback.BACK.value)
-    builder.adjust(1)
-    return builder.as_markup()
+        ]
+        for order in orders
+    ]
+    rows.append(list(pager_row(ADMIN_RECENT_ORDERS_PAGE_PREFIX, page, has_prev, has_next)))
+    rows.append([_ORDERS_BACK_BUTTON])
+    return rows_markup(rows)
 
 
 def order_manage_keyboard(order: "Order") -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Update timeline",
-        callback_data=f"{ADMIN_ORDER_TIMELINE_MENU_PREFIX}{order.public_id}",
-    )
-    if order.status == OrderStatus.PAID and not _fulfillment_recorded(order):
-        builder.button(
-            text="Mark fulfilled",
-            callback_data=f"{ADMIN_ORDER_MARK_FULFILLED_PREFIX}{order.public_id}",
-        )
+    public_id = order.public_id
+    buttons = [button("Update timeline", f"{ADMIN_ORDER_TIMELINE_MENU_PREFIX}{public_id}")]
     if order.status == OrderStatus.PAID:
-        builder.button(
-            text="Send receipt",
-            callback_data=f"{ADMIN_ORDER_RECEIPT_PREFIX}{order.public_id}",
-        )
-    builder.button(text="Back to orders", callback_data=AdminOrderCallback.VIEW_RECENT.value)
-    builder.adjust(1)
-    return builder.as_markup()
-
-
-def _oxapay_meta(order: "Order") -> dict:
-    extra = order.extra_attrs or {}
-    meta = extra.get(OXAPAY_EXTRA_KEY)
-    return meta if isinstance(meta, dict) else {}
-
-
-def _fulfillment_recorded(order: "Order") -> bool:
-    fulfillment = _oxapay_meta(order).get("fulfillment")
-    return isinstance(fulfillment, dict) and bool(fulfillment.get("delivered_at"))
-
-
-def _delivery_notice_sent(order: "Order") -> bool:
-    delivery = _oxapay_meta(order).get("delivery_notice")
-    return isinstance(delivery, dict) and bool(delivery.get("sent_at"))
+        if not order.is_fulfilled:
+            buttons.append(button("Mark fulfilled", f"{ADMIN_ORDER_MARK_FULFILLED_PREFIX}{public_id}"))
+        buttons.append(button("Send receipt", f"{ADMIN_ORDER_RECEIPT_PREFIX}{public_id}"))
+    buttons.append(_BACK_TO_RECENT_ORDERS_BUTTON)
+    return column(buttons)
 
 
 def order_timeline_menu_keyboard(
@@ -482,67 +410,39 @@ def order_timeline_menu_keyboard(
     timeline: Sequence["OrderTimeline"] | None = None,
     statuses: Sequence[TimelineStatusDefinition] | None = None,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
     public_id = order.public_id
     options = list(statuses or TimelineStatusRegistry.show_in_menu())
-    requires_paid = {"processing", "shipping", "delivered"}
-    paid_like_statuses = {OrderStatus.PAID, OrderStatus.CANCELLED, OrderStatus.EXPIRED}
+    buttons: list[InlineKeyboardButton] = []
     if options:
         for status in options:
-            if order.status not in paid_like_statuses and status.key in requires_paid:
+            if order.status not in _PAID_LIKE_STATUSES and status.key in _PAID_ONLY_TIMELINE_KEYS:
                 continue
-            builder.button(
-                text=status.label,
-                callback_data=f"{ADMIN_ORDER_TIMELINE_STATUS_PREFIX}{status.key}:{public_id}",
+            buttons.append(
+                button(status.label, f"{ADMIN_ORDER_TIMELINE_STATUS_PREFIX}{status.key}:{public_id}")
             )
     else:
-        builder.button(
-            text="Configure statuses",
-            callback_data=AdminOrderCallback.TIMELINE_STATUSES.value,
-        )
-    builder.button(
-        text="Add note",
-        callback_data=f"{ADMIN_ORDER_TIMELINE_NOTE_PREFIX}{public_id}",
-    )
-    if order.status in {OrderStatus.AWAITING_PAYMENT, OrderStatus.CANCELLED, OrderStatus.EXPIRED}:
-        builder.button(
-            text="Mark as paid",
-            callback_data=f"{ADMIN_ORDER_MARK_PAID_PREFIX}{public_id}",
-        )
-    if order.status == OrderStatus.PAID and not _delivery_notice_sent(order):
-        builder.button(
-            text="Notify delivered",
-            callback_data=f"{ADMIN_ORDER_NOTIFY_DELIVERED_PREFIX}{public_id}",
-        )
-    builder.button(
-        text="Back",
-        callback_data=f"{ADMIN_ORDER_VIEW_PREFIX}{public_id}",
-    )
-    builder.adjust(1)
-    return builder.as_markup()
+        buttons.append(button("Configure statuses", AdminOrderCallback.TIMELINE_STATUSES.value))
+    buttons.append(button("Add note", f"{ADMIN_ORDER_TIMELINE_NOTE_PREFIX}{public_id}"))
+    if order.status in _MARKABLE_PAID_STATUSES:
+        buttons.append(button("Mark as paid", f"{ADMIN_ORDER_MARK_PAID_PREFIX}{public_id}"))
+    if order.status == OrderStatus.PAID:
+        if not order.is_delivered:
+            buttons.append(button("Notify delivered", f"{ADMIN_ORDER_NOTIFY_DELIVERED_PREFIX}{public_id}"))
+    buttons.append(button("Back", f"{ADMIN_ORDER_VIEW_PREFIX}{public_id}"))
+    return column(buttons)
 
 
 def order_timeline_filters_keyboard(
     statuses: Sequence[TimelineStatusDefinition] | None = None,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
     options = list(statuses or TimelineStatusRegistry.show_in_filters())
+    buttons: list[InlineKeyboardButton] = []
     if not options:
-        builder.button(
-            text="Configure timeline statuses",
-            callback_data=AdminOrderCallback.TIMELINE_STATUSES.value,
-        )
+        buttons.append(button("Configure timeline statuses", AdminOrderCallback.TIMELINE_STATUSES.value))
     for status in options:
-        builder.button(
-            text=status.label,
-            callback_data=f"{ADMIN_ORDER_TIMELINE_FILTER_PREFIX}{status.key}",
-        )
-    builder.button(
-        text="Back to orders",
-        callback_data=AdminMenuCallback.MANAGE_ORDERS.value,
-    )
-    builder.adjust(1)
-    return builder.as_markup()
+        buttons.append(button(status.label, f"{ADMIN_ORDER_TIMELINE_FILTER_PREFIX}{status.key}"))
+    buttons.append(_BACK_TO_ORDERS_BUTTON)
+    return column(buttons)
 
 
 def order_timeline_filtered_orders_keyboard(
@@ -551,122 +451,84 @@ def order_timeline_filtered_orders_keyboard(
     status_key: str,
     status_label: str,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
+    view_prefix = ADMIN_ORDER_VIEW_PREFIX
+    buttons: list[InlineKeyboardButton] = []
     for order in orders:
         product_name = getattr(order.product, "name", "") or "Order"
-        trimmed = product_name[:32]
-        amount = f"{order.total_amount} {order.currency}"
-        builder.button(
-            text=f"{trimmed} · {amount}",
-            callback_data=f"{ADMIN_ORDER_VIEW_PREFIX}{order.public_id}",
+        buttons.append(
+            button(
+                f"{product_name[:32]} · {order.total_amount} {order.currency}",
+                view_prefix + order.public_id,
+            )
         )
-    builder.button(
-        text=f"Refresh {status_label}",
-        callback_data=f"{ADMIN_ORDER_TIMELINE_FILTER_PREFIX}{status_key}",
-    )
-    builder.button(
-        text="Back to filters",
-        callback_data=AdminOrderCallback.TIMELINE_FILTERS.value,
-    )
-    builder.button(
-        text="Back to orders",
-        callback_data=AdminMenuCallback.MANAGE_ORDERS.value,
-    )
-    builder.adjust(1)
-    return builder.as_markup()
+    buttons.append(button(f"Refresh {status_label}", f"{ADMIN_ORDER_TIMELINE_FILTER_PREFIX}{status_key}"))
+    buttons.append(_BACK_TO_FILTERS_BUTTON)
+    buttons.append(_BACK_TO_ORDERS_BUTTON)
+    return column(buttons)
 
 
 def timeline_statuses_keyboard(
     statuses: Sequence[TimelineStatusDefinition],
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
+    buttons: list[InlineKeyboardButton] = []
     if statuses:
         for status in statuses:
             suffix = " *notify" if status.notify_user else ""
-            builder.button(
-                text=f"{status.label} ({status.key}){suffix}",
-                callback_data=f"{ADMIN_TIMELINE_CFG_EDIT_PREFIX}{status.key}",
+            buttons.append(
+                button(
+                    f"{status.label} ({status.key}){suffix}",
+                    f"{ADMIN_TIMELINE_CFG_EDIT_PREFIX}{status.key}",
+                )
             )
     else:
-        builder.button(
-            text="No statuses configured",
-            callback_data=AdminOrderCallback.TIMELINE_STATUSES.value,
-        )
-    builder.button(text="Add status", callback_data=ADMIN_TIMELINE_CFG_ADD)
-    builder.button(text="Reset to defaults", callback_data=ADMIN_TIMELINE_CFG_RESET)
-    builder.button(text="Back", callback_data=AdminOrderCallback.BACK.value)
-    builder.adjust(1)
-    return builder.as_markup()
+        buttons.append(button("No statuses configured", AdminOrderCallback.TIMELINE_STATUSES.value))
+    buttons.append(button("Add status", ADMIN_TIMELINE_CFG_ADD))
+    buttons.append(button("Reset to defaults", ADMIN_TIMELINE_CFG_RESET))
+    buttons.append(_ORDERS_BACK_BUTTON)
+    return column(buttons)
 
 
 def timeline_status_detail_keyboard(status: TimelineStatusDefinition) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text=f"Notify user: {'ON' if status.notify_user else 'OFF'}",
-        callback_data=f"{ADMIN_TIMELINE_CFG_TOGGLE_NOTIFY_PREFIX}{status.key}",
-    )
-    builder.button(
-        text=f"In timeline menu: {'YES' if status.show_in_menu else 'NO'}",
-        callback_data=f"{ADMIN_TIMELINE_CFG_TOGGLE_MENU_PREFIX}{status.key}",
-    )
-    builder.button(
-        text=f"Show in filters: {'YES' if status.show_in_filters else 'NO'}",
-        callback_data=f"{ADMIN_TIMELINE_CFG_TOGGLE_FILTER_PREFIX}{status.key}",
-    )
-    builder.button(
-        text="Rename label",
-        callback_data=f"{ADMIN_TIMELINE_CFG_LABEL_PREFIX}{status.key}",
-    )
-    builder.button(
-        text="Edit user message",
-        callback_data=f"{ADMIN_TIMELINE_CFG_MESSAGE_PREFIX}{status.key}",
-    )
+    key = status.key
+    buttons = [
+        button(
+            f"Notify user: {'ON' if status.notify_user else 'OFF'}",
+            f"{ADMIN_TIMELINE_CFG_TOGGLE_NOTIFY_PREFIX}{key}",
+        ),
+        button(
+            f"In timeline menu: {'YES' if status.show_in_menu else 'NO'}",
+            f"{ADMIN_TIMELINE_CFG_TOGGLE_MENU_PREFIX}{key}",
+        ),
+        button(
+            f"Show in filters: {'YES' if status.show_in_filters else 'NO'}",
+            f"{ADMIN_TIMELINE_CFG_TOGGLE_FILTER_PREFIX}{key}",
+        ),
+        button("Rename label", f"{ADMIN_TIMELINE_CFG_LABEL_PREFIX}{key}"),
+        button("Edit user message", f"{ADMIN_TIMELINE_CFG_MESSAGE_PREFIX}{key}"),
+    ]
     if not status.locked:
-        builder.button(
-            text="Delete status",
-            callback_data=f"{ADMIN_TIMELINE_CFG_DELETE_PREFIX}{status.key}",
-        )
-    builder.button(
-        text="Back to list",
-        callback_data=AdminOrderCallback.TIMELINE_STATUSES.value,
-    )
-    builder.adjust(1)
-    return builder.as_markup()
+        buttons.append(button("Delete status", f"{ADMIN_TIMELINE_CFG_DELETE_PREFIX}{key}"))
+    buttons.append(button("Back to list", AdminOrderCallback.TIMELINE_STATUSES.value))
+    return column(buttons)
 
 
 def fulfillment_tasks_keyboard(tasks: Sequence["OrderFulfillmentTask"]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
+    buttons: list[InlineKeyboardButton] = []
     for task in tasks:
-        order = task.order
-        public_id = getattr(order, "public_id", "?")
-        builder.button(
-            text=f"Retry {public_id}",
-            callback_data=f"{ADMIN_FULFILLMENT_RETRY_PREFIX}{task.id}",
-        )
-        builder.button(
-            text=f"Dismiss {public_id}",
-            callback_data=f"{ADMIN_FULFILLMENT_DISMISS_PREFIX}{task.id}",
-        )
-    builder.button(text="Back", callback_data=AdminOrderCallback.BACK.value)
-    builder.adjust(1)
-    return builder.as_markup()
+        public_id = getattr(task.order, "public_id", "?")
+        buttons.append(button(f"Retry {public_id}", f"{ADMIN_FULFILLMENT_RETRY_PREFIX}{task.id}"))
+        buttons.append(button(f"Dismiss {public_id}", f"{ADMIN_FULFILLMENT_DISMISS_PREFIX}{task.id}"))
+    buttons.append(_ORDERS_BACK_BUTTON)
+    return column(buttons)
 
 
 def order_search_results_keyboard(orders: Sequence["Order"], *, query: str) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
+    view_prefix = ADMIN_ORDER_VIEW_PREFIX
+    buttons: list[InlineKeyboardButton] = []
     for order in orders:
+        public_id = order.public_id
         label = getattr(order.product, "name", "") or "Order"
-        builder.button(
-            text=f"{label[:32]} ({order.public_id})",
-            callback_data=f"{ADMIN_ORDER_VIEW_PREFIX}{order.public_id}",
-        )
-    builder.button(
-        text="New search",
-        callback_data=AdminOrderCallback.SEARCH.value,
-    )
-    builder.button(
-        text="Back to orders",
-        callback_data=AdminMenuCallback.MANAGE_ORDERS.value,
-    )
-    builder.adjust(1)
-    return builder.as_markup()
+        buttons.append(button(f"{label[:32]} ({public_id})", view_prefix + public_id))
+    buttons.append(button("New search", AdminOrderCallback.SEARCH.value))
+    buttons.append(_BACK_TO_ORDERS_BUTTON)
+    return column(buttons)
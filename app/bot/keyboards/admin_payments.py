@@ -3,11 +3,13 @@ from __future__ import annotations
 from enum import StrEnum
 from typing import Sequence
 
-from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
+from aiogram.types import InlineKeyboardMarkup
 
+from app.bot.keyboards._labels import status_label
+from app.bot.keyboards._markup import button, column, rows_markup
+from app.bot.keyboards._pager import pager_row
 from app.bot.keyboards.admin import AdminMenuCallback, ADMIN_ORDER_VIEW_PREFIX
-from app.infrastructure.db.models import Order
+from app.services.order_view import OrderView
 
 
 class AdminPaymentsCallback(StrEnum):
@@ -22,20 +24,24 @@ ADMIN_PAYMENTS_PENDING_PAGE_PREFIX = "admin:pay:pend:"
 ADMIN_PAYMENTS_RECENT_PAGE_PREFIX = "admin:pay:rec:"
 
 
+_PAYMENTS_DASHBOARD = column(
+    (
+        button("Refresh", AdminPaymentsCallback.REFRESH),
+        button("Search order", AdminPaymentsCallback.SEARCH_ORDER),
+        button("Pending invoices", AdminPaymentsCallback.VIEW_PENDING),
+        button("Recent paid orders", AdminPaymentsCallback.VIEW_RECENT_PAID),
+        button("Sync pending now", AdminPaymentsCallback.SYNC_PENDING),
+        button("Back", AdminMenuCallback.BACK_TO_MAIN),
+    )
+)
+
+
 def payments_dashboard_keyboard() -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Refresh", callback_data=AdminPaymentsCallback.REFRESH.value)
-    builder.button(text="Search order", callback_data=AdminPaymentsCallback.SEARCH_ORDER.value)
-    builder.button(text="Pending invoices", callback_data=AdminPaymentsCallback.VIEW_PENDING.value)
-    builder.button(text="Recent paid orders", callback_data=AdminPaymentsCallback.VIEW_RECENT_PAID.value)
-    builder.button(text="Sync pending now", callback_data=AdminPaymentsCallback.SYNC_PENDING.value)
-    builder.button(text="Back", callback_data=AdminMenuCallback.BACK_TO_MAIN.value)
-    builder.adjust(1)
-    return builder.as_markup()
+    return _PAYMENTS_DASHBOARD
 
 
 def payments_orders_keyboard(
-    orders: Sequence[Order],
+    orders: Sequence[OrderView],
     *,
     page: int,
     has_prev: bool,
@@ -43,42 +49,17 @@ def payments_orders_keyboard(
     source_prefix: str,
     back_callback: str,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for order in orders:
-        status = order.status.value.replace("_", " ").title()
-        amount = f"{order.total_amount} {order.currency}"
-        product_name = getattr(order.product, "name", "-")
-        if order.user is not None:
-            user_display = order.user.display_name()
-        else:
-            user_display = f"id={order.user_id}"
-        text = f"{status} • {amount} • {product_name[:18]} • {user_display}"
-        builder.button(
-            text=text,
-            callback_data=f"{ADMIN_ORDER_VIEW_PREFIX}{order.public_id}",
-        )
-    nav_buttons: list[InlineKeyboardButton] = []
-    if has_prev:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="◀️ Prev",
-                callback_data=f"{source_prefix}{page - 1}",
-            )
-        )
-    nav_buttons.append(
-        InlineKeyboardButton(
-            text="Refresh",
-            callback_data=f"{source_prefix}{page}",
-        )
-    )
-    if has_next:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="▶️ Next",
-                callback_data=f"{source_prefix}{page + 1}",
+    view_prefix = ADMIN_ORDER_VIEW_PREFIX
+    rows = [
+        [
+            button(
+                f"{status_label(order.status)} • {order.amount} • "
+                f"{order.product_name[:18]} • {order.user_display}",
+                view_prefix + order.public_id,
             )
-        )
-    builder.row(*nav_buttons)
-    builder.button(text="Back", callback_data=back_callback)
-    builder.adjust(1)
-    return builder.as_markup()
+        ]
+        for order in orders
+    ]
+    rows.append(list(pager_row(source_prefix, page, has_prev, has_next)))
+    rows.append([button("Back", back_callback)])
+    return rows_markup(rows)
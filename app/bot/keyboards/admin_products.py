@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable, Sequence
 
-from aiogram.types import InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from app.bot.callbacks.admin_products import ProductAdminCallback
+from app.bot.keyboards._markup import button, column, grid, rows_markup
 from app.core.enums import ProductQuestionType
 from app.infrastructure.db.models import (
     Category,
@@ -15,382 +16,313 @@ from app.infrastructure.db.models import (
     ProductRelation,
 )
 
+_SEP = ProductAdminCallback.__separator__
+
+
+def _action_prefix(action: str) -> str:
+    # "prodadm:<action>:" - product_id, question_id, target_id and value follow in that order.
+    packed = ProductAdminCallback(action=action).pack()
+    return packed.removesuffix(_SEP * (len(ProductAdminCallback.model_fields) - 1)) + _SEP
+
+
+_ADD_CALLBACK = ProductAdminCallback(action="add").pack()
+_CATEGORIES_CALLBACK = ProductAdminCallback(action="categories").pack()
+_BACK_TO_ADMIN_CALLBACK = ProductAdminCallback(action="back_to_admin").pack()
+_BACK_TO_LIST_CALLBACK = ProductAdminCallback(action="back_to_list").pack()
+_CATEGORY_ADD_CALLBACK = ProductAdminCallback(action="category_add").pack()
+_CATEGORY_CREATE_CONFIRM_CALLBACK = ProductAdminCallback(action="category_create_confirm").pack()
+_CATEGORY_CREATE_CANCEL_CALLBACK = ProductAdminCallback(action="category_create_cancel").pack()
+_CREATE_CONFIRM_CALLBACK = ProductAdminCallback(action="create_confirm").pack()
+_CREATE_CANCEL_CALLBACK = ProductAdminCallback(action="create_cancel").pack()
+
+_VIEW_PREFIX = _action_prefix("view")
+_TOGGLE_PREFIX = _action_prefix("toggle")
+_EDIT_MENU_PREFIX = _action_prefix("edit_menu")
+_EDIT_FIELD_PREFIX = _action_prefix("edit_field")
+_QUESTIONS_PREFIX = _action_prefix("questions")
+_RELATIONS_PREFIX = _action_prefix("relations")
+_BUNDLE_PREFIX = _action_prefix("bundle")
+_DELETE_PREFIX = _action_prefix("delete")
+_DELETE_CONFIRM_PREFIX = _action_prefix("delete_confirm")
+_CATEGORY_VIEW_PREFIX = _action_prefix("category_view")
+_CATEGORY_REMOVE_PRODUCT_PREFIX = _action_prefix("category_remove_product")
+_CATEGORY_ADD_PRODUCT_PREFIX = _action_prefix("category_add_product")
+_CATEGORY_TOGGLE_PREFIX = _action_prefix("category_toggle")
+_CATEGORY_EDIT_MENU_PREFIX = _action_prefix("category_edit_menu")
+_CATEGORY_EDIT_FIELD_PREFIX = _action_prefix("category_edit_field")
+_CATEGORY_DELETE_PREFIX = _action_prefix("category_delete")
+_CATEGORY_DELETE_CONFIRM_PREFIX = _action_prefix("category_delete_confirm")
+_BUNDLE_ADD_PREFIX = _action_prefix("bundle_add")
+_BUNDLE_REMOVE_PREFIX = _action_prefix("bundle_remove")
+_RELATION_ADD_PREFIX = _action_prefix("relation_add")
+_RELATION_REMOVE_PREFIX = _action_prefix("relation_remove")
+_QUESTION_ADD_PREFIX = _action_prefix("question_add")
+_QUESTION_DELETE_PREFIX = _action_prefix("question_delete")
+_QUESTION_DELETE_CONFIRM_PREFIX = _action_prefix("question_delete_confirm")
+_QUESTION_TYPE_SET_PREFIX = _action_prefix("question_type_set")
+_QUESTION_REQUIRED_SET_PREFIX = _action_prefix("question_required_set")
+_QUESTION_CREATE_CONFIRM_PREFIX = _action_prefix("question_create_confirm")
+_QUESTION_CREATE_CANCEL_PREFIX = _action_prefix("question_create_cancel")
+
+_STATUS_ICON = {True: "[ON] ", False: "[OFF] "}
+_TOGGLE_LABEL = {True: "Deactivate product", False: "Activate product"}
+
+_BACK_TO_ADMIN_BUTTON = button("Back", _BACK_TO_ADMIN_CALLBACK)
+_BACK_TO_LIST_BUTTON = button("Back to list", _BACK_TO_LIST_CALLBACK)
+_BACK_TO_PRODUCTS_BUTTON = button("Back to products", _BACK_TO_LIST_CALLBACK)
+_BACK_TO_CATEGORIES_BUTTON = button("Back to categories", _CATEGORIES_CALLBACK)
 
-def products_overview_keyboard(products: Sequence[Product]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
 
-    for product in products:
-        status = "[ON]" if product.is_active else "[OFF]"
-        builder.button(
-            text=f"{status} {product.name}",
-            callback_data=ProductAdminCallback(action="view", product_id=product.id).pack(),
+def products_overview_keyboard(products: Sequence[Product]) -> InlineKeyboardMarkup:
+    view_prefix = _VIEW_PREFIX
+    icons = _STATUS_ICON
+    buttons = [
+        button(icons[product.is_active] + product.name, f"{view_prefix}{product.id}:::")
+        for product in products
+    ]
+    buttons.extend(
+        (
+            button("Add product", _ADD_CALLBACK),
+            button("Manage categories", _CATEGORIES_CALLBACK),
+            _BACK_TO_ADMIN_BUTTON,
         )
-
-    builder.button(
-        text="Add product",
-        callback_data=ProductAdminCallback(action="add").pack(),
-    )
-    builder.button(
-        text="Manage categories",
-        callback_data=ProductAdminCallback(action="categories").pack(),
     )
-    builder.button(
-        text="Back",
-        callback_data=ProductAdminCallback(action="back_to_admin").pack(),
-    )
-    builder.adjust(1)
-    return builder.as_markup()
+    return column(buttons)
 
 
 def product_detail_keyboard(product: Product) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-
-    toggle_action = "Deactivate" if product.is_active else "Activate"
-    builder.button(
-        text=f"{toggle_action} product",
-        callback_data=ProductAdminCallback(action="toggle", product_id=product.id).pack(),
-    )
-    builder.button(
-        text="Edit details",
-        callback_data=ProductAdminCallback(action="edit_menu", product_id=product.id).pack(),
-    )
-    builder.button(
-        text="Manage form",
-        callback_data=ProductAdminCallback(action="questions", product_id=product.id).pack(),
-    )
-    builder.button(
-        text="Related products",
-        callback_data=ProductAdminCallback(action="relations", product_id=product.id).pack(),
-    )
-    builder.button(
-        text="Bundle components",
-        callback_data=ProductAdminCallback(action="bundle", product_id=product.id).pack(),
-    )
-    builder.button(
-        text="Delete",
-        callback_data=ProductAdminCallback(action="delete", product_id=product.id).pack(),
-    )
-    builder.button(
-        text="Back to list",
-        callback_data=ProductAdminCallback(action="back_to_list").pack(),
+    return _product_detail_markup(product.id, bool(product.is_active))
+
+
+@lru_cache(maxsize=2048)
+def _product_detail_markup(product_id: int, is_active: bool) -> InlineKeyboardMarkup:
+    return column(
+        (
+            button(_TOGGLE_LABEL[is_active], f"{_TOGGLE_PREFIX}{product_id}:::"),
+            button("Edit details", f"{_EDIT_MENU_PREFIX}{product_id}:::"),
+            button("Manage form", f"{_QUESTIONS_PREFIX}{product_id}:::"),
+            button("Related products", f"{_RELATIONS_PREFIX}{product_id}:::"),
+            button("Bundle components", f"{_BUNDLE_PREFIX}{product_id}:::"),
+            button("Delete", f"{_DELETE_PREFIX}{product_id}:::"),
+            _BACK_TO_LIST_BUTTON,
+        )
     )
-    builder.adjust(1)
-    return builder.as_markup()
 
 
+@lru_cache(maxsize=1024)
 def product_delete_confirm_keyboard(product_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Confirm delete",
-        callback_data=ProductAdminCallback(action="delete_confirm", product_id=product_id).pack(),
-    )
-    builder.button(
-        text="Cancel",
-        callback_data=ProductAdminCallback(action="view", product_id=product_id).pack(),
+    return column(
+        (
+            button("Confirm delete", f"{_DELETE_CONFIRM_PREFIX}{product_id}:::"),
+            button("Cancel", f"{_VIEW_PREFIX}{product_id}:::"),
+        )
     )
-    builder.adjust(1)
-    return builder.as_markup()
 
 
+_PRODUCT_EDIT_FIELDS = (
+    ("Name", "name"),
+    ("Summary", "summary"),
+    ("Description", "description"),
+    ("Price", "price"),
+    ("Currency", "currency"),
+    ("Inventory", "inventory"),
+    ("Max per order", "max_per_order"),
+    ("Inventory threshold", "inventory_threshold"),
+    ("Position", "position"),
+    ("Delivery message", "delivery_note"),
+    ("Fulfillment plan (JSON)", "fulfillment_plan"),
+)
+
+
+@lru_cache(maxsize=1024)
 def product_edit_fields_keyboard(product_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    fields = [
-        ("Name", "name"),
-        ("Summary", "summary"),
-        ("Description", "description"),
-        ("Price", "price"),
-        ("Currency", "currency"),
-        ("Inventory", "inventory"),
-        ("Max per order", "max_per_order"),
-        ("Inventory threshold", "inventory_threshold"),
-        ("Position", "position"),
-        ("Delivery message", "delivery_note"),
-        ("Fulfillment plan (JSON)", "fulfillment_plan"),
-    ]
-    for label, field in fields:
-        builder.button(
-            text=label,
-            callback_data=ProductAdminCallback(
-                action="edit_field", product_id=product_id, value=field
-            ).pack(),
-        )
-    builder.button(
-        text="Back",
-        callback_data=ProductAdminCallback(action="view", product_id=product_id).pack(),
-    )
-    builder.adjust(2)
-    return builder.as_markup()
+    prefix = f"{_EDIT_FIELD_PREFIX}{product_id}:::"
+    buttons = [button(label, f"{prefix}{field}") for label, field in _PRODUCT_EDIT_FIELDS]
+    buttons.append(button("Back", f"{_VIEW_PREFIX}{product_id}:::"))
+    return grid(buttons, 2)
 
 
 def categories_overview_keyboard(categories: Sequence[Category]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for category in categories:
-        status = "[ON]" if category.is_active else "[OFF]"
-        builder.button(
-            text=f"{status} {category.name}",
-            callback_data=ProductAdminCallback(action="category_view", target_id=category.id).pack(),
-        )
-    builder.button(
-        text="Add category",
-        callback_data=ProductAdminCallback(action="category_add").pack(),
-    )
-    builder.button(
-        text="Back to products",
-        callback_data=ProductAdminCallback(action="back_to_list").pack(),
-    )
-    builder.adjust(1)
-    return builder.as_markup()
+    view_prefix = _CATEGORY_VIEW_PREFIX
+    icons = _STATUS_ICON
+    buttons = [
+        button(icons[category.is_active] + category.name, f"{view_prefix}::{category.id}:")
+        for category in categories
+    ]
+    buttons.extend((button("Add category", _CATEGORY_ADD_CALLBACK), _BACK_TO_PRODUCTS_BUTTON))
+    return column(buttons)
 
 
 def category_detail_keyboard(category: Category) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for link in category.product_links or []:
-        product = link.product
-        name = product.name if product else f"Product #{link.product_id}"
-        builder.button(
-            text=f"Remove: {name[:32]}",
-            callback_data=ProductAdminCallback(
-                action="category_remove_product",
-                target_id=category.id,
-                value=str(link.product_id),
-            ).pack(),
+    category_id = category.id
+    remove_prefix = f"{_CATEGORY_REMOVE_PRODUCT_PREFIX}::{category_id}:"
+    buttons = [
+        button(
+            f"Remove: {(link.product.name if link.product else f'Product #{link.product_id}')[:32]}",
+            f"{remove_prefix}{link.product_id}",
+        )
+        for link in category.product_links or ()
+    ]
+    buttons.extend(
+        (
+            button("Add product", f"{_CATEGORY_ADD_PRODUCT_PREFIX}::{category_id}:"),
+            button("Toggle active", f"{_CATEGORY_TOGGLE_PREFIX}::{category_id}:"),
+            button("Edit category", f"{_CATEGORY_EDIT_MENU_PREFIX}::{category_id}:"),
+            button("Delete category", f"{_CATEGORY_DELETE_PREFIX}::{category_id}:"),
+            _BACK_TO_CATEGORIES_BUTTON,
         )
-    builder.button(
-        text="Add product",
-        callback_data=ProductAdminCallback(action="category_add_product", target_id=category.id).pack(),
-    )
-    builder.button(
-        text="Toggle active",
-        callback_data=ProductAdminCallback(action="category_toggle", target_id=category.id).pack(),
-    )
-    builder.button(
-        text="Edit category",
-        callback_data=ProductAdminCallback(action="category_edit_menu", target_id=category.id).pack(),
-    )
-    builder.button(
-        text="Delete category",
-        callback_data=ProductAdminCallback(action="category_delete", target_id=category.id).pack(),
-    )
-    builder.button(
-        text="Back to categories",
-        callback_data=ProductAdminCallback(action="categories").pack(),
     )
-    builder.adjust(1)
-    return builder.as_markup()
+    return column(buttons)
+
+
+_CATEGORY_EDIT_FIELDS = (
+    ("Name", "name"),
+    ("Description", "description"),
+    ("Position", "position"),
+)
 
 
+@lru_cache(maxsize=1024)
 def category_edit_fields_keyboard(category_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    fields = [
-        ("Name", "name"),
-        ("Description", "description"),
-        ("Position", "position"),
-    ]
-    for label, field in fields:
-        builder.button(
-            text=label,
-            callback_data=ProductAdminCallback(
-                action="category_edit_field",
-                target_id=category_id,
-                value=field,
-            ).pack(),
-        )
-    builder.button(
-        text="Back",
-        callback_data=ProductAdminCallback(action="category_view", target_id=category_id).pack(),
-    )
-    builder.adjust(2)
-    return builder.as_markup()
+    prefix = f"{_CATEGORY_EDIT_FIELD_PREFIX}::{category_id}:"
+    buttons = [button(label, f"{prefix}{field}") for label, field in _CATEGORY_EDIT_FIELDS]
+    buttons.append(button("Back", f"{_CATEGORY_VIEW_PREFIX}::{category_id}:"))
+    return grid(buttons, 2)
 
 
 def bundle_components_keyboard(
     product_id: int,
     components: Iterable[ProductBundleItem],
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
+    buttons: list[InlineKeyboardButton] = []
+    remove_prefix = f"{_BUNDLE_REMOVE_PREFIX}{product_id}::"
     for item in components:
         component = item.component
         name = component.name if component else f"Product #{item.component_product_id}"
         qty = item.quantity
-        builder.button(
-            text=f"Remove: {name[:32]} (x{qty})",
-            callback_data=ProductAdminCallback(
-                action="bundle_remove",
-                product_id=product_id,
-                target_id=item.component_product_id,
-            ).pack(),
+        buttons.append(
+            button(
+                f"Remove: {name[:32]} (x{qty})",
+                f"{remove_prefix}{item.component_product_id}:",
+            )
+        )
+    buttons.extend(
+        (
+            button("Add component", f"{_BUNDLE_ADD_PREFIX}{product_id}:::"),
+            button("Back", f"{_VIEW_PREFIX}{product_id}:::"),
         )
-    builder.button(
-        text="Add component",
-        callback_data=ProductAdminCallback(action="bundle_add", product_id=product_id).pack(),
-    )
-    builder.button(
-        text="Back",
-        callback_data=ProductAdminCallback(action="view", product_id=product_id).pack(),
     )
-    builder.adjust(1)
-    return builder.as_markup()
+    return column(buttons)
 
 
 def relations_keyboard(
     product_id: int,
     relations: Iterable[ProductRelation],
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
+    buttons: list[InlineKeyboardButton] = []
+    remove_prefix = f"{_RELATION_REMOVE_PREFIX}{product_id}::"
     for relation in relations:
         related = relation.related_product
         name = related.name if related else f"Product #{relation.related_product_id}"
         label = f"{relation.relation_type.value}: {name[:28]} (w={relation.weight})"
-        builder.button(
-            text=label,
-            callback_data=ProductAdminCallback(
-                action="relation_remove",
-                product_id=product_id,
-                target_id=relation.related_product_id,
-                value=relation.relation_type.value,
-            ).pack(),
+        buttons.append(
+            button(
+                label,
+                f"{remove_prefix}{relation.related_product_id}:{relation.relation_type.value}",
+            )
+        )
+    buttons.extend(
+        (
+            button("Add relation", f"{_RELATION_ADD_PREFIX}{product_id}:::"),
+            button("Back", f"{_VIEW_PREFIX}{product_id}:::"),
         )
-    builder.button(
-        text="Add relation",
-        callback_data=ProductAdminCallback(action="relation_add", product_id=product_id).pack(),
-    )
-    builder.button(
-        text="Back",
-        callback_data=ProductAdminCallback(action="view", product_id=product_id).pack(),
     )
-    builder.adjust(1)
-    return builder.as_markup()
+    return column(buttons)
+
+
+def _two_button_markup(pairs: tuple[tuple[str, str], tuple[str, str]]) -> InlineKeyboardMarkup:
+    return rows_markup([[button(text, callback_data) for text, callback_data in pairs]])
+
+
+_CATEGORY_CREATION_CONFIRM = _two_button_markup(
+    (("Save category", _CATEGORY_CREATE_CONFIRM_CALLBACK), ("Cancel", _CATEGORY_CREATE_CANCEL_CALLBACK))
+)
 
 
 def category_creation_confirm_keyboard() -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Save category",
-        callback_data=ProductAdminCallback(action="category_create_confirm").pack(),
-    )
-    builder.button(
-        text="Cancel",
-        callback_data=ProductAdminCallback(action="category_create_cancel").pack(),
-    )
-    builder.adjust(2)
-    return builder.as_markup()
+    return _CATEGORY_CREATION_CONFIRM
 
 
 def category_delete_confirm_keyboard(category_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Confirm delete",
-        callback_data=ProductAdminCallback(action="category_delete_confirm", target_id=category_id).pack(),
-    )
-    builder.button(
-        text="Back",
-        callback_data=ProductAdminCallback(action="category_view", target_id=category_id).pack(),
+    return _two_button_markup(
+        (
+            ("Confirm delete", f"{_CATEGORY_DELETE_CONFIRM_PREFIX}::{category_id}:"),
+            ("Back", f"{_CATEGORY_VIEW_PREFIX}::{category_id}:"),
+        )
     )
-    builder.adjust(2)
-    return builder.as_markup()
 
 
 def product_questions_keyboard(
     product_id: int, questions: Iterable[ProductQuestion]
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
+    buttons: list[InlineKeyboardButton] = []
+    delete_prefix = f"{_QUESTION_DELETE_PREFIX}{product_id}:"
     for question in questions:
         label = question.prompt or question.field_key
-        builder.button(
-            text=f"Delete: {label[:32]}",
-            callback_data=ProductAdminCallback(
-                action="question_delete", product_id=product_id, question_id=question.id
-            ).pack(),
+        buttons.append(button(f"Delete: {label[:32]}", f"{delete_prefix}{question.id}::"))
+    buttons.extend(
+        (
+            button("Add question", f"{_QUESTION_ADD_PREFIX}{product_id}:::"),
+            button("Back", f"{_VIEW_PREFIX}{product_id}:::"),
         )
-
-    builder.button(
-        text="Add question",
-        callback_data=ProductAdminCallback(action="question_add", product_id=product_id).pack(),
     )
-    builder.button(
-        text="Back",
-        callback_data=ProductAdminCallback(action="view", product_id=product_id).pack(),
-    )
-    builder.adjust(1)
-    return builder.as_markup()
+    return column(buttons)
 
 
+@lru_cache(maxsize=1024)
 def question_delete_confirm_keyboard(
     product_id: int, question_id: int
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Confirm",
-        callback_data=ProductAdminCallback(
-            action="question_delete_confirm", product_id=product_id, question_id=question_id
-        ).pack(),
-    )
-    builder.button(
-        text="Cancel",
-        callback_data=ProductAdminCallback(action="questions", product_id=product_id).pack(),
+    return column(
+        (
+            button("Confirm", f"{_QUESTION_DELETE_CONFIRM_PREFIX}{product_id}:{question_id}::"),
+            button("Cancel", f"{_QUESTIONS_PREFIX}{product_id}:::"),
+        )
     )
-    builder.adjust(1)
-    return builder.as_markup()
 
 
+# (button text, callback value) for every question type, resolved once at import.
+_QTYPE_ROWS = tuple((question_type.value, question_type.value) for question_type in ProductQuestionType)
+
+
+@lru_cache(maxsize=1024)
 def question_type_keyboard(product_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for question_type in ProductQuestionType:
-        builder.button(
-            text=question_type.value,
-            callback_data=ProductAdminCallback(
-                action="question_type_set", product_id=product_id, value=question_type.value
-            ).pack(),
-        )
-    builder.adjust(2)
-    return builder.as_markup()
+    prefix = f"{_QUESTION_TYPE_SET_PREFIX}{product_id}:::"
+    return grid([button(text, prefix + value) for text, value in _QTYPE_ROWS], 2)
 
 
+@lru_cache(maxsize=512)
 def question_required_keyboard(product_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Required",
-        callback_data=ProductAdminCallback(
-            action="question_required_set", product_id=product_id, value="true"
-        ).pack(),
-    )
-    builder.button(
-        text="Optional",
-        callback_data=ProductAdminCallback(
-            action="question_required_set", product_id=product_id, value="false"
-        ).pack(),
+    return _two_button_markup(
+        (
+            ("Required", f"{_QUESTION_REQUIRED_SET_PREFIX}{product_id}:::true"),
+            ("Optional", f"{_QUESTION_REQUIRED_SET_PREFIX}{product_id}:::false"),
+        )
     )
-    builder.adjust(2)
-    return builder.as_markup()
+
+
+_CREATION_CONFIRM = _two_button_markup((("Save", _CREATE_CONFIRM_CALLBACK), ("Cancel", _CREATE_CANCEL_CALLBACK)))
 
 
 def creation_confirm_keyboard() -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Save",
-        callback_data=ProductAdminCallback(action="create_confirm").pack(),
-    )
-    builder.button(
-        text="Cancel",
-        callback_data=ProductAdminCallback(action="create_cancel").pack(),
-    )
-    builder.adjust(2)
-    return builder.as_markup()
+    return _CREATION_CONFIRM
 
 
+@lru_cache(maxsize=1024)
 def question_creation_confirm_keyboard(product_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Save question",
-        callback_data=ProductAdminCallback(
-            action="question_create_confirm", product_id=product_id
-        ).pack(),
-    )
-    builder.button(
-        text="Cancel",
-        callback_data=ProductAdminCallback(
-            action="question_create_cancel", product_id=product_id
-        ).pack(),
+    return _two_button_markup(
+        (
+            ("Save question", f"{_QUESTION_CREATE_CONFIRM_PREFIX}{product_id}:::"),
+            ("Cancel", f"{_QUESTION_CREATE_CANCEL_PREFIX}{product_id}:::"),
+        )
     )
-    builder.adjust(2)
-    return builder.as_markup()
@@ -2,89 +2,92 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from aiogram.types import InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
+from app.bot.keyboards._markup import button, column
 from app.bot.keyboards.admin import AdminMenuCallback
 from app.core.enums import ReferralRewardType
 from app.infrastructure.db.models import ReferralLink, ReferralReward
 
-ADMIN_REFERRAL_SETTINGS = "admin:ref:settings"
-ADMIN_REFERRAL_LINKS = "admin:ref:links"
-ADMIN_REFERRAL_PENDING = "admin:ref:pending"
-ADMIN_REFERRAL_LINK_PREFIX = "admin:ref:link:"
-ADMIN_REFERRAL_DELETE_PREFIX = "admin:ref:delete:"
-ADMIN_REFERRAL_EDIT_REWARD_PREFIX = "admin:ref:edit_reward:"
-ADMIN_REFERRAL_MARK_PAID_PREFIX = "admin:ref:mark_paid:"
-ADMIN_REFERRAL_VIEW_REWARDS_PREFIX = "admin:ref:rewards:"
+ADMIN_REFERRAL_SETTINGS = "ar:set"
+ADMIN_REFERRAL_LINKS = "ar:links"
+ADMIN_REFERRAL_PENDING = "ar:pend"
+ADMIN_REFERRAL_TOGGLE_ENABLED = "ar:t:on"
+ADMIN_REFERRAL_TOGGLE_DEFAULT_TYPE = "ar:t:type"
+ADMIN_REFERRAL_TOGGLE_AUTO_REWARD = "ar:t:auto"
+ADMIN_REFERRAL_TOGGLE_PUBLIC = "ar:t:pub"
+ADMIN_REFERRAL_EDIT_DEFAULT_VALUE = "ar:defval"
+ADMIN_REFERRAL_EDIT_RESELLERS = "ar:resellers"
+ADMIN_REFERRAL_LINK_PREFIX = "ar:l:"
+ADMIN_REFERRAL_DELETE_PREFIX = "ar:d:"
+ADMIN_REFERRAL_EDIT_REWARD_PREFIX = "ar:e:"
+ADMIN_REFERRAL_MARK_PAID_PREFIX = "ar:p:"
+ADMIN_REFERRAL_VIEW_REWARDS_PREFIX = "ar:r:"
+
+_BACK_TO_REFERRALS_BUTTON = button("Back", AdminMenuCallback.MANAGE_REFERRALS.value)
+_BACK_TO_LINKS_BUTTON = button("Back", ADMIN_REFERRAL_LINKS)
+_REFRESH_LINKS_BUTTON = button("Refresh", ADMIN_REFERRAL_LINKS)
+
+_DASHBOARD_KEYBOARD = column(
+    (
+        button("Referral settings", ADMIN_REFERRAL_SETTINGS),
+        button("Recent links", ADMIN_REFERRAL_LINKS),
+        button("Pending commissions", ADMIN_REFERRAL_PENDING),
+        button("Back", AdminMenuCallback.BACK_TO_MAIN.value),
+    )
+)
 
 
 def referral_admin_dashboard_keyboard() -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Referral settings", callback_data=ADMIN_REFERRAL_SETTINGS)
-    builder.button(text="Recent links", callback_data=ADMIN_REFERRAL_LINKS)
-    builder.button(text="Pending commissions", callback_data=ADMIN_REFERRAL_PENDING)
-    builder.button(text="Back", callback_data=AdminMenuCallback.BACK_TO_MAIN.value)
-    builder.adjust(1)
-    return builder.as_markup()
+    return _DASHBOARD_KEYBOARD
 
 
 def referral_admin_settings_keyboard(settings) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text=f"Program: {'ON' if settings.enabled else 'OFF'}",
-        callback_data="admin:ref:toggle_enabled",
-    )
-    builder.button(
-        text=f"Default reward type: {settings.default_reward_type.value}",
-        callback_data="admin:ref:toggle_default_type",
-    )
-    builder.button(
-        text=f"Auto reward: {'ON' if settings.auto_reward else 'OFF'}",
-        callback_data="admin:ref:toggle_auto_reward",
-    )
-    builder.button(
-        text=f"Public links: {'ON' if settings.allow_public_links else 'OFF'}",
-        callback_data="admin:ref:toggle_public",
+    return column(
+        (
+            button(f"Program: {'ON' if settings.enabled else 'OFF'}", ADMIN_REFERRAL_TOGGLE_ENABLED),
+            button(
+                f"Default reward type: {settings.default_reward_type.value}",
+                ADMIN_REFERRAL_TOGGLE_DEFAULT_TYPE,
+            ),
+            button(f"Auto reward: {'ON' if settings.auto_reward else 'OFF'}", ADMIN_REFERRAL_TOGGLE_AUTO_REWARD),
+            button(f"Public links: {'ON' if settings.allow_public_links else 'OFF'}", ADMIN_REFERRAL_TOGGLE_PUBLIC),
+            button("Change default reward", ADMIN_REFERRAL_EDIT_DEFAULT_VALUE),
+            button("Manage resellers", ADMIN_REFERRAL_EDIT_RESELLERS),
+            _BACK_TO_REFERRALS_BUTTON,
+        )
     )
-    builder.button(text="Change default reward", callback_data="admin:ref:edit_default_value")
-    builder.button(text="Manage resellers", callback_data="admin:ref:edit_resellers")
-    builder.button(text="Back", callback_data=AdminMenuCallback.MANAGE_REFERRALS.value)
-    builder.adjust(1)
-    return builder.as_markup()
 
 
 def referral_admin_links_keyboard(links: Sequence[ReferralLink]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
+    buttons: list[InlineKeyboardButton] = []
     for link in links:
-        label = (link.meta or {}).get("label") if link.meta else None
-        title = f"{label} ({link.code})" if label else f"{link.code}" 
-        builder.button(text=title, callback_data=f"{ADMIN_REFERRAL_LINK_PREFIX}{link.id}")
-    builder.button(text="Refresh", callback_data=ADMIN_REFERRAL_LINKS)
-    builder.button(text="Back", callback_data=AdminMenuCallback.MANAGE_REFERRALS.value)
-    builder.adjust(1)
-    return builder.as_markup()
+        meta = link.meta
+        label = meta.get("label") if meta else None
+        title = f"{label} ({link.code})" if label else link.code
+        buttons.append(button(title, f"{ADMIN_REFERRAL_LINK_PREFIX}{link.id}"))
+    buttons.append(_REFRESH_LINKS_BUTTON)
+    buttons.append(_BACK_TO_REFERRALS_BUTTON)
+    return column(buttons)
 
 
 def referral_admin_link_keyboard(link: ReferralLink) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="View rewards", callback_data=f"{ADMIN_REFERRAL_VIEW_REWARDS_PREFIX}{link.id}")
-    builder.button(text="Adjust reward", callback_data=f"{ADMIN_REFERRAL_EDIT_REWARD_PREFIX}{link.id}")
-    builder.button(text="Delete link", callback_data=f"{ADMIN_REFERRAL_DELETE_PREFIX}{link.id}")
-    builder.button(text="Back", callback_data=ADMIN_REFERRAL_LINKS)
-    builder.adjust(1)
-    return builder.as_markup()
+    return column(
+        (
+            button("View rewards", f"{ADMIN_REFERRAL_VIEW_REWARDS_PREFIX}{link.id}"),
+            button("Adjust reward", f"{ADMIN_REFERRAL_EDIT_REWARD_PREFIX}{link.id}"),
+            button("Delete link", f"{ADMIN_REFERRAL_DELETE_PREFIX}{link.id}"),
+            _BACK_TO_LINKS_BUTTON,
+        )
+    )
 
 
 def referral_admin_rewards_keyboard(rewards: Sequence[ReferralReward]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for reward in rewards:
-        if reward.rewarded_at or reward.reward_type != ReferralRewardType.COMMISSION:
-            continue
-        builder.button(
-            text=f"Mark paid #{reward.id}",
-            callback_data=f"{ADMIN_REFERRAL_MARK_PAID_PREFIX}{reward.id}",
-        )
-    builder.button(text="Back", callback_data=ADMIN_REFERRAL_LINKS)
-    builder.adjust(1)
-    return builder.as_markup()
+    commission = ReferralRewardType.COMMISSION
+    buttons = [
+        button(f"Mark paid #{reward.id}", f"{ADMIN_REFERRAL_MARK_PAID_PREFIX}{reward.id}")
+        for reward in rewards
+        if reward.rewarded_at is None and reward.reward_type == commission
+    ]
+    buttons.append(_BACK_TO_LINKS_BUTTON)
+    return column(buttons)
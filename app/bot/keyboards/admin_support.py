@@ -1,31 +1,31 @@
 from __future__ import annotations
 
-from typing import Sequence, TYPE_CHECKING
+from functools import lru_cache
+from typing import Sequence
 
-from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
+from aiogram.types import InlineKeyboardMarkup
 
+from app.bot.keyboards._labels import CLOSED_TICKET_STATUSES, status_label
+from app.bot.keyboards._markup import button, column, rows_markup
+from app.bot.keyboards._pager import pager_row
 from app.bot.keyboards.admin import AdminMenuCallback
 from app.core.enums import SupportTicketPriority, SupportTicketStatus
 from app.infrastructure.db.models import SupportTicket
 
-if TYPE_CHECKING:
-    from app.services.config_service import ConfigService
+ADMIN_SUPPORT_MENU_OPEN = "as:m:open"
+ADMIN_SUPPORT_MENU_ALL = "as:m:all"
+ADMIN_SUPPORT_MENU_ASSIGNED = "as:m:mine"
+ADMIN_SUPPORT_MENU_AWAITING_USER = "as:m:await"
+ADMIN_SUPPORT_SETTINGS = "as:cfg"
 
-ADMIN_SUPPORT_MENU_OPEN = "admin:sup:open"
-ADMIN_SUPPORT_MENU_ALL = "admin:sup:all"
-ADMIN_SUPPORT_MENU_ASSIGNED = "admin:sup:mine"
-ADMIN_SUPPORT_MENU_AWAITING_USER = "admin:sup:await_user"
-ADMIN_SUPPORT_SETTINGS = "admin:sup:settings"
-
-ADMIN_SUPPORT_LIST_PREFIX = "admin:sup:list:"
-ADMIN_SUPPORT_VIEW_PREFIX = "admin:sup:view:"
-ADMIN_SUPPORT_REPLY_PREFIX = "admin:sup:reply:"
+ADMIN_SUPPORT_LIST_PREFIX = "as:l:"
+ADMIN_SUPPORT_VIEW_PREFIX = "as:v:"
+ADMIN_SUPPORT_REPLY_PREFIX = "as:r:"
 ADMIN_SUPPORT_STATUS_PREFIX = "as:st:"
-ADMIN_SUPPORT_ASSIGN_PREFIX = "admin:sup:assign:"
-ADMIN_SUPPORT_PRIORITY_PREFIX = "admin:sup:priority:"
+ADMIN_SUPPORT_ASSIGN_PREFIX = "as:a:"
+ADMIN_SUPPORT_PRIORITY_PREFIX = "as:p:"
 ADMIN_SUPPORT_SPAM_PREFIX = "as:sp:"
-ADMIN_SUPPORT_ORDER_ACTION_PREFIX = "admin:sup:order:"
+ADMIN_SUPPORT_ORDER_ACTION_PREFIX = "as:o:"
 
 _STATUS_CODE_MAP: dict[SupportTicketStatus, str] = {
     SupportTicketStatus.OPEN: "op",
@@ -35,6 +35,30 @@ _STATUS_CODE_MAP: dict[SupportTicketStatus, str] = {
     SupportTicketStatus.ARCHIVED: "ar",
 }
 _STATUS_CODE_REVERSE: dict[str, SupportTicketStatus] = {code: status for status, code in _STATUS_CODE_MAP.items()}
+_FILTER_CODE_MAP: dict[str, str] = {
+    "open": "op",
+    "mine": "mi",
+    "await_user": "au",
+    "await_admin": "aa",
+    "all": "al",
+}
+_FILTER_CODE_REVERSE: dict[str, str] = {code: name for name, code in _FILTER_CODE_MAP.items()}
+_PRIORITY_CODE_MAP: dict[SupportTicketPriority, str] = {
+    SupportTicketPriority.LOW: "l",
+    SupportTicketPriority.NORMAL: "n",
+    SupportTicketPriority.HIGH: "h",
+    SupportTicketPriority.URGENT: "u",
+}
+_PRIORITY_CODE_REVERSE: dict[str, SupportTicketPriority] = {
+    code: priority for priority, code in _PRIORITY_CODE_MAP.items()
+}
+_SUMMARY_FMT = "%s • %s • u%s"
+_PRIORITY_NEXT: dict[SupportTicketPriority, SupportTicketPriority] = {
+    SupportTicketPriority.LOW: SupportTicketPriority.NORMAL,
+    SupportTicketPriority.NORMAL: SupportTicketPriority.HIGH,
+    SupportTicketPriority.HIGH: SupportTicketPriority.URGENT,
+    SupportTicketPriority.URGENT: SupportTicketPriority.LOW,
+}
 
 
 def encode_status_code(status: SupportTicketStatus) -> str:
@@ -45,16 +69,61 @@ def decode_status_code(code: str) -> SupportTicketStatus | None:
     return _STATUS_CODE_REVERSE.get(code)
 
 
+def encode_filter_code(filter_code: str) -> str:
+    return _FILTER_CODE_MAP.get(filter_code, _FILTER_CODE_MAP["open"])
+
+
+def decode_filter_code(code: str) -> str:
+    return _FILTER_CODE_REVERSE.get(code, "open")
+
+
+def encode_priority_code(priority: SupportTicketPriority) -> str:
+    return _PRIORITY_CODE_MAP[priority]
+
+
+def decode_priority_code(code: str) -> SupportTicketPriority | None:
+    return _PRIORITY_CODE_REVERSE.get(code)
+
+
+_MENU_KEYBOARD = column(
+    (
+        button("Open tickets", ADMIN_SUPPORT_MENU_OPEN),
+        button("Assigned to me", ADMIN_SUPPORT_MENU_ASSIGNED),
+        button("Awaiting customer", ADMIN_SUPPORT_MENU_AWAITING_USER),
+        button("All tickets", ADMIN_SUPPORT_MENU_ALL),
+        button("Spam guard", ADMIN_SUPPORT_SETTINGS),
+        button("Back", "admin:back_to_main"),
+    )
+)
+
+
+_BACK_TO_SUPPORT_BUTTON = button("Back", AdminMenuCallback.MANAGE_SUPPORT.value)
+
+_ANTISPAM_KEYBOARD = rows_markup(
+    [
+        [
+            button("Max open -", f"{ADMIN_SUPPORT_SPAM_PREFIX}open:-1"),
+            button("Max open +", f"{ADMIN_SUPPORT_SPAM_PREFIX}open:+1"),
+        ],
+        [
+            button("Window min -5", f"{ADMIN_SUPPORT_SPAM_PREFIX}win:-5"),
+            button("Window min +5", f"{ADMIN_SUPPORT_SPAM_PREFIX}win:+5"),
+        ],
+        [
+            button("Per window -", f"{ADMIN_SUPPORT_SPAM_PREFIX}winmax:-1"),
+            button("Per window +", f"{ADMIN_SUPPORT_SPAM_PREFIX}winmax:+1"),
+        ],
+        [
+            button("Delay s -5", f"{ADMIN_SUPPORT_SPAM_PREFIX}delay:-5"),
+            button("Delay s +5", f"{ADMIN_SUPPORT_SPAM_PREFIX}delay:+5"),
+        ],
+        [_BACK_TO_SUPPORT_BUTTON],
+    ]
+)
+
+
 def admin_support_menu_keyboard() -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Open tickets", callback_data=ADMIN_SUPPORT_MENU_OPEN)
-    builder.button(text="Assigned to me", callback_data=ADMIN_SUPPORT_MENU_ASSIGNED)
-    builder.button(text="Awaiting customer", callback_data=ADMIN_SUPPORT_MENU_AWAITING_USER)
-    builder.button(text="All tickets", callback_data=ADMIN_SUPPORT_MENU_ALL)
-    builder.button(text="Spam guard", callback_data=ADMIN_SUPPORT_SETTINGS)
-    builder.button(text="Back", callback_data="admin:back_to_main")
-    builder.adjust(1)
-    return builder.as_markup()
+    return _MENU_KEYBOARD
 
 
 def admin_support_list_keyboard(
@@ -65,38 +134,24 @@ def admin_support_list_keyboard(
     has_prev: bool,
     has_next: bool,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for ticket in tickets:
-        builder.button(
-            text=_ticket_summary(ticket),
-            callback_data=f"{ADMIN_SUPPORT_VIEW_PREFIX}{ticket.public_id}",
-        )
-    nav_buttons: list[InlineKeyboardButton] = []
-    prefix = f"{ADMIN_SUPPORT_LIST_PREFIX}{filter_code}:"
-    if has_prev:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="◀️ Prev",
-                callback_data=f"{prefix}{page - 1}",
-            )
-        )
-    nav_buttons.append(
-        InlineKeyboardButton(
-            text="Refresh",
-            callback_data=f"{prefix}{page}",
-        )
-    )
-    if has_next:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="▶️ Next",
-                callback_data=f"{prefix}{page + 1}",
-            )
-        )
-    builder.row(*nav_buttons)
-    builder.button(text="Back", callback_data="admin:manage_support")
-    builder.adjust(1)
-    return builder.as_markup()
+    entries = tuple((_ticket_summary(ticket), ticket.public_id) for ticket in tickets)
+    return _support_list_markup(entries, encode_filter_code(filter_code), page, has_prev, has_next)
+
+
+# Keyed on the rendered label and id of every row, so any change to a ticket's
+# status, subject or owner misses the cache.
+@lru_cache(maxsize=256)
+def _support_list_markup(
+    entries: tuple[tuple[str, str], ...],
+    filter_code: str,
+    page: int,
+    has_prev: bool,
+    has_next: bool,
+) -> InlineKeyboardMarkup:
+    rows = [[button(summary, ADMIN_SUPPORT_VIEW_PREFIX + public_id)] for summary, public_id in entries]
+    rows.append(list(pager_row(f"{ADMIN_SUPPORT_LIST_PREFIX}{filter_code}:", page, has_prev, has_next)))
+    rows.append([_BACK_TO_SUPPORT_BUTTON])
+    return rows_markup(rows)
 
 
 def admin_support_ticket_keyboard(
@@ -106,135 +161,64 @@ def admin_support_ticket_keyboard(
     filter_code: str,
     page: int,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Reply", callback_data=f"{ADMIN_SUPPORT_REPLY_PREFIX}{ticket.public_id}")
+    public_id = ticket.public_id
+    status_prefix = ADMIN_SUPPORT_STATUS_PREFIX + public_id + ":"
+    assign_prefix = ADMIN_SUPPORT_ASSIGN_PREFIX + public_id + ":"
+    buttons = [button("Reply", ADMIN_SUPPORT_REPLY_PREFIX + public_id)]
 
     if ticket.assigned_admin_id == admin_id:
-        builder.button(
-            text="Release ticket",
-            callback_data=f"{ADMIN_SUPPORT_ASSIGN_PREFIX}{ticket.public_id}:none",
-        )
+        buttons.append(button("Release ticket", assign_prefix + "none"))
     else:
-        builder.button(
-            text="Assign to me",
-            callback_data=f"{ADMIN_SUPPORT_ASSIGN_PREFIX}{ticket.public_id}:me",
-        )
+        buttons.append(button("Assign to me", assign_prefix + "me"))
 
-    if ticket.status in {SupportTicketStatus.RESOLVED, SupportTicketStatus.ARCHIVED}:
-        builder.button(
-            text="Reopen",
-            callback_data=f"{ADMIN_SUPPORT_STATUS_PREFIX}{ticket.public_id}:{encode_status_code(SupportTicketStatus.OPEN)}",
-        )
+    if ticket.status in CLOSED_TICKET_STATUSES:
+        buttons.append(button("Reopen", status_prefix + encode_status_code(SupportTicketStatus.OPEN)))
     else:
-        builder.button(
-            text="Mark resolved",
-            callback_data=f"{ADMIN_SUPPORT_STATUS_PREFIX}{ticket.public_id}:{encode_status_code(SupportTicketStatus.RESOLVED)}",
+        buttons.append(
+            button("Mark resolved", status_prefix + encode_status_code(SupportTicketStatus.RESOLVED))
         )
-        builder.button(
-            text="Awaiting customer",
-            callback_data=f"{ADMIN_SUPPORT_STATUS_PREFIX}{ticket.public_id}:{encode_status_code(SupportTicketStatus.AWAITING_USER)}",
+        buttons.append(
+            button("Awaiting customer", status_prefix + encode_status_code(SupportTicketStatus.AWAITING_USER))
         )
-        builder.button(
-            text="Awaiting admin",
-            callback_data=f"{ADMIN_SUPPORT_STATUS_PREFIX}{ticket.public_id}:{encode_status_code(SupportTicketStatus.AWAITING_ADMIN)}",
+        buttons.append(
+            button("Awaiting admin", status_prefix + encode_status_code(SupportTicketStatus.AWAITING_ADMIN))
         )
 
     next_priority = _next_priority(ticket.priority)
-    builder.button(
-        text=f"Priority: {ticket.priority.value.title()} (set {next_priority.value.title()})",
-        callback_data=f"{ADMIN_SUPPORT_PRIORITY_PREFIX}{ticket.public_id}:{next_priority.value}",
+    buttons.append(
+        button(
+            f"Priority: {ticket.priority.value.title()} (set {next_priority.value.title()})",
+            ADMIN_SUPPORT_PRIORITY_PREFIX + public_id + ":" + encode_priority_code(next_priority),
+        )
     )
 
     order = getattr(ticket, "order", None)
     if order and getattr(order, "service_duration_days", None):
+        action_prefix = ADMIN_SUPPORT_ORDER_ACTION_PREFIX
         if getattr(order, "service_paused_at", None):
-            builder.button(
-                text="Resume service timer",
-                callback_data=f"{ADMIN_SUPPORT_ORDER_ACTION_PREFIX}resume:{ticket.public_id}",
-            )
+            buttons.append(button("Resume service timer", action_prefix + "resume:" + public_id))
         else:
-            builder.button(
-                text="Pause service timer",
-                callback_data=f"{ADMIN_SUPPORT_ORDER_ACTION_PREFIX}pause:{ticket.public_id}",
-            )
-        builder.button(
-            text="Create replacement",
-            callback_data=f"{ADMIN_SUPPORT_ORDER_ACTION_PREFIX}replace:{ticket.public_id}",
-        )
+            buttons.append(button("Pause service timer", action_prefix + "pause:" + public_id))
+        buttons.append(button("Create replacement", action_prefix + "replace:" + public_id))
 
-    builder.button(
-        text="Back",
-        callback_data=f"{ADMIN_SUPPORT_LIST_PREFIX}{filter_code}:{max(page, 0)}",
+    buttons.append(
+        button("Back", f"{ADMIN_SUPPORT_LIST_PREFIX}{encode_filter_code(filter_code)}:{max(page, 0)}")
     )
-    builder.adjust(1)
-    return builder.as_markup()
+    return column(buttons)
 
 
 def _ticket_summary(ticket: SupportTicket) -> str:
-    status = ticket.status.value.replace("_", " ").title()
-    subject = ticket.subject[:32]
-    user_text = f"u{ticket.user.telegram_id if ticket.user else ticket.user_id}"
-    return f"{status} • {subject} • {user_text}"
+    user = ticket.user
+    return _SUMMARY_FMT % (
+        status_label(ticket.status),
+        ticket.subject[:32],
+        user.telegram_id if user else ticket.user_id,
+    )
 
 
 def _next_priority(current: SupportTicketPriority) -> SupportTicketPriority:
-    order = [
-        SupportTicketPriority.LOW,
-        SupportTicketPriority.NORMAL,
-        SupportTicketPriority.HIGH,
-        SupportTicketPriority.URGENT,
-    ]
-    idx = order.index(current)
-    return order[(idx + 1) % len(order)]
+    return _PRIORITY_NEXT[current]
 
 
-def admin_support_antispam_keyboard(
-    settings: "ConfigService.SupportAntiSpamSettings",
-) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(
-            text="Max open -",
-            callback_data=f"{ADMIN_SUPPORT_SPAM_PREFIX}open:-1",
-        ),
-        InlineKeyboardButton(
-            text="Max open +",
-            callback_data=f"{ADMIN_SUPPORT_SPAM_PREFIX}open:+1",
-        ),
-    )
-    builder.row(
-        InlineKeyboardButton(
-            text="Window min -5",
-            callback_data=f"{ADMIN_SUPPORT_SPAM_PREFIX}win:-5",
-        ),
-        InlineKeyboardButton(
-            text="Window min +5",
-            callback_data=f"{ADMIN_SUPPORT_SPAM_PREFIX}win:+5",
-        ),
-    )
-    builder.row(
-        InlineKeyboardButton(
-            text="Per window -",
-            callback_data=f"{ADMIN_SUPPORT_SPAM_PREFIX}winmax:-1",
-        ),
-        InlineKeyboardButton(
-            text="Per window +",
-            callback_data=f"{ADMIN_SUPPORT_SPAM_PREFIX}winmax:+1",
-        ),
-    )
-    builder.row(
-        InlineKeyboardButton(
-            text="Delay s -5",
-            callback_data=f"{ADMIN_SUPPORT_SPAM_PREFIX}delay:-5",
-        ),
-        InlineKeyboardButton(
-            text="Delay s +5",
-            callback_data=f"{ADMIN_SUPPORT_SPAM_PREFIX}delay:+5",
-        ),
-    )
-    builder.button(
-        text="Back",
-        callback_data=AdminMenuCallback.MANAGE_SUPPORT.value,
-    )
-    builder.adjust(2, 2, 2, 2, 1)
-    return builder.as_markup()
+def admin_support_antispam_keyboard() -> InlineKeyboardMarkup:
+    return _ANTISPAM_KEYBOARD
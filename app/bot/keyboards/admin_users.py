@@ -2,19 +2,27 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
+from aiogram.types import InlineKeyboardMarkup
 
+from app.bot.keyboards._labels import status_label
+from app.bot.keyboards._markup import button, column, rows_markup
+from app.bot.keyboards._pager import pager_row
 from app.bot.keyboards.admin import AdminMenuCallback, ADMIN_ORDER_VIEW_PREFIX
 from app.infrastructure.db.models import Order, UserProfile
 
-ADMIN_USER_VIEW_PREFIX = "admin:user:view:"
-ADMIN_USER_TOGGLE_BLOCK_PREFIX = "admin:user:toggle:"
-ADMIN_USER_EDIT_NOTES_PREFIX = "admin:user:notes:"
-ADMIN_USER_VIEW_ORDERS_PREFIX = "admin:user:orders:"
-ADMIN_USER_BACK = "admin:user:back"
-ADMIN_USER_SEARCH = "admin:user:search"
-ADMIN_USER_LIST_PAGE_PREFIX = "admin:user:list:"
+ADMIN_USER_VIEW_PREFIX = "au:v:"
+ADMIN_USER_TOGGLE_BLOCK_PREFIX = "au:b:"
+ADMIN_USER_EDIT_NOTES_PREFIX = "au:n:"
+ADMIN_USER_VIEW_ORDERS_PREFIX = "au:o:"
+ADMIN_USER_BACK = "au:back"
+ADMIN_USER_SEARCH = "au:search"
+ADMIN_USER_LIST_PAGE_PREFIX = "au:l:"
+
+
+_SEARCH_BUTTON = button("Search user", ADMIN_USER_SEARCH)
+_BACK_TO_MAIN_BUTTON = button("Back", AdminMenuCallback.BACK_TO_MAIN.value)
+_BACK_TO_USERS_BUTTON = button("Back", ADMIN_USER_BACK)
+_BACK_TO_USERS_LIST_BUTTON = button("Back to users", ADMIN_USER_BACK)
 
 
 def users_overview_keyboard(
@@ -24,71 +32,35 @@ def users_overview_keyboard(
     has_prev: bool,
     has_next: bool,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for user in users:
-        label = user.display_name()
-        builder.button(
-            text=label,
-            callback_data=f"{ADMIN_USER_VIEW_PREFIX}{user.id}",
-        )
-    nav_buttons: list[InlineKeyboardButton] = []
-    if has_prev:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="◀️ Prev",
-                callback_data=f"{ADMIN_USER_LIST_PAGE_PREFIX}{page - 1}",
-            )
-        )
-    nav_buttons.append(
-        InlineKeyboardButton(
-            text="Refresh",
-            callback_data=f"{ADMIN_USER_LIST_PAGE_PREFIX}{page}",
-        )
-    )
-    if has_next:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="▶️ Next",
-                callback_data=f"{ADMIN_USER_LIST_PAGE_PREFIX}{page + 1}",
-            )
-        )
-    builder.row(*nav_buttons)
-    builder.button(text="Search user", callback_data=ADMIN_USER_SEARCH)
-    builder.button(text="Back", callback_data=AdminMenuCallback.BACK_TO_MAIN.value)
-    builder.adjust(1)
-    return builder.as_markup()
+    rows = [[button(user.display_name(), f"{ADMIN_USER_VIEW_PREFIX}{user.id}")] for user in users]
+    rows.append(list(pager_row(ADMIN_USER_LIST_PAGE_PREFIX, page, has_prev, has_next)))
+    rows.append([_SEARCH_BUTTON])
+    rows.append([_BACK_TO_MAIN_BUTTON])
+    return rows_markup(rows)
 
 
 def user_detail_keyboard(user: UserProfile) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Block user" if not user.is_blocked else "Unblock user",
-        callback_data=f"{ADMIN_USER_TOGGLE_BLOCK_PREFIX}{user.id}",
-    )
-    builder.button(
-        text="Edit notes",
-        callback_data=f"{ADMIN_USER_EDIT_NOTES_PREFIX}{user.id}",
-    )
-    builder.button(
-        text="View orders",
-        callback_data=f"{ADMIN_USER_VIEW_ORDERS_PREFIX}{user.id}",
+    return column(
+        (
+            button(
+                "Block user" if not user.is_blocked else "Unblock user",
+                f"{ADMIN_USER_TOGGLE_BLOCK_PREFIX}{user.id}",
+            ),
+            button("Edit notes", f"{ADMIN_USER_EDIT_NOTES_PREFIX}{user.id}"),
+            button("View orders", f"{ADMIN_USER_VIEW_ORDERS_PREFIX}{user.id}"),
+            _BACK_TO_USERS_BUTTON,
+        )
     )
-    builder.button(text="Back", callback_data=ADMIN_USER_BACK)
-    builder.adjust(1)
-    return builder.as_markup()
 
 
 def user_orders_keyboard(user_id: int, orders: Sequence[Order]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for order in orders:
-        status = order.status.value.replace("_", " ").title()
-        builder.button(
-            text=f"{status} - {order.total_amount} {order.currency}",
-            callback_data=f"{ADMIN_ORDER_VIEW_PREFIX}{order.public_id}",
+    buttons = [
+        button(
+            f"{status_label(order.status)} - {order.total_amount} {order.currency}",
+            ADMIN_ORDER_VIEW_PREFIX + order.public_id,
         )
-    builder.button(text="Back", callback_data=f"{ADMIN_USER_VIEW_PREFIX}{user_id}")
-    builder.button(text="Back to users", callback_data=ADMIN_USER_BACK)
-    builder.adjust(1)
-    return builder.as_markup()
-
-
+        for order in orders
+    ]
+    buttons.append(button("Back", f"{ADMIN_USER_VIEW_PREFIX}{user_id}"))
+    buttons.append(_BACK_TO_USERS_LIST_BUTTON)
+    return column(buttons)
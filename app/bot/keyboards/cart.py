@@ -3,9 +3,10 @@
 from decimal import Decimal
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 
-from app.infrastructure.db.models import CartItem, ShoppingCart
+from app.bot.keyboards._markup import button, column
+from app.bot.keyboards.main_menu import MainMenuCallback
+from app.infrastructure.db.models import ShoppingCart
 
 CART_REFRESH_CALLBACK = "cart:refresh"
 CART_CLEAR_CALLBACK = "cart:clear"
@@ -16,40 +17,59 @@ CART_QTY_PREFIX = "cart:qty:"
 CART_CONFIRM_ORDER = "cart:confirm_order"
 CART_CANCEL_CHECKOUT = "cart:cancel_checkout"
 
+# Terminal buttons shared by every cart render.
+_EMPTY_BUTTON = button("Cart is empty", CART_REFRESH_CALLBACK)
+_CLEAR_BUTTON = button("Clear cart", CART_CLEAR_CALLBACK)
+_REFRESH_BUTTON = button("Refresh", CART_REFRESH_CALLBACK)
+_BACK_TO_MENU_BUTTON = button("Back to menu", CART_BACK_CALLBACK)
 
-def cart_menu_keyboard(cart: ShoppingCart, totals: Decimal) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
 
-    for item in cart.items:
-        builder.button(
-            text=_item_label(item),
-            callback_data=f"{CART_QTY_PREFIX}show:{item.product_id}",
-        )
-        builder.row(
-            InlineKeyboardButton(text="-", callback_data=f"{CART_QTY_PREFIX}dec:{item.product_id}"),
-            InlineKeyboardButton(text="+", callback_data=f"{CART_QTY_PREFIX}inc:{item.product_id}"),
-            InlineKeyboardButton(text="Remove", callback_data=f"{CART_REMOVE_PREFIX}{item.product_id}"),
+def cart_menu_keyboard(cart: ShoppingCart, totals: Decimal) -> InlineKeyboardMarkup:
+    show_prefix = CART_QTY_PREFIX + "show:"
+    dec_prefix = CART_QTY_PREFIX + "dec:"
+    inc_prefix = CART_QTY_PREFIX + "inc:"
+    remove_prefix = CART_REMOVE_PREFIX
+    items = cart.items
+    buttons: list[InlineKeyboardButton] = []
+    for item in items:
+        product_id = str(item.product_id)
+        title = item.title_override or getattr(item.product, "name", "Item")
+        buttons += (
+            button(f"{title} x{item.quantity} - {item.total_amount} {item.currency}", show_prefix + product_id),
+            button("-", dec_prefix + product_id),
+            button("+", inc_prefix + product_id),
+            button("Remove", remove_prefix + product_id),
         )
 
-    if not cart.items:
-        builder.button(text="Cart is empty", callback_data=CART_REFRESH_CALLBACK)
+    if not items:
+        buttons.append(_EMPTY_BUTTON)
     else:
-        builder.button(text=f"Checkout ({totals} {cart.currency})", callback_data=CART_CHECKOUT_CALLBACK)
-        builder.button(text="Clear cart", callback_data=CART_CLEAR_CALLBACK)
-    builder.button(text="Refresh", callback_data=CART_REFRESH_CALLBACK)
-    builder.button(text="Back to menu", callback_data=CART_BACK_CALLBACK)
-    builder.adjust(1)
-    return builder.as_markup()
+        buttons.append(button(f"Checkout ({totals} {cart.currency})", CART_CHECKOUT_CALLBACK))
+        buttons.append(_CLEAR_BUTTON)
+    buttons.append(_REFRESH_BUTTON)
+    buttons.append(_BACK_TO_MENU_BUTTON)
+    return column(buttons)
 
 
-def _item_label(item: CartItem) -> str:
-    title = item.title_override or getattr(item.product, "name", "Item")
-    return f"{title} x{item.quantity} - {item.total_amount} {item.currency}"
+_CHECKOUT_CONFIRMATION_KEYBOARD = column(
+    (
+        button("Confirm order", CART_CONFIRM_ORDER),
+        button("Cancel checkout", CART_CANCEL_CHECKOUT),
+    )
+)
 
 
 def cart_checkout_confirmation_keyboard() -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Confirm order", callback_data=CART_CONFIRM_ORDER)
-    builder.button(text="Cancel checkout", callback_data=CART_CANCEL_CHECKOUT)
-    builder.adjust(1)
-    return builder.as_markup()
+    return _CHECKOUT_CONFIRMATION_KEYBOARD
+
+
+_ITEM_ADDED_KEYBOARD = column(
+    (
+        button("View cart", MainMenuCallback.CART.value),
+        button("Continue shopping", MainMenuCallback.PRODUCTS.value),
+    )
+)
+
+
+def cart_item_added_keyboard() -> InlineKeyboardMarkup:
+    return _ITEM_ADDED_KEYBOARD
@@ -1,31 +1,27 @@
 from __future__ import annotations
 
-from enum import StrEnum
-
 from aiogram.types import InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from app.bot.keyboards._markup import button, column
+
+
+HELP_MAIN_MENU = "help:main"
+HELP_BACK_TO_MENU = "help:menu"
+HELP_CATEGORY_PREFIX = "help:cat:"
+HELP_ITEM_PREFIX = "help:item:"
 
-class HelpCallback(StrEnum):
-    MAIN_MENU = "help:main"
-    CATEGORY = "help:cat"
-    ITEM = "help:item"
-    BACK_TO_MENU = "help:menu"
+_BACK_TO_MENU_BUTTON = button("Back to menu", HELP_BACK_TO_MENU)
+_BACK_TO_HELP_BUTTON = button("Back", HELP_MAIN_MENU)
 
 
 def help_categories_keyboard(categories: list[tuple[str, str]]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for cat_id, title in categories:
-        builder.button(text=title, callback_data=f"{HelpCallback.CATEGORY.value}:{cat_id}")
-    builder.button(text="Back to menu", callback_data=HelpCallback.BACK_TO_MENU.value)
-    builder.adjust(1)
-    return builder.as_markup()
+    buttons = [button(title, HELP_CATEGORY_PREFIX + cat_id) for cat_id, title in categories]
+    buttons.append(_BACK_TO_MENU_BUTTON)
+    return column(buttons)
 
 
 def help_items_keyboard(cat_id: str, items: list[tuple[str, str]]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for item_id, title in items:
-        builder.button(text=title, callback_data=f"{HelpCallback.ITEM.value}:{cat_id}:{item_id}")
-    builder.button(text="Back", callback_data=HelpCallback.MAIN_MENU.value)
-    builder.adjust(1)
-    return builder.as_markup()
+    item_prefix = f"{HELP_ITEM_PREFIX}{cat_id}:"
+    buttons = [button(title, item_prefix + item_id) for item_id, title in items]
+    buttons.append(_BACK_TO_HELP_BUTTON)
+    return column(buttons)
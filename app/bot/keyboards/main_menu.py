@@ -1,9 +1,11 @@
 ﻿from __future__ import annotations
 
 from enum import StrEnum
+from functools import lru_cache
 
 from aiogram.types import InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+from app.bot.keyboards._markup import button, column
 
 
 class MainMenuCallback(StrEnum):
@@ -18,23 +20,36 @@ class MainMenuCallback(StrEnum):
     ADMIN = "menu:admin"
 
 
+@lru_cache(maxsize=None)
 def main_menu_keyboard(show_admin: bool = False) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Products", callback_data=MainMenuCallback.PRODUCTS.value)
-    builder.button(text="View cart", callback_data=MainMenuCallback.CART.value)
-    builder.button(text="My orders", callback_data=MainMenuCallback.ACCOUNT.value)
-    builder.button(text="My profile", callback_data=MainMenuCallback.PROFILE.value)
-    builder.button(text="Support", callback_data=MainMenuCallback.SUPPORT.value)
+    buttons = [
+        button("Products", MainMenuCallback.PRODUCTS.value),
+        button("View cart", MainMenuCallback.CART.value),
+        button("My orders", MainMenuCallback.ACCOUNT.value),
+        button("My profile", MainMenuCallback.PROFILE.value),
+        button("Support", MainMenuCallback.SUPPORT.value),
+    ]
     if show_admin:
-        builder.button(text="Help", callback_data=MainMenuCallback.HELP.value)
-    builder.button(text="Referral center", callback_data=MainMenuCallback.REFERRAL.value)
+        buttons.append(button("Help", MainMenuCallback.HELP.value))
+    buttons.append(button("Referral center", MainMenuCallback.REFERRAL.value))
     if show_admin:
-        builder.button(text="Admin panel", callback_data=MainMenuCallback.ADMIN.value)
-    builder.adjust(1)
-    return builder.as_markup()
+        buttons.append(button("Admin panel", MainMenuCallback.ADMIN.value))
+    return column(buttons)
 
 
+@lru_cache(maxsize=None)
 def back_keyboard(callback: str) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Back", callback_data=callback)
-    return builder.as_markup()
+    return column((button("Back", callback),))
+
+
+_PROFILE_KEYBOARD = column(
+    (
+        button("My orders", MainMenuCallback.ACCOUNT.value),
+        button("My referrals", MainMenuCallback.REFERRAL.value),
+        button("Back to menu", MainMenuCallback.HOME.value),
+    )
+)
+
+
+def profile_keyboard() -> InlineKeyboardMarkup:
+    return _PROFILE_KEYBOARD
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from app.bot.keyboards._labels import status_label
+from app.bot.keyboards._markup import button, column, rows_markup, url_button
+from app.bot.keyboards._pager import pager_row
 from app.bot.keyboards.main_menu import MainMenuCallback
 from app.infrastructure.db.models import Order
 from app.core.enums import OrderStatus
-from app.services.crypto_payment_service import OXAPAY_EXTRA_KEY
 from app.bot.keyboards.support import SUPPORT_ORDER_CREATE_PREFIX
 
 
@@ -22,13 +24,21 @@ ORDER_REISSUE_PREFIX = "order:reissue:"
 ORDER_FEEDBACK_START_PREFIX = "order:feedback:start:"
 ORDER_FEEDBACK_RATE_PREFIX = "order:feedback:rate:"
 
+_BACK_TO_MENU_BUTTON = button("Back to menu", MainMenuCallback.HOME.value)
+
+_REISSUABLE_STATUSES = frozenset({OrderStatus.CANCELLED, OrderStatus.EXPIRED})
+
+
+_ORDER_CONFIRM_KEYBOARD = column(
+    (
+        button("Confirm order", ORDER_CONFIRM_CALLBACK),
+        button("Cancel", ORDER_CANCEL_CALLBACK),
+    )
+)
+
 
 def order_confirm_keyboard() -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Confirm order", callback_data=ORDER_CONFIRM_CALLBACK)
-    builder.button(text="Cancel", callback_data=ORDER_CANCEL_CALLBACK)
-    builder.adjust(1)
-    return builder.as_markup()
+    return _ORDER_CONFIRM_KEYBOARD
 
 
 def orders_list_keyboard(
@@ -39,37 +49,11 @@ def orders_list_keyboard(
     has_prev: bool,
     has_next: bool,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for order in orders:
-        builder.button(
-            text=_order_summary_line(order),
-            callback_data=f"{ORDER_VIEW_PREFIX}{order.public_id}",
-        )
-    nav_buttons: list[InlineKeyboardButton] = []
-    if has_prev:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="◀️ Prev",
-                callback_data=f"{ORDER_LIST_PAGE_PREFIX}{page - 1}",
-            )
-        )
-    nav_buttons.append(
-        InlineKeyboardButton(
-            text="Refresh",
-            callback_data=f"{ORDER_LIST_PAGE_PREFIX}{page}",
-        )
-    )
-    if has_next:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="▶️ Next",
-                callback_data=f"{ORDER_LIST_PAGE_PREFIX}{page + 1}",
-            )
-        )
-    builder.row(*nav_buttons)
-    builder.button(text="Back to menu", callback_data=MainMenuCallback.HOME.value)
-    builder.adjust(1)
-    return builder.as_markup()
+    view_prefix = ORDER_VIEW_PREFIX
+    rows = [[button(_order_summary_line(order), view_prefix + order.public_id)] for order in orders]
+    rows.append(list(pager_row(ORDER_LIST_PAGE_PREFIX, page, has_prev, has_next)))
+    rows.append([_BACK_TO_MENU_BUTTON])
+    return rows_markup(rows)
 
 
 def order_details_keyboard(
@@ -79,68 +63,51 @@ def order_details_keyboard(
     page: int | None = None,
     include_support_button: bool = True,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    if pay_link and order.status == OrderStatus.AWAITING_PAYMENT:
-        builder.button(text="Open crypto checkout", url=pay_link)
-    builder.button(
-        text="Refresh status",
-        callback_data=f"{ORDER_VIEW_PREFIX}{order.public_id}",
-    )
-    if order.status == OrderStatus.AWAITING_PAYMENT:
-        builder.button(
-            text="Cancel order",
-            callback_data=f"{ORDER_CANCEL_ORDER_PREFIX}{order.public_id}",
-        )
-    if order.status in {OrderStatus.CANCELLED, OrderStatus.EXPIRED}:
-        builder.button(
-            text="Create new invoice",
-            callback_data=f"{ORDER_REISSUE_PREFIX}{order.public_id}",
-        )
+    public_id = order.public_id
+    status = order.status
+    buttons: list[InlineKeyboardButton] = []
+    if pay_link and status == OrderStatus.AWAITING_PAYMENT:
+        buttons.append(url_button("Open crypto checkout", pay_link))
+    buttons.append(button("Refresh status", ORDER_VIEW_PREFIX + public_id))
+    if status == OrderStatus.AWAITING_PAYMENT:
+        buttons.append(button("Cancel order", ORDER_CANCEL_ORDER_PREFIX + public_id))
+    if status in _REISSUABLE_STATUSES:
+        buttons.append(button("Create new invoice", ORDER_REISSUE_PREFIX + public_id))
     if include_support_button:
-        builder.button(
-            text="Need help with this order",
-            callback_data=f"{SUPPORT_ORDER_CREATE_PREFIX}{order.public_id}",
-        )
+        buttons.append(button("Need help with this order", SUPPORT_ORDER_CREATE_PREFIX + public_id))
     back_callback = (
         f"{ORDER_LIST_PAGE_PREFIX}{max(page or 0, 0)}"
         if page is not None
         else ORDER_LIST_BACK_CALLBACK
     )
-    builder.button(text="Back to orders", callback_data=back_callback)
-    builder.button(text="Back to menu", callback_data=MainMenuCallback.HOME.value)
-    builder.adjust(1)
-    return builder.as_markup()
+    buttons.append(button("Back to orders", back_callback))
+    buttons.append(_BACK_TO_MENU_BUTTON)
+    return column(buttons)
 
 
 def order_feedback_prompt_keyboard(order: Order) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="Leave feedback",
-        callback_data=f"{ORDER_FEEDBACK_START_PREFIX}{order.public_id}",
-    )
-    return builder.as_markup()
+    return column((button("Leave feedback", ORDER_FEEDBACK_START_PREFIX + order.public_id),))
 
 
 def order_feedback_rating_keyboard(public_id: str) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for rating in range(1, 6):
-        builder.button(
-            text=str(rating),
-            callback_data=f"{ORDER_FEEDBACK_RATE_PREFIX}{public_id}:{rating}",
-        )
-    builder.adjust(5)
-    builder.button(
-        text="Back to order",
-        callback_data=f"{ORDER_VIEW_PREFIX}{public_id}",
-    )
-    return builder.as_markup()
+    rate_prefix = f"{ORDER_FEEDBACK_RATE_PREFIX}{public_id}:"
+    row = [button(str(rating), rate_prefix + str(rating)) for rating in range(1, 6)]
+    row.append(button("Back to order", ORDER_VIEW_PREFIX + public_id))
+    return rows_markup([row])
+
+
+_BACK_TO_PRODUCTS_BUTTON = button("Back to menu", MainMenuCallback.PRODUCTS.value)
+
+
+def order_payment_keyboard(pay_link: str | None) -> InlineKeyboardMarkup:
+    if not pay_link:
+        return column((_BACK_TO_PRODUCTS_BUTTON,))
+    return column((url_button("Pay with crypto", pay_link), _BACK_TO_PRODUCTS_BUTTON))
 
 
+@lru_cache(maxsize=256)
 def order_cancel_keyboard(callback_data: str) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Cancel", callback_data=callback_data)
-    builder.adjust(1)
-    return builder.as_markup()
+    return column((button("Cancel", callback_data),))
 
 
 def _order_summary_line(order: Order) -> str:
@@ -149,23 +116,19 @@ def _order_summary_line(order: Order) -> str:
 
 
 def _order_display_status(order: Order) -> str:
-    base_status = order.status.value.replace("_", " ").title()
-    if order.status == OrderStatus.PAID:
-        extra = order.extra_attrs or {}
-        timeline_snapshot = extra.get("timeline_status")
-        if isinstance(timeline_snapshot, dict):
-            label = timeline_snapshot.get("label")
-            if label:
-                return label
-            status_key = timeline_snapshot.get("status")
-            if status_key:
-                return status_key.replace("_", " ").title()
-        meta = extra.get(OXAPAY_EXTRA_KEY)
-        if isinstance(meta, dict):
-            notice = meta.get("delivery_notice")
-            if isinstance(notice, dict) and notice.get("sent_at"):
-                return "Delivered"
-            fulfillment = meta.get("fulfillment")
-            if isinstance(fulfillment, dict) and fulfillment.get("delivered_at"):
-                return "Fulfilled"
-    return base_status
+    status = order.status
+    if status is not OrderStatus.PAID:
+        return status_label(status)
+    timeline_snapshot = (order.extra_attrs or {}).get("timeline_status")
+    if isinstance(timeline_snapshot, dict):
+        label = timeline_snapshot.get("label")
+        if label:
+            return label
+        status_key = timeline_snapshot.get("status")
+        if status_key:
+            return status_key.replace("_", " ").title()
+    if order.is_delivered:
+        return "Delivered"
+    if order.is_fulfilled:
+        return "Fulfilled"
+    return status_label(status)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable
 
 from aiogram.types import InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from app.bot.keyboards._markup import button, column
 from app.infrastructure.db.models import Category, Product
 
 PRODUCT_VIEW_PREFIX = "product:view:"
@@ -16,36 +17,34 @@ PRODUCT_CATEGORY_PREFIX = "product:category:"
 PRODUCT_CATEGORY_MENU_CALLBACK = "product:menu"
 PRODUCT_LIST_BACK_CALLBACK = "product:list_back"
 
+_ALL_PRODUCTS_BUTTON = button("All products", PRODUCT_ALL_CALLBACK)
+_BACK_TO_MENU_BUTTON = button("Back to menu", PRODUCT_BACK_CALLBACK)
+
 
 def products_list_keyboard(products: Iterable[Product], *, back_callback: str = PRODUCT_BACK_CALLBACK) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for product in products:
-        builder.button(
-            text=f"{product.name} - {product.price} {product.currency}",
-            callback_data=f"{PRODUCT_VIEW_PREFIX}{product.id}",
-        )
-    builder.button(text="Back", callback_data=back_callback)
-    builder.adjust(1)
-    return builder.as_markup()
+    view_prefix = PRODUCT_VIEW_PREFIX
+    buttons = [
+        button(f"{product.name} - {product.price} {product.currency}", view_prefix + str(product.id))
+        for product in products
+    ]
+    buttons.append(button("Back", back_callback))
+    return column(buttons)
 
 
+@lru_cache(maxsize=256)
 def product_details_keyboard(product_id: int, *, back_callback: str = PRODUCT_LIST_BACK_CALLBACK) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Purchase", callback_data=f"{PRODUCT_ORDER_PREFIX}{product_id}")
-    builder.button(text="Add to cart", callback_data=f"{PRODUCT_ADD_TO_CART_PREFIX}{product_id}")
-    builder.button(text="Back", callback_data=back_callback)
-    builder.adjust(1)
-    return builder.as_markup()
+    return column(
+        (
+            button("Purchase", f"{PRODUCT_ORDER_PREFIX}{product_id}"),
+            button("Add to cart", f"{PRODUCT_ADD_TO_CART_PREFIX}{product_id}"),
+            button("Back", back_callback),
+        )
+    )
 
 
 def product_category_keyboard(categories: Iterable[Category]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for category in categories:
-        builder.button(
-            text=category.name,
-            callback_data=f"{PRODUCT_CATEGORY_PREFIX}{category.id}",
-        )
-    builder.button(text="All products", callback_data=PRODUCT_ALL_CALLBACK)
-    builder.button(text="Back to menu", callback_data=PRODUCT_BACK_CALLBACK)
-    builder.adjust(1)
-    return builder.as_markup()
+    category_prefix = PRODUCT_CATEGORY_PREFIX
+    buttons = [button(category.name, category_prefix + str(category.id)) for category in categories]
+    buttons.append(_ALL_PRODUCTS_BUTTON)
+    buttons.append(_BACK_TO_MENU_BUTTON)
+    return column(buttons)
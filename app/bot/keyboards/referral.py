@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Sequence
 
 from aiogram.types import InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from app.bot.keyboards._markup import button, column
 from app.infrastructure.db.models import ReferralLink
 from app.bot.keyboards.main_menu import MainMenuCallback
 
@@ -18,35 +19,44 @@ REFERRAL_SHARE_PREFIX = "user:ref:share:"
 REFERRAL_EDIT_LABEL_PREFIX = "user:ref:edit_label:"
 REFERRAL_EDIT_REWARD_PREFIX = "user:ref:edit_reward:"
 
+_CREATE_BUTTON = button("Create new link", REFERRAL_CREATE)
+_REFRESH_BUTTON = button("Refresh", REFERRAL_REFRESH)
+_BACK_BUTTON = button("Back", REFERRAL_REFRESH)
+_BACK_TO_MENU_BUTTON = button("Back to menu", MainMenuCallback.HOME.value)
+
 
 def referral_dashboard_keyboard(links: Sequence[ReferralLink]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Create new link", callback_data=REFERRAL_CREATE)
+    link_prefix = REFERRAL_LINK_PREFIX
+    buttons = [_CREATE_BUTTON]
     for link in links:
-        label = (link.meta or {}).get("label") if link.meta else None
+        meta = link.meta
+        label = meta.get("label") if meta else None
         title = f"{label} ({link.code})" if label else f"Link {link.code}"
-        builder.button(text=title, callback_data=f"{REFERRAL_LINK_PREFIX}{link.id}")
-    builder.button(text="Refresh", callback_data=REFERRAL_REFRESH)
-    builder.button(text="Back to menu", callback_data=MainMenuCallback.HOME.value)
-    builder.adjust(1)
-    return builder.as_markup()
+        buttons.append(button(title, link_prefix + str(link.id)))
+    buttons.append(_REFRESH_BUTTON)
+    buttons.append(_BACK_TO_MENU_BUTTON)
+    return column(buttons)
 
 
 def referral_link_keyboard(link: ReferralLink) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Share link", callback_data=f"{REFERRAL_SHARE_PREFIX}{link.id}")
-    builder.button(text="View rewards", callback_data=f"{REFERRAL_REWARDS_PREFIX}{link.id}")
-    builder.button(text="Rename", callback_data=f"{REFERRAL_EDIT_LABEL_PREFIX}{link.id}")
-    builder.button(text="Adjust reward", callback_data=f"{REFERRAL_EDIT_REWARD_PREFIX}{link.id}")
-    builder.button(text="Delete", callback_data=f"{REFERRAL_DELETE_PREFIX}{link.id}")
-    builder.button(text="Back", callback_data=REFERRAL_REFRESH)
-    builder.adjust(1)
-    return builder.as_markup()
-
-
+    link_id = str(link.id)
+    return column(
+        (
+            button("Share link", REFERRAL_SHARE_PREFIX + link_id),
+            button("View rewards", REFERRAL_REWARDS_PREFIX + link_id),
+            button("Rename", REFERRAL_EDIT_LABEL_PREFIX + link_id),
+            button("Adjust reward", REFERRAL_EDIT_REWARD_PREFIX + link_id),
+            button("Delete", REFERRAL_DELETE_PREFIX + link_id),
+            _BACK_BUTTON,
+        )
+    )
+
+
+@lru_cache(maxsize=256)
 def referral_delete_confirm_keyboard(link_id: int) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Yes, remove", callback_data=f"{REFERRAL_CONFIRM_DELETE_PREFIX}{link_id}")
-    builder.button(text="Cancel", callback_data=f"{REFERRAL_LINK_PREFIX}{link_id}")
-    builder.adjust(1)
-    return builder.as_markup()
+    return column(
+        (
+            button("Yes, remove", f"{REFERRAL_CONFIRM_DELETE_PREFIX}{link_id}"),
+            button("Cancel", f"{REFERRAL_LINK_PREFIX}{link_id}"),
+        )
+    )
@@ -1,30 +1,30 @@
 ﻿from __future__ import annotations
 
-from aiogram.types import InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
+from functools import lru_cache
+from typing import Sequence
 
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from app.bot.keyboards._markup import button, column, url_button
 from app.infrastructure.db.models import RequiredChannel
 
 SUBSCRIPTION_REFRESH_CALLBACK = "subscription:refresh"
+SUBSCRIPTION_NO_LINK_CALLBACK = "subscription:no_link"
 
+_REFRESH_BUTTON = button("I've Joined", SUBSCRIPTION_REFRESH_CALLBACK)
 
-def build_subscription_keyboard(channels: list[RequiredChannel]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
 
-    for channel in channels:
-        if channel.username:
-            url = f"https://t.me/{channel.username.lstrip('@')}"
-        elif channel.invite_link:
-            url = channel.invite_link
-        else:
-            url = None
+def build_subscription_keyboard(channels: Sequence[RequiredChannel]) -> InlineKeyboardMarkup:
+    buttons = [_channel_button(channel.username, channel.invite_link, channel.title) for channel in channels]
+    buttons.append(_REFRESH_BUTTON)
+    return column(buttons)
 
-        label = channel.title or channel.username or "Channel"
-        if url:
-            builder.button(text=f"Join {label}", url=url)
-        else:
-            builder.button(text=label, callback_data="subscription:no_link")
 
-    builder.button(text="I've Joined", callback_data=SUBSCRIPTION_REFRESH_CALLBACK)
-    builder.adjust(1)
-    return builder.as_markup()
+@lru_cache(maxsize=256)
+def _channel_button(username: str | None, invite_link: str | None, title: str | None) -> InlineKeyboardButton:
+    label = title or username or "Channel"
+    if username:
+        return url_button(f"Join {label}", f"https://t.me/{username.lstrip('@')}")
+    if invite_link:
+        return url_button(f"Join {label}", invite_link)
+    return button(label, SUBSCRIPTION_NO_LINK_CALLBACK)
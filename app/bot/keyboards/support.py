@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable, Sequence
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
-from aiogram.utils.keyboard import InlineKeyboardBuilder
 
-from app.core.enums import SupportTicketStatus
+from app.bot.keyboards._labels import CLOSED_TICKET_STATUSES, status_label
+from app.bot.keyboards._markup import button, column, grid, rows_markup
+from app.bot.keyboards._pager import NEXT_TEXT, PREV_TEXT, pager_row
 from app.infrastructure.db.models import Order, SupportTicket
 
 SUPPORT_NEW_TICKET = "support:new"
@@ -24,25 +26,27 @@ SUPPORT_TICKET_REPLY_PREFIX = "support:reply:"
 SUPPORT_TICKET_RESOLVE_PREFIX = "support:resolve:"
 SUPPORT_TICKET_REOPEN_PREFIX = "support:reopen:"
 
+_BACK_TO_MENU_BUTTON = button("Back to menu", SUPPORT_BACK_MAIN)
+_BACK_TO_TICKETS_BUTTON = button("Back to tickets", SUPPORT_MY_TICKETS)
+_CANCEL_BUTTON = button("Cancel", SUPPORT_CANCEL)
+_SKIP_ORDER_BUTTON = button("Skip", f"{SUPPORT_ORDER_SELECT_PREFIX}-")
 
+
+@lru_cache(maxsize=None)
 def support_main_keyboard(has_tickets: bool) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="🆕 New support ticket", callback_data=SUPPORT_NEW_TICKET)
+    buttons = [button("🆕 New support ticket", SUPPORT_NEW_TICKET)]
     if has_tickets:
-        builder.button(text="🗂 My tickets", callback_data=SUPPORT_MY_TICKETS)
-    builder.button(text="Back to menu", callback_data=SUPPORT_BACK_MAIN)
-    builder.adjust(1)
-    return builder.as_markup()
+        buttons.append(button("🗂 My tickets", SUPPORT_MY_TICKETS))
+    buttons.append(_BACK_TO_MENU_BUTTON)
+    return column(buttons)
 
 
 def support_categories_keyboard(categories: Iterable[str]) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for category in categories:
-        builder.button(text=category, callback_data=f"{SUPPORT_CATEGORY_PREFIX}{category}")
-    builder.button(text="Skip", callback_data=f"{SUPPORT_CATEGORY_PREFIX}-")
-    builder.button(text="Cancel", callback_data=SUPPORT_CANCEL)
-    builder.adjust(2)
-    return builder.as_markup()
+    category_prefix = SUPPORT_CATEGORY_PREFIX
+    buttons = [button(category, category_prefix + category) for category in categories]
+    buttons.append(button("Skip", f"{SUPPORT_CATEGORY_PREFIX}-"))
+    buttons.append(_CANCEL_BUTTON)
+    return grid(buttons, 2)
 
 
 def support_orders_keyboard(
@@ -52,38 +56,30 @@ def support_orders_keyboard(
     has_prev: bool,
     has_next: bool,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for order in orders:
-        product_name = getattr(order.product, "name", "Order")
-        builder.button(
-            text=f"{product_name[:32]} • {order.total_amount} {order.currency}",
-            callback_data=f"{SUPPORT_ORDER_SELECT_PREFIX}{order.public_id}",
-        )
-    nav_buttons: list[InlineKeyboardButton] = []
-    if has_prev:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="◀️ Prev",
-                callback_data=f"{SUPPORT_ORDER_PAGE_PREFIX}{page - 1}",
+    select_prefix = SUPPORT_ORDER_SELECT_PREFIX
+    rows = [
+        [
+            button(
+                f"{getattr(order.product, 'name', 'Order')[:32]} • {order.total_amount} {order.currency}",
+                select_prefix + order.public_id,
             )
-        )
-    nav_buttons.append(
-        InlineKeyboardButton(
-            text="Skip",
-            callback_data=f"{SUPPORT_ORDER_SELECT_PREFIX}-",
-        )
-    )
+        ]
+        for order in orders
+    ]
+    rows.append(list(_order_picker_nav_row(page, has_prev, has_next)))
+    rows.append([_CANCEL_BUTTON])
+    return rows_markup(rows)
+
+
+@lru_cache(maxsize=256)
+def _order_picker_nav_row(page: int, has_prev: bool, has_next: bool) -> tuple[InlineKeyboardButton, ...]:
+    buttons: list[InlineKeyboardButton] = []
+    if has_prev:
+        buttons.append(button(PREV_TEXT, f"{SUPPORT_ORDER_PAGE_PREFIX}{page - 1}"))
+    buttons.append(_SKIP_ORDER_BUTTON)
     if has_next:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="▶️ Next",
-                callback_data=f"{SUPPORT_ORDER_PAGE_PREFIX}{page + 1}",
-            )
-        )
-    builder.row(*nav_buttons)
-    builder.button(text="Cancel", callback_data=SUPPORT_CANCEL)
-    builder.adjust(1)
-    return builder.as_markup()
+        buttons.append(button(NEXT_TEXT, f"{SUPPORT_ORDER_PAGE_PREFIX}{page + 1}"))
+    return tuple(buttons)
 
 
 def support_ticket_list_keyboard(
@@ -93,61 +89,35 @@ def support_ticket_list_keyboard(
     has_prev: bool,
     has_next: bool,
 ) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    for ticket in tickets:
-        label = _ticket_summary_line(ticket)
-        builder.button(text=label, callback_data=f"{SUPPORT_TICKET_VIEW_PREFIX}{ticket.public_id}")
-    nav_buttons: list[InlineKeyboardButton] = []
-    if has_prev:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="◀️ Prev",
-                callback_data=f"{SUPPORT_TICKET_LIST_PAGE_PREFIX}{page - 1}",
-            )
-        )
-    nav_buttons.append(
-        InlineKeyboardButton(
-            text="Refresh",
-            callback_data=f"{SUPPORT_TICKET_LIST_PAGE_PREFIX}{page}",
-        )
-    )
-    if has_next:
-        nav_buttons.append(
-            InlineKeyboardButton(
-                text="▶️ Next",
-                callback_data=f"{SUPPORT_TICKET_LIST_PAGE_PREFIX}{page + 1}",
-            )
-        )
-    builder.row(*nav_buttons)
-    builder.button(text="Back", callback_data=SUPPORT_BACK_MAIN)
-    builder.adjust(1)
-    return builder.as_markup()
+    view_prefix = SUPPORT_TICKET_VIEW_PREFIX
+    rows = [[button(_ticket_summary_line(ticket), view_prefix + ticket.public_id)] for ticket in tickets]
+    rows.append(list(pager_row(SUPPORT_TICKET_LIST_PAGE_PREFIX, page, has_prev, has_next)))
+    rows.append([button("Back", SUPPORT_BACK_MAIN)])
+    return rows_markup(rows)
 
 
 def support_ticket_detail_keyboard(ticket: SupportTicket) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(text="Reply", callback_data=f"{SUPPORT_TICKET_REPLY_PREFIX}{ticket.public_id}")
-    if ticket.status in {SupportTicketStatus.RESOLVED, SupportTicketStatus.ARCHIVED}:
-        builder.button(text="Reopen", callback_data=f"{SUPPORT_TICKET_REOPEN_PREFIX}{ticket.public_id}")
+    public_id = ticket.public_id
+    if ticket.status in CLOSED_TICKET_STATUSES:
+        toggle = button("Reopen", SUPPORT_TICKET_REOPEN_PREFIX + public_id)
     else:
-        builder.button(text="Mark resolved", callback_data=f"{SUPPORT_TICKET_RESOLVE_PREFIX}{ticket.public_id}")
-    builder.button(text="Back to tickets", callback_data=SUPPORT_MY_TICKETS)
-    builder.button(text="Back to menu", callback_data=SUPPORT_BACK_MAIN)
-    builder.adjust(1)
-    return builder.as_markup()
+        toggle = button("Mark resolved", SUPPORT_TICKET_RESOLVE_PREFIX + public_id)
+    return column(
+        (
+            button("Reply", SUPPORT_TICKET_REPLY_PREFIX + public_id),
+            toggle,
+            _BACK_TO_TICKETS_BUTTON,
+            _BACK_TO_MENU_BUTTON,
+        )
+    )
 
 
 def support_ticket_notification_keyboard(ticket: SupportTicket) -> InlineKeyboardMarkup:
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="View ticket",
-        callback_data=f"{SUPPORT_TICKET_VIEW_PREFIX}{ticket.public_id}",
-    )
-    return builder.as_markup()
+    return column((button("View ticket", SUPPORT_TICKET_VIEW_PREFIX + ticket.public_id),))
 
 
 def _ticket_summary_line(ticket: SupportTicket) -> str:
-    status = ticket.status.value.replace("_", " ").title()
+    status = status_label(ticket.status)
     subject = ticket.subject[:40]
     if ticket.order is not None:
         return f"{status} • {subject} • #{ticket.order.public_id[:6]}"
@@ -1,6 +1,6 @@
 ﻿from __future__ import annotations
 
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Iterable
 
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
@@ -9,8 +9,9 @@ from app.core.logging import get_logger
 
 
 class OwnerAccessMiddleware(BaseMiddleware):
-    def __init__(self, owner_ids: set[int]) -> None:
-        self.owner_ids = owner_ids
+    def __init__(self, owner_ids: Iterable[int]) -> None:
+        self.owner_ids: frozenset[int] = frozenset(owner_ids)
+        self._restricted = bool(self.owner_ids)
         self._log = get_logger(__name__)
 
     async def __call__(
@@ -19,11 +20,14 @@ class OwnerAccessMiddleware(BaseMiddleware):
         event: TelegramObject,
         data: dict[str, Any],
     ) -> Any:
+        if not self._restricted:
+            return await handler(event, data)
+
         user = data.get("event_from_user")
         if user is None:
             return await handler(event, data)
 
-        if self.owner_ids and user.id not in self.owner_ids:
+        if user.id not in self.owner_ids:
             self._log.warning("unauthorized_access", user_id=user.id, username=user.username)
             bot = data.get("bot")
             if bot is not None:
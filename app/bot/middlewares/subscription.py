@@ -1,21 +1,43 @@
 ﻿from __future__ import annotations
 
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Sequence
 
 from aiogram import BaseMiddleware
-from aiogram.types import CallbackQuery, Message, TelegramObject
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message, TelegramObject
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.bot.keyboards.subscription import build_subscription_keyboard, SUBSCRIPTION_REFRESH_CALLBACK
 from app.core.config import get_settings
-from app.infrastructure.db.repositories import RequiredChannelRepository
+from app.infrastructure.db.models import RequiredChannel
 from app.services.membership_service import MembershipService
 
+_PROMPT_TEXT = (
+    "Please join the required channel(s) to access this bot."
+    "\nTap 'I've Joined' after subscribing to continue."
+)
+
+
+async def _prompt_message(event: Message, keyboard: InlineKeyboardMarkup | None) -> None:
+    await event.answer(_PROMPT_TEXT, reply_markup=keyboard)
+
+
+async def _prompt_callback(event: CallbackQuery, keyboard: InlineKeyboardMarkup | None) -> None:
+    await event.answer("Access denied. Please join the required channels first.", show_alert=True)
+    if event.message:
+        await event.message.edit_text(_PROMPT_TEXT, reply_markup=keyboard)
+
+
+_PROMPT_HANDLERS: dict[type, Callable[[Any, InlineKeyboardMarkup | None], Awaitable[None]]] = {
+    Message: _prompt_message,
+    CallbackQuery: _prompt_callback,
+}
+
 
 class SubscriptionMiddleware(BaseMiddleware):
     def __init__(self, membership_service: MembershipService) -> None:
         self._membership_service = membership_service
-        self._settings = get_settings()
+        self._owner_ids = frozenset(get_settings().owner_user_ids)
+        self._keyboard_cache: tuple[Sequence[RequiredChannel], InlineKeyboardMarkup] | None = None
 
     async def __call__(
         self,
@@ -30,14 +52,16 @@ class SubscriptionMiddleware(BaseMiddleware):
         if session is None or bot is None or user is None:
             return await handler(event, data)
 
-        if user.id in self._settings.owner_user_ids:
+        if user.id in self._owner_ids:
             return await handler(event, data)
 
         if isinstance(event, CallbackQuery) and event.data == SUBSCRIPTION_REFRESH_CALLBACK:
             return await handler(event, data)
 
-        channel_repo = RequiredChannelRepository(session)
-        channels = await channel_repo.list_active()
+        if self._membership_service.has_cached_access(user.id):
+            return await handler(event, data)
+
+        channels = await self._membership_service.get_active_channels(session)
         is_allowed = await self._membership_service.user_can_access(
             bot=bot,
             user_id=user.id,
@@ -48,16 +72,18 @@ class SubscriptionMiddleware(BaseMiddleware):
         if is_allowed:
             return await handler(event, data)
 
-        keyboard = build_subscription_keyboard(list(channels)) if channels else None
-        message_text = (
-            "Please join the required channel(s) to access this bot."
-            "\nTap 'I've Joined' after subscribing to continue."
-        )
-
-        if isinstance(event, Message):
-            await event.answer(message_text, reply_markup=keyboard)
-        elif isinstance(event, CallbackQuery):
-            await event.answer("Access denied. Please join the required channels first.", show_alert=True)
-            if event.message:
-                await event.message.edit_text(message_text, reply_markup=keyboard)
+        keyboard = self._subscription_keyboard(channels) if channels else None
+        prompt = _PROMPT_HANDLERS.get(type(event))
+        if prompt is not None:
+            await prompt(event, keyboard)
         return None
+
+    def _subscription_keyboard(self, channels: Sequence[RequiredChannel]) -> InlineKeyboardMarkup:
+        # get_active_channels hands back the same sequence until its cache expires,
+        # so every blocked user in that window shares one markup object.
+        cached = self._keyboard_cache
+        if cached is not None and cached[0] is channels:
+            return cached[1]
+        keyboard = build_subscription_keyboard(channels)
+        self._keyboard_cache = (channels, keyboard)
+        return keyboard
@@ -1,16 +1,45 @@
 ﻿from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any, Awaitable, Callable
 
 from aiogram import BaseMiddleware
 from aiogram.types import CallbackQuery, Message, TelegramObject
+from sqlalchemy import event as sa_event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.db.repositories import UserRepository
 
 
+LAST_SEEN_THROTTLE_SECONDS = 300.0
+SEEN_CACHE_MAX_SIZE = 50_000
+
+_BLOCKED_TEXT = "Access to this bot has been restricted."
+
+
+async def _notify_blocked_callback(event: CallbackQuery) -> None:
+    await event.answer(_BLOCKED_TEXT, show_alert=True)
+
+
+async def _notify_blocked_message(event: Message) -> None:
+    await event.answer(_BLOCKED_TEXT)
+
+
+_BLOCKED_NOTIFIERS: dict[type, Callable[[Any], Awaitable[None]]] = {
+    CallbackQuery: _notify_blocked_callback,
+    Message: _notify_blocked_message,
+}
+
+
 class UserContextMiddleware(BaseMiddleware):
+    def __init__(self) -> None:
+        # telegram_id -> (monotonic time of the last committed upsert, identity fields written then),
+        # kept in write order so the stalest entries sit at the front.
+        self._seen: OrderedDict[int, tuple[float, tuple[str | None, ...]]] = OrderedDict()
+
     async def __call__(
         self,
         handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
@@ -24,27 +53,50 @@ class UserContextMiddleware(BaseMiddleware):
             return await handler(event, data)
 
         repo = UserRepository(session)
-        profile, created = await repo.upsert_from_telegram(
-            telegram_id=user.id,
-            username=user.username,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            language_code=user.language_code,
-            last_seen_at=datetime.now(tz=timezone.utc),
-        )
+        profile = None
+        created = False
+        identity = (user.username, user.first_name, user.last_name, user.language_code)
+        now = time.monotonic()
+        seen = self._seen.get(user.id)
+        if seen is not None and now - seen[0] < LAST_SEEN_THROTTLE_SECONDS and seen[1] == identity:
+            profile = await repo.get_by_telegram_id(user.id)
+        if profile is None:
+            profile, created = await repo.upsert_from_telegram(
+                telegram_id=user.id,
+                username=user.username,
+                first_name=user.first_name,
+                last_name=user.last_name,
+                language_code=user.language_code,
+                last_seen_at=datetime.now(tz=timezone.utc),
+            )
+            sa_event.listen(
+                session.sync_session,
+                "after_commit",
+                partial(self._remember, user.id, now, identity),
+                once=True,
+            )
 
         data["user_profile"] = profile
         data["user_profile_created"] = created
 
         if profile.is_blocked:
-            if isinstance(event, CallbackQuery):
-                await event.answer("Access to this bot has been restricted.", show_alert=True)
-            elif isinstance(event, Message):
-                await event.answer("Access to this bot has been restricted.")
+            notify = _BLOCKED_NOTIFIERS.get(type(event))
+            if notify is not None:
+                await notify(event)
             else:
                 bot = data.get("bot")
                 if bot is not None:
-                    await bot.send_message(chat_id=user.id, text="Access to this bot has been restricted.")
+                    await bot.send_message(chat_id=user.id, text=_BLOCKED_TEXT)
             return None
 
         return await handler(event, data)
+
+    def _remember(self, telegram_id: int, seen_at: float, identity: tuple[str | None, ...], _session: Any) -> None:
+        seen = self._seen
+        seen.pop(telegram_id, None)
+        seen[telegram_id] = (seen_at, identity)
+        while seen:
+            oldest_at = next(iter(seen.values()))[0]
+            if seen_at - oldest_at < LAST_SEEN_THROTTLE_SECONDS and len(seen) <= SEEN_CACHE_MAX_SIZE:
+                break
+            seen.popitem(last=False)
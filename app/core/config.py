@@ -1,17 +1,33 @@
 ﻿from __future__ import annotations
 
-from functools import lru_cache
-from typing import List
+import re
+from functools import cached_property
+from typing import Any, Callable, Sequence, Tuple
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_CSV_SEPARATOR = re.compile(r"\s*,\s*")
+_FEE_PAYERS = frozenset({"payer", "merchant"})
+_REFERRAL_REWARD_TYPES = frozenset({"bonus", "commission"})
+
+
+def _split_csv(value: Any, *, cast: Callable[[str], Any] | None = None, upper: bool = False) -> tuple:
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    if not value:
+        return ()
+    items = [item for item in _CSV_SEPARATOR.split(str(value).strip()) if item]
+    if upper:
+        items = [item.upper() for item in items]
+    return tuple(map(cast, items)) if cast is not None else tuple(items)
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
     bot_token: str = Field(..., alias="BOT_TOKEN")
-    owner_user_ids: List[int] = Field(default_factory=list, alias="BOT_OWNER_USER_IDS")
+    owner_user_ids: Tuple[int, ...] = Field(default_factory=tuple, alias="BOT_OWNER_USER_IDS")
 
     db_host: str = Field("mariadb", alias="DB_HOST")
     db_port: int = Field(3306, alias="DB_PORT")
@@ -26,8 +42,8 @@ class Settings(BaseSettings):
         alias="REQUIRE_SUBSCRIPTION_DEFAULT",
         description="Toggle enforcing channel membership for new users.",
     )
-    required_channels_default: List[str] = Field(
-        default_factory=list,
+    required_channels_default: Tuple[str, ...] = Field(
+        default_factory=tuple,
         alias="REQUIRED_CHANNELS_DEFAULT",
         description="List of Telegram usernames/IDs required for subscription.",
     )
@@ -113,8 +129,8 @@ class Settings(BaseSettings):
         alias="REFERRAL_ALLOW_PUBLIC_DEFAULT",
         description="Allow all users to create referral links by default.",
     )
-    referral_reseller_ids_default: List[int] = Field(
-        default_factory=list,
+    referral_reseller_ids_default: Tuple[int, ...] = Field(
+        default_factory=tuple,
         alias="REFERRAL_RESELLER_IDS_DEFAULT",
         description="Comma separated list of Telegram user IDs with reseller privileges.",
     )
@@ -154,8 +170,8 @@ class Settings(BaseSettings):
         alias="OXAPAY_SANDBOX",
         description="Run OxaPay requests in sandbox mode.",
     )
-    oxapay_default_currencies: List[str] = Field(
-        default_factory=list,
+    oxapay_default_currencies: Tuple[str, ...] = Field(
+        default_factory=tuple,
         alias="OXAPAY_DEFAULT_CURRENCIES",
         description="Comma separated list of crypto currencies enabled by default.",
     )
@@ -207,41 +223,23 @@ class Settings(BaseSettings):
 
     @field_validator("owner_user_ids", mode="before")
     @classmethod
-    def split_owner_ids(cls, value: str | List[int]) -> List[int]:
-        if isinstance(value, list):
-            return value
-        if not value:
-            return []
-        items = [item.strip() for item in str(value).split(",") if item.strip()]
-        return [int(item) for item in items]
+    def split_owner_ids(cls, value: str | Sequence[int]) -> Tuple[int, ...]:
+        return _split_csv(value, cast=int)
 
     @field_validator("required_channels_default", mode="before")
     @classmethod
-    def split_required_channels(cls, value: str | List[str]) -> List[str]:
-        if isinstance(value, list):
-            return value
-        if not value:
-            return []
-        return [item.strip() for item in str(value).split(",") if item.strip()]
+    def split_required_channels(cls, value: str | Sequence[str]) -> Tuple[str, ...]:
+        return _split_csv(value)
 
     @field_validator("oxapay_default_currencies", mode="before")
     @classmethod
-    def split_oxapay_currencies(cls, value: str | List[str]) -> List[str]:
-        if isinstance(value, list):
-            return value
-        if not value:
-            return []
-        return [item.strip().upper() for item in str(value).split(",") if item.strip()]
+    def split_oxapay_currencies(cls, value: str | Sequence[str]) -> Tuple[str, ...]:
+        return _split_csv(value, upper=True)
 
     @field_validator("referral_reseller_ids_default", mode="before")
     @classmethod
-    def split_referral_resellers(cls, value: str | List[int]) -> List[int]:
-        if isinstance(value, list):
-            return value
-        if not value:
-            return []
-        items = [item.strip() for item in str(value).split(",") if item.strip()]
-        return [int(item) for item in items]
+    def split_referral_resellers(cls, value: str | Sequence[int]) -> Tuple[int, ...]:
+        return _split_csv(value, cast=int)
 
     @field_validator("referral_reward_type_default", mode="before")
     @classmethod
@@ -249,7 +247,7 @@ class Settings(BaseSettings):
         if not value:
             return "bonus"
         lowered = str(value).strip().lower()
-        if lowered not in {"bonus", "commission"}:
+        if lowered not in _REFERRAL_REWARD_TYPES:
             return "bonus"
         return lowered
 
@@ -257,18 +255,18 @@ class Settings(BaseSettings):
     @classmethod
     def normalise_fee_payer(cls, value: str) -> str:
         value = (value or "").strip().lower()
-        if value not in {"payer", "merchant"}:
+        if value not in _FEE_PAYERS:
             return "merchant"
         return value
 
-    @property
+    @cached_property
     def db_async_url(self) -> str:
         return (
             f"mysql+asyncmy://{self.db_user}:{self.db_password}"
             f"@{self.db_host}:{self.db_port}/{self.db_name}"
         )
 
-    @property
+    @cached_property
     def db_sync_url(self) -> str:
         return (
             f"mysql+pymysql://{self.db_user}:{self.db_password}"
@@ -276,6 +274,12 @@ class Settings(BaseSettings):
         )
 
 
-@lru_cache(maxsize=1)
+_SETTINGS: Settings | None = None
+
+
 def get_settings() -> Settings:
-    return Settings()
+    global _SETTINGS
+    settings = _SETTINGS
+    if settings is None:
+        settings = _SETTINGS = Settings()
+    return settings
@@ -1,33 +1,22 @@
 import logging
 import sys
+from functools import partial
 from typing import Any
 
 import orjson
 import structlog
 from structlog.stdlib import BoundLogger
 
+_LEVELS = logging.getLevelNamesMapping()
+_DUMPS = partial(orjson.dumps, default=repr, option=orjson.OPT_NON_STR_KEYS)
+
 
 def _resolve_level(level_name: str) -> int:
-    normalized = level_name.upper()
-    if normalized not in logging.getLevelNamesMapping():
-        return logging.INFO
-    resolved = logging.getLevelName(normalized)
-    return resolved if isinstance(resolved, int) else logging.INFO
-
-
-def _orjson_dumps(
-    obj: Any,
-    *,
-    default: Any | None = None,
-    option: int | None = None,
-    **_: Any,
-) -> str:
-    dump_kwargs: dict[str, Any] = {
-        "option": orjson.OPT_NON_STR_KEYS if option is None else option | orjson.OPT_NON_STR_KEYS
-    }
-    if default is not None:
-        dump_kwargs["default"] = default
-    return orjson.dumps(obj, **dump_kwargs).decode()
+    return _LEVELS.get(level_name.upper(), logging.INFO)
+
+
+def _render_json(_: Any, __: str, event_dict: dict[str, Any]) -> bytes:
+    return _DUMPS(event_dict)
 
 
 def configure_logging(level_name: str) -> None:
@@ -41,11 +30,11 @@ def configure_logging(level_name: str) -> None:
             structlog.processors.add_log_level,
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+            _render_json,
         ],
         wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        logger_factory=structlog.BytesLoggerFactory(sys.stdout.buffer),
         cache_logger_on_first_use=True,
     )
 
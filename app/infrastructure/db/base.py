@@ -1,6 +1,8 @@
 ﻿from __future__ import annotations
 
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache
 
 from sqlalchemy import DateTime, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -10,6 +12,11 @@ class Base(DeclarativeBase):
     pass
 
 
+@lru_cache(maxsize=None)
+def enum_values(enum: type[Enum]) -> tuple[str, ...]:
+    return tuple(item.value for item in enum)
+
+
 class IntPKMixin:
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
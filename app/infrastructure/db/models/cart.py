@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 from decimal import Decimal
 
 from sqlalchemy import DateTime, Enum, ForeignKey, JSON, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.enums import CartAdjustmentType, CartStatus
-from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin
+from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin, enum_values
+
+
+_ZERO = Decimal("0.00")
+_CART_STATUS_TYPE = Enum(CartStatus, native_enum=False, length=32, values_callable=enum_values)
+_ADJUSTMENT_KIND_TYPE = Enum(CartAdjustmentType, native_enum=False, length=32, values_callable=enum_values)
 
 
 class ShoppingCart(IntPKMixin, TimestampMixin, Base):
@@ -16,22 +21,17 @@ class ShoppingCart(IntPKMixin, TimestampMixin, Base):
     public_id: Mapped[str] = mapped_column(String(length=36), unique=True, nullable=False)
     user_id: Mapped[int | None] = mapped_column(ForeignKey("user_profiles.id"), nullable=True)
     status: Mapped[CartStatus] = mapped_column(
-        Enum(
-            CartStatus,
-            native_enum=False,
-            length=32,
-            values_callable=lambda enum: [item.value for item in enum],
-        ),
+        _CART_STATUS_TYPE,
         default=CartStatus.ACTIVE,
         nullable=False,
     )
     currency: Mapped[str] = mapped_column(String(length=3), nullable=False)
     expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    subtotal_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=Decimal("0.00"), nullable=False)
-    discount_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=Decimal("0.00"), nullable=False)
-    tax_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=Decimal("0.00"), nullable=False)
-    shipping_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=Decimal("0.00"), nullable=False)
-    total_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=Decimal("0.00"), nullable=False)
+    subtotal_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=_ZERO, nullable=False)
+    discount_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=_ZERO, nullable=False)
+    tax_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=_ZERO, nullable=False)
+    shipping_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=_ZERO, nullable=False)
+    total_amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=_ZERO, nullable=False)
     discount_code: Mapped[str | None] = mapped_column(String(length=64))
     notes: Mapped[str | None] = mapped_column(Text())
     meta: Mapped[dict | None] = mapped_column(JSON())
@@ -73,12 +73,7 @@ class CartAdjustment(IntPKMixin, TimestampMixin, Base):
 
     cart_id: Mapped[int] = mapped_column(ForeignKey("shopping_carts.id"), nullable=False)
     kind: Mapped[CartAdjustmentType] = mapped_column(
-        Enum(
-            CartAdjustmentType,
-            native_enum=False,
-            length=32,
-            values_callable=lambda enum: [item.value for item in enum],
-        ),
+        _ADJUSTMENT_KIND_TYPE,
         nullable=False,
     )
     code: Mapped[str | None] = mapped_column(String(length=64))
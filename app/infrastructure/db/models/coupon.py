@@ -8,7 +8,7 @@ from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, JSON, Numeric, Strin
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.enums import CouponStatus, CouponType
-from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin
+from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin, enum_values
 
 
 class Coupon(IntPKMixin, TimestampMixin, Base):
@@ -22,7 +22,7 @@ class Coupon(IntPKMixin, TimestampMixin, Base):
             CouponType,
             native_enum=False,
             length=32,
-            values_callable=lambda enum: [item.value for item in enum],
+            values_callable=enum_values,
         ),
         nullable=False,
     )
@@ -31,7 +31,7 @@ class Coupon(IntPKMixin, TimestampMixin, Base):
             CouponStatus,
             native_enum=False,
             length=16,
-            values_callable=lambda enum: [item.value for item in enum],
+            values_callable=enum_values,
         ),
         nullable=False,
         default=CouponStatus.ACTIVE,
@@ -6,7 +6,7 @@ from sqlalchemy import Enum, ForeignKey, Numeric, String, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.enums import LoyaltyTransactionType
-from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin
+from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin, enum_values
 
 
 class LoyaltyAccount(IntPKMixin, TimestampMixin, Base):
@@ -36,7 +36,7 @@ class LoyaltyTransaction(IntPKMixin, TimestampMixin, Base):
             LoyaltyTransactionType,
             native_enum=False,
             length=16,
-            values_callable=lambda enum: [item.value for item in enum],
+            values_callable=enum_values,
         ),
         nullable=False,
     )
@@ -20,7 +20,9 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.enums import OrderStatus
-from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin
+from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin, enum_values
+
+OXAPAY_EXTRA_KEY = "oxapay_payment"
 
 
 class Order(IntPKMixin, TimestampMixin, Base):
@@ -35,7 +37,7 @@ class Order(IntPKMixin, TimestampMixin, Base):
             OrderStatus,
             native_enum=False,
             length=32,
-            values_callable=lambda enum: [item.value for item in enum],
+            values_callable=enum_values,
         ),
         default=OrderStatus.DRAFT,
         nullable=False,
@@ -52,7 +54,7 @@ class Order(IntPKMixin, TimestampMixin, Base):
     service_started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     service_paused_total_seconds: Mapped[int] = mapped_column(Integer(), default=0, nullable=False)
     service_paused_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    replacement_of_id: Mapped[int | None] = mapped_column(ForeignKey("orders.id"))
+    replacement_of_id: Mapped[int | None] = mapped_column(ForeignKey("orders.id", ondelete="SET NULL"))
 
     notes: Mapped[str | None] = mapped_column(String(length=512))
     extra_attrs: Mapped[dict | None] = mapped_column(JSON())
@@ -96,7 +98,7 @@ class Order(IntPKMixin, TimestampMixin, Base):
     replacements: Mapped[list["Order"]] = relationship(
         "Order",
         back_populates="replacement_parent",
-        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     instant_items: Mapped[list["InstantInventoryItem"]] = relationship(
         "InstantInventoryItem",
@@ -104,6 +106,23 @@ class Order(IntPKMixin, TimestampMixin, Base):
         cascade="all, delete-orphan",
     )
 
+    def _oxapay_section(self, key: str) -> dict | None:
+        meta = (self.extra_attrs or {}).get(OXAPAY_EXTRA_KEY)
+        if not isinstance(meta, dict):
+            return None
+        section = meta.get(key)
+        return section if isinstance(section, dict) else None
+
+    @property
+    def is_fulfilled(self) -> bool:
+        fulfillment = self._oxapay_section("fulfillment")
+        return bool(fulfillment and fulfillment.get("delivered_at"))
+
+    @property
+    def is_delivered(self) -> bool:
+        notice = self._oxapay_section("delivery_notice")
+        return bool(notice and notice.get("sent_at"))
+
 
 class OrderAnswer(IntPKMixin, TimestampMixin, Base):
     __tablename__ = "order_answers"
@@ -4,7 +4,7 @@ from sqlalchemy import Boolean, Enum, ForeignKey, Integer, JSON, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.enums import ProductQuestionType
-from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin
+from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin, enum_values
 
 
 class ProductQuestion(IntPKMixin, TimestampMixin, Base):
@@ -21,7 +21,7 @@ class ProductQuestion(IntPKMixin, TimestampMixin, Base):
             ProductQuestionType,
             native_enum=False,
             length=32,
-            values_callable=lambda enum: [item.value for item in enum],
+            values_callable=enum_values,
         ),
         default=ProductQuestionType.TEXT,
         nullable=False,
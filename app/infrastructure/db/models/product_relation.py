@@ -4,7 +4,7 @@ from sqlalchemy import Enum, ForeignKey, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.enums import ProductRelationType
-from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin
+from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin, enum_values
 
 
 class ProductRelation(IntPKMixin, TimestampMixin, Base):
@@ -17,7 +17,7 @@ class ProductRelation(IntPKMixin, TimestampMixin, Base):
             ProductRelationType,
             native_enum=False,
             length=32,
-            values_callable=lambda enum: [item.value for item in enum],
+            values_callable=enum_values,
         ),
         nullable=False,
     )
@@ -8,7 +8,7 @@ from sqlalchemy import DateTime, Enum, ForeignKey, JSON, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.enums import LoyaltyTransactionType, ReferralRewardType
-from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin
+from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin, enum_values
 
 
 class ReferralLink(IntPKMixin, TimestampMixin, Base):
@@ -22,7 +22,7 @@ class ReferralLink(IntPKMixin, TimestampMixin, Base):
             ReferralRewardType,
             native_enum=False,
             length=16,
-            values_callable=lambda enum: [item.value for item in enum],
+            values_callable=enum_values,
         ),
         nullable=False,
     )
@@ -68,7 +68,7 @@ class ReferralReward(IntPKMixin, TimestampMixin, Base):
             ReferralRewardType,
             native_enum=False,
             length=16,
-            values_callable=lambda enum: [item.value for item in enum],
+            values_callable=enum_values,
         ),
         nullable=False,
     )
@@ -7,7 +7,7 @@ from sqlalchemy import DateTime, Enum, ForeignKey, JSON, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.enums import SupportAuthorRole, SupportTicketPriority, SupportTicketStatus
-from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin
+from app.infrastructure.db.base import Base, IntPKMixin, TimestampMixin, enum_values
 
 
 class SupportTicket(IntPKMixin, TimestampMixin, Base):
@@ -22,7 +22,7 @@ class SupportTicket(IntPKMixin, TimestampMixin, Base):
             SupportTicketStatus,
             native_enum=False,
             length=32,
-            values_callable=lambda enum: [item.value for item in enum],
+            values_callable=enum_values,
         ),
         default=SupportTicketStatus.OPEN,
         nullable=False,
@@ -32,7 +32,7 @@ class SupportTicket(IntPKMixin, TimestampMixin, Base):
             SupportTicketPriority,
             native_enum=False,
             length=16,
-            values_callable=lambda enum: [item.value for item in enum],
+            values_callable=enum_values,
         ),
         default=SupportTicketPriority.NORMAL,
         nullable=False,
@@ -66,7 +66,7 @@ class SupportMessage(IntPKMixin, TimestampMixin, Base):
             SupportAuthorRole,
             native_enum=False,
             length=16,
-            values_callable=lambda enum: [item.value for item in enum],
+            values_callable=enum_values,
         ),
         nullable=False,
     )
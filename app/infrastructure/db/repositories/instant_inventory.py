@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from typing import Any, Sequence
+
+from sqlalchemy import insert, select
 
 from app.infrastructure.db.models import InstantInventoryItem
 
 from .base import BaseRepository
 
+BULK_INSERT_BATCH_SIZE = 1000
+
 
 class InstantInventoryRepository(BaseRepository):
     async def add_item(
@@ -25,6 +29,27 @@ class InstantInventoryRepository(BaseRepository):
         await self.add(item)
         return item
 
+    async def add_items(
+        self,
+        product_id: int,
+        items: Sequence[dict[str, Any]],
+        *,
+        batch_size: int = BULK_INSERT_BATCH_SIZE,
+    ) -> int:
+        rows = [
+            {
+                "product_id": product_id,
+                "label": item["label"],
+                "payload": item.get("payload"),
+                "meta": item.get("meta"),
+                "is_consumed": False,
+            }
+            for item in items
+        ]
+        for start in range(0, len(rows), batch_size):
+            await self.session.execute(insert(InstantInventoryItem), rows[start : start + batch_size])
+        return len(rows)
+
     async def list_available(self, product_id: int, limit: int = 10) -> list[InstantInventoryItem]:
         result = await self.session.execute(
             select(InstantInventoryItem)
@@ -56,7 +56,7 @@ class OrderRepository(BaseRepository):
         result = await self.session.execute(
             select(Order)
             .options(
-                joinedload(Order.answers),
+                selectinload(Order.answers),
                 selectinload(Order.product),
             )
             .where(Order.user_id == user_id)
@@ -70,7 +70,7 @@ class OrderRepository(BaseRepository):
             .options(
                 joinedload(Order.user),
                 joinedload(Order.product),
-                joinedload(Order.answers),
+                selectinload(Order.answers),
             )
             .where(Order.id == order_id)
         )
@@ -86,7 +86,7 @@ class OrderRepository(BaseRepository):
         result = await self.session.execute(
             select(Order)
             .options(
-                joinedload(Order.answers),
+                selectinload(Order.answers),
                 selectinload(Order.product),
             )
             .where(Order.user_id == user_id)
@@ -102,7 +102,7 @@ class OrderRepository(BaseRepository):
         result = await self.session.execute(
             select(Order)
             .options(
-                joinedload(Order.answers),
+                selectinload(Order.answers),
                 joinedload(Order.product),
                 joinedload(Order.user),
             )
@@ -147,7 +147,7 @@ class OrderRepository(BaseRepository):
         result = await self.session.execute(
             select(Order)
             .options(
-                joinedload(Order.answers),
+                selectinload(Order.answers),
                 joinedload(Order.product),
                 joinedload(Order.user),
             )
@@ -159,7 +159,7 @@ class OrderRepository(BaseRepository):
         result = await self.session.execute(
             select(Order)
             .options(
-                joinedload(Order.answers),
+                selectinload(Order.answers),
                 joinedload(Order.user),
                 joinedload(Order.product),
             )
@@ -193,7 +193,7 @@ class OrderRepository(BaseRepository):
         result = await self.session.execute(
             select(Order)
             .options(
-                joinedload(Order.answers),
+                selectinload(Order.answers),
                 joinedload(Order.user),
                 joinedload(Order.product),
             )
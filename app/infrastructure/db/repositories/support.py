@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import Iterable
 
 from sqlalchemy import Select, func, or_, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.core.enums import SupportAuthorRole, SupportTicketPriority, SupportTicketStatus
 from app.infrastructure.db.models import Order, SupportMessage, SupportTicket
@@ -63,7 +63,7 @@ class SupportRepository(BaseRepository):
             .options(
                 joinedload(SupportTicket.user),
                 joinedload(SupportTicket.order).joinedload(Order.product),
-                joinedload(SupportTicket.messages),
+                selectinload(SupportTicket.messages),
             )
             .where(SupportTicket.public_id == public_id)
         )
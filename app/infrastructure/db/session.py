@@ -14,6 +14,7 @@ engine = create_async_engine(
     settings.db_async_url,
     echo=False,
     pool_pre_ping=True,
+    query_cache_size=1200,
 )
 
 session_factory = async_sessionmaker(
@@ -44,7 +44,7 @@ async def start_bot(dispatcher: Dispatcher) -> None:
     settings = get_settings()
     bot = create_bot(settings)
 
-    owner_middleware = OwnerAccessMiddleware(owner_ids=set(settings.owner_user_ids))
+    owner_middleware = OwnerAccessMiddleware(owner_ids=settings.owner_user_ids)
 
     await setup_middlewares(dispatcher, owner_middleware)
     await bootstrap_default_settings()
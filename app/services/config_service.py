@@ -392,10 +392,10 @@ class ConfigService:
     async def _ensure_channels_default(self) -> list[str]:
         value = await self._settings_repo.get_value(SettingKey.SUBSCRIPTION_CHANNELS)
         if value is None:
-            return self._env_settings.required_channels_default
+            return list(self._env_settings.required_channels_default)
         if isinstance(value, list):
             return value
-        return self._env_settings.required_channels_default
+        return list(self._env_settings.required_channels_default)
 
     async def subscription_required(self) -> bool:
         value = await self._settings_repo.get_value(
@@ -10,13 +10,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
 from app.core.enums import OrderStatus
 from app.infrastructure.db.models import Order
+from app.infrastructure.db.models.order import OXAPAY_EXTRA_KEY
 from app.infrastructure.db.repositories import OrderRepository
 from app.services.config_service import ConfigService
 from app.services.oxapay_client import OxapayClient, OxapayError, OxapayInvoice, OxapayPayment
 from app.core.logging import get_logger
 
-OXAPAY_EXTRA_KEY = "oxapay_payment"
-
 
 @dataclass
 class CryptoInvoiceResult:
@@ -28,6 +28,9 @@ class InstantInventoryService:
             meta=meta,
         )
 
+    async def add_items(self, product: Product, items: Iterable[dict]) -> int:
+        return await self._repo.add_items(product.id, list(items))
+
     async def list_available(self, product: Product, limit: int = 10) -> list[InstantInventoryItem]:
         return await self._repo.list_available(product.id, limit=limit)
 
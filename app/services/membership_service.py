@@ -1,6 +1,7 @@
 ﻿from __future__ import annotations
 
 import time
+from collections import OrderedDict
 from typing import Dict, Iterable, Sequence, Tuple
 
 from aiogram import Bot
@@ -17,11 +18,19 @@ from .config_service import ConfigService
 CacheKey = Tuple[int, int | str]
 CacheValue = Tuple[MembershipStatus, float]
 
+_MEMBER_CHAT_STATUSES = frozenset({"creator", "administrator", "member"})
+
+CHANNELS_CACHE_TTL = 30.0
+ACCESS_CACHE_MAX_SIZE = 100_000
+
 
 class MembershipService:
     def __init__(self) -> None:
         self._settings = get_settings()
         self._cache: Dict[CacheKey, CacheValue] = {}
+        # user_id -> grant time, kept in grant order so the oldest entries sit at the front.
+        self._access_cache: OrderedDict[int, float] = OrderedDict()
+        self._channels_cache: Tuple[Sequence[RequiredChannel], float] | None = None
 
     async def ensure_default_settings(self, session: AsyncSession) -> None:
         config_service = ConfigService(session)
@@ -37,20 +46,61 @@ class MembershipService:
         user_id: int,
         session: AsyncSession,
         channels: Sequence[RequiredChannel] | None = None,
+    ) -> bool:
+        if self.has_cached_access(user_id):
+            return True
+
+        if not await self._check_access(bot, user_id, session, channels):
+            return False
+        self._remember_access(user_id)
+        return True
+
+    def _remember_access(self, user_id: int) -> None:
+        now = time.monotonic()
+        cache = self._access_cache
+        cache.pop(user_id, None)
+        cache[user_id] = now
+        ttl = self._settings.membership_cache_ttl
+        while cache:
+            granted_at = next(iter(cache.values()))
+            if now - granted_at < ttl and len(cache) <= ACCESS_CACHE_MAX_SIZE:
+                break
+            cache.popitem(last=False)
+
+    async def get_active_channels(self, session: AsyncSession) -> Sequence[RequiredChannel]:
+        now = time.monotonic()
+        if self._channels_cache and now - self._channels_cache[1] < CHANNELS_CACHE_TTL:
+            return self._channels_cache[0]
+        channels = await RequiredChannelRepository(session).list_active()
+        self._channels_cache = (channels, now)
+        return channels
+
+    def invalidate_channels(self) -> None:
+        self._channels_cache = None
+
+    def has_cached_access(self, user_id: int) -> bool:
+        granted_at = self._access_cache.get(user_id)
+        return granted_at is not None and time.monotonic() - granted_at < self._settings.membership_cache_ttl
+
+    async def _check_access(
+        self,
+        bot: Bot,
+        user_id: int,
+        session: AsyncSession,
+        channels: Sequence[RequiredChannel] | None,
     ) -> bool:
         if not await self.is_subscription_required(session):
             return True
 
         if channels is None:
-            channel_repo = RequiredChannelRepository(session)
-            channels = await channel_repo.list_active()
+            channels = await self.get_active_channels(session)
 
         if not channels:
             return True
 
         for channel in channels:
             status = await self._check_membership(bot, user_id, channel)
-            if status != MembershipStatus.MEMBER:
+            if status is not MembershipStatus.MEMBER:
                 return False
         return True
 
@@ -72,7 +122,7 @@ class MembershipService:
                 status = MembershipStatus.UNKNOWN
             else:
                 member = await bot.get_chat_member(target, user_id)
-                if member.status in {"creator", "administrator", "member"}:
+                if member.status in _MEMBER_CHAT_STATUSES:
                     status = MembershipStatus.MEMBER
                 else:
                     status = MembershipStatus.NOT_MEMBER
@@ -83,10 +133,14 @@ class MembershipService:
         return status
 
     def invalidate_user(self, user_id: int) -> None:
+        self._access_cache.pop(user_id, None)
         keys_to_delete = [key for key in self._cache if key[0] == user_id]
         for key in keys_to_delete:
             self._cache.pop(key, None)
 
+    def invalidate_access(self) -> None:
+        self._access_cache.clear()
+
     @staticmethod
     def _cache_key(user_id: int, channel: RequiredChannel) -> CacheKey:
         return (user_id, channel.channel_id or channel.username or "unknown")
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+from app.core.enums import OrderStatus
+from app.infrastructure.db.models import Order
+
+
+@dataclass(slots=True)
+class OrderView:
+    public_id: str
+    status: OrderStatus
+    amount: str
+    product_name: str
+    user_display: str
+
+
+def build_order_views(orders: Iterable[Order]) -> list[OrderView]:
+    views: list[OrderView] = []
+    for order in orders:
+        product = order.product
+        user = order.user
+        views.append(
+            OrderView(
+                public_id=order.public_id,
+                status=order.status,
+                amount=f"{order.total_amount} {order.currency}",
+                product_name=product.name if product is not None else "-",
+                user_display=user.display_name() if user is not None else f"id={order.user_id}",
+            )
+        )
+    return views
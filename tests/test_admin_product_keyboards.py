@@ -0,0 +1,80 @@
+from app.bot.callbacks.admin_products import ProductAdminCallback
+from app.bot.keyboards import admin_products as keyboards
+from app.core.enums import ProductRelationType
+from app.infrastructure.db.models import (
+    Category,
+    Product,
+    ProductBundleItem,
+    ProductQuestion,
+    ProductRelation,
+)
+from app.infrastructure.db.models.category import ProductCategory
+
+
+def _callbacks(markup) -> list[str]:
+    return [item.callback_data for row in markup.inline_keyboard for item in row]
+
+
+def test_prefixed_callbacks_match_callback_data_pack() -> None:
+    product = Product(id=7, name="Gift card", is_active=True)
+    other = Product(id=9, name="Sticker pack", is_active=False)
+    category = Category(id=3, name="Cards", is_active=True)
+    category.product_links = [ProductCategory(product_id=7, product=product)]
+
+    markups = [
+        keyboards.products_overview_keyboard([product, other]),
+        keyboards.product_detail_keyboard(product),
+        keyboards.product_delete_confirm_keyboard(7),
+        keyboards.product_edit_fields_keyboard(7),
+        keyboards.categories_overview_keyboard([category]),
+        keyboards.category_detail_keyboard(category),
+        keyboards.category_edit_fields_keyboard(3),
+        keyboards.bundle_components_keyboard(
+            7, [ProductBundleItem(component_product_id=9, component=other, quantity=2)]
+        ),
+        keyboards.relations_keyboard(
+            7,
+            [
+                ProductRelation(
+                    related_product_id=9,
+                    related_product=other,
+                    relation_type=ProductRelationType.UPSELL,
+                    weight=1,
+                )
+            ],
+        ),
+        keyboards.category_creation_confirm_keyboard(),
+        keyboards.category_delete_confirm_keyboard(3),
+        keyboards.product_questions_keyboard(7, [ProductQuestion(id=5, prompt="Email?", field_key="email")]),
+        keyboards.question_delete_confirm_keyboard(7, 5),
+        keyboards.question_type_keyboard(7),
+        keyboards.question_required_keyboard(7),
+        keyboards.creation_confirm_keyboard(),
+        keyboards.question_creation_confirm_keyboard(7),
+    ]
+
+    for markup in markups:
+        for callback_data in _callbacks(markup):
+            assert ProductAdminCallback.unpack(callback_data).pack() == callback_data
+
+
+def test_prefixed_callbacks_place_ids_in_their_fields() -> None:
+    other = Product(id=9, name="Sticker pack", is_active=False)
+
+    edit = ProductAdminCallback.unpack(_callbacks(keyboards.product_edit_fields_keyboard(7))[0])
+    assert (edit.action, edit.product_id, edit.value) == ("edit_field", 7, "name")
+
+    category_field = ProductAdminCallback.unpack(_callbacks(keyboards.category_edit_fields_keyboard(3))[0])
+    assert (category_field.product_id, category_field.target_id, category_field.value) == (None, 3, "name")
+
+    bundle = ProductAdminCallback.unpack(
+        _callbacks(
+            keyboards.bundle_components_keyboard(
+                7, [ProductBundleItem(component_product_id=9, component=other, quantity=2)]
+            )
+        )[0]
+    )
+    assert (bundle.action, bundle.product_id, bundle.target_id) == ("bundle_remove", 7, 9)
+
+    question = ProductAdminCallback.unpack(_callbacks(keyboards.question_delete_confirm_keyboard(7, 5))[0])
+    assert (question.product_id, question.question_id, question.target_id) == (7, 5, None)
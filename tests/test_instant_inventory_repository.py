@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.infrastructure.db.base import Base
+from app.infrastructure.db.models import Product
+from app.infrastructure.db.repositories.instant_inventory import InstantInventoryRepository
+
+
+@pytest_asyncio.fixture()
+async def session() -> AsyncSession:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:', future=True)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio()
+async def test_add_items_inserts_in_batches(session: AsyncSession) -> None:
+    product = Product(
+        name='Keys',
+        slug='keys',
+        summary=None,
+        description=None,
+        price=Decimal('5.00'),
+        currency='USD',
+        inventory=None,
+        is_active=True,
+    )
+    session.add(product)
+    await session.flush()
+
+    repo = InstantInventoryRepository(session)
+    items = [{'label': f'key-{index}', 'payload': f'secret-{index}'} for index in range(5)]
+    inserted = await repo.add_items(product.id, items, batch_size=2)
+
+    assert inserted == 5
+    available = await repo.list_available(product.id, limit=10)
+    assert [item.label for item in available] == [f'key-{index}' for index in range(5)]
+    assert all(item.is_consumed is False for item in available)
@@ -0,0 +1,117 @@
+from decimal import Decimal
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from app.bot.keyboards.admin_referral import (
+    referral_admin_dashboard_keyboard,
+    referral_admin_link_keyboard,
+    referral_admin_links_keyboard,
+    referral_admin_rewards_keyboard,
+)
+from app.bot.keyboards.admin_support import (
+    admin_support_antispam_keyboard,
+    admin_support_list_keyboard,
+    admin_support_menu_keyboard,
+    admin_support_ticket_keyboard,
+)
+from app.bot.keyboards.admin_users import user_detail_keyboard, user_orders_keyboard, users_overview_keyboard
+from app.bot.keyboards.cart import cart_checkout_confirmation_keyboard
+from app.bot.keyboards.main_menu import back_keyboard, main_menu_keyboard
+from app.bot.keyboards.orders import order_confirm_keyboard
+from app.bot.keyboards.support import support_main_keyboard
+from app.core.enums import OrderStatus, ReferralRewardType, SupportTicketPriority, SupportTicketStatus
+from app.infrastructure.db.models import Order, ReferralLink, ReferralReward, SupportTicket, UserProfile
+
+_PUBLIC_ID = "0" * 36
+_BIG_ID = 2**63 - 1
+
+
+def test_static_keyboards_are_shared_instances() -> None:
+    assert referral_admin_dashboard_keyboard() is referral_admin_dashboard_keyboard()
+    assert admin_support_menu_keyboard() is admin_support_menu_keyboard()
+    assert admin_support_antispam_keyboard() is admin_support_antispam_keyboard()
+    assert cart_checkout_confirmation_keyboard() is cart_checkout_confirmation_keyboard()
+    assert main_menu_keyboard(show_admin=True) is main_menu_keyboard(show_admin=True)
+    assert main_menu_keyboard(show_admin=False) is main_menu_keyboard(show_admin=False)
+    assert back_keyboard("menu:home") is back_keyboard("menu:home")
+    assert order_confirm_keyboard() is order_confirm_keyboard()
+    assert support_main_keyboard(has_tickets=True) is support_main_keyboard(has_tickets=True)
+
+
+def test_main_menu_variants_differ_by_admin_entries() -> None:
+    user_texts = [row[0].text for row in main_menu_keyboard(show_admin=False).inline_keyboard]
+    admin_texts = [row[0].text for row in main_menu_keyboard(show_admin=True).inline_keyboard]
+    assert "Admin panel" not in user_texts
+    assert admin_texts[-1] == "Admin panel"
+
+
+def test_admin_callback_data_fits_telegram_limit() -> None:
+    user = UserProfile(id=_BIG_ID, telegram_id=_BIG_ID, is_blocked=False)
+    order = Order(
+        public_id=_PUBLIC_ID,
+        status=OrderStatus.AWAITING_PAYMENT,
+        total_amount=Decimal("10.00"),
+        currency="USD",
+        service_duration_days=30,
+    )
+    ticket = SupportTicket(
+        public_id=_PUBLIC_ID,
+        subject="Subject",
+        status=SupportTicketStatus.AWAITING_ADMIN,
+        priority=SupportTicketPriority.URGENT,
+        user_id=_BIG_ID,
+    )
+    ticket.order = order
+    link = ReferralLink(id=_BIG_ID, code="code")
+    reward = ReferralReward(id=_BIG_ID, reward_type=ReferralRewardType.COMMISSION)
+
+    markups = [
+        admin_support_list_keyboard([ticket], filter_code="await_admin", page=10_000, has_prev=True, has_next=True),
+        admin_support_ticket_keyboard(ticket, admin_id=None, filter_code="await_admin", page=10_000),
+        referral_admin_links_keyboard([link]),
+        referral_admin_link_keyboard(link),
+        referral_admin_rewards_keyboard([reward]),
+        users_overview_keyboard([user], page=10_000, has_prev=True, has_next=True),
+        user_detail_keyboard(user),
+        user_orders_keyboard(_BIG_ID, [order]),
+    ]
+
+    for markup in markups:
+        for row in markup.inline_keyboard:
+            for item in row:
+                assert len(item.callback_data.encode()) <= 64, item.callback_data
+
+
+def test_unvalidated_markup_serializes_like_validated_markup() -> None:
+    markup = admin_support_menu_keyboard()
+    validated = InlineKeyboardMarkup(
+        inline_keyboard=[
+            [InlineKeyboardButton(text=item.text, callback_data=item.callback_data) for item in row]
+            for row in markup.inline_keyboard
+        ]
+    )
+    session = AiohttpSession()
+    bot = Bot("42:TEST", session=session)
+
+    assert session.prepare_value(markup, bot, {}) == session.prepare_value(validated, bot, {})
+
+
+def test_support_list_keyboard_is_reused_until_a_ticket_changes() -> None:
+    ticket = SupportTicket(
+        public_id=_PUBLIC_ID,
+        subject="Subject",
+        status=SupportTicketStatus.OPEN,
+        priority=SupportTicketPriority.NORMAL,
+        user_id=1,
+    )
+
+    def render():
+        return admin_support_list_keyboard([ticket], filter_code="open", page=0, has_prev=False, has_next=False)
+
+    first = render()
+    assert render() is first
+
+    ticket.status = SupportTicketStatus.RESOLVED
+    assert render() is not first
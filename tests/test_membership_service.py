@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from app.services.membership_service import MembershipService
+
+
+class _CountingMembershipService(MembershipService):
+    def __init__(self, allowed: bool) -> None:
+        super().__init__()
+        self.allowed = allowed
+        self.checks = 0
+
+    async def _check_access(self, bot, user_id, session, channels) -> bool:
+        self.checks += 1
+        return self.allowed
+
+
+@pytest.mark.asyncio()
+async def test_granted_access_is_reused_until_invalidated() -> None:
+    service = _CountingMembershipService(allowed=True)
+
+    assert await service.user_can_access(None, 1, None)
+    assert await service.user_can_access(None, 1, None)
+    assert service.has_cached_access(1)
+    assert service.checks == 1
+
+    service.invalidate_user(1)
+    assert not service.has_cached_access(1)
+    assert await service.user_can_access(None, 1, None)
+    assert service.checks == 2
+
+
+@pytest.mark.asyncio()
+async def test_denied_access_is_rechecked() -> None:
+    service = _CountingMembershipService(allowed=False)
+
+    assert not await service.user_can_access(None, 1, None)
+    assert not await service.user_can_access(None, 1, None)
+    assert not service.has_cached_access(1)
+    assert service.checks == 2
+
+
+@pytest.mark.asyncio()
+async def test_access_cache_evicts_oldest_grants_past_max_size(monkeypatch) -> None:
+    monkeypatch.setattr("app.services.membership_service.ACCESS_CACHE_MAX_SIZE", 2)
+    service = _CountingMembershipService(allowed=True)
+
+    for user_id in (1, 2, 3):
+        assert await service.user_can_access(None, user_id, None)
+
+    assert not service.has_cached_access(1)
+    assert service.has_cached_access(2)
+    assert service.has_cached_access(3)
+    assert len(service._access_cache) == 2
+
+
+class _FakeChannelRepository:
+    calls = 0
+
+    def __init__(self, session) -> None:
+        pass
+
+    async def list_active(self) -> list[str]:
+        type(self).calls += 1
+        return ["@channel"]
+
+
+@pytest.mark.asyncio()
+async def test_active_channels_are_cached_until_invalidated(monkeypatch) -> None:
+    monkeypatch.setattr("app.services.membership_service.RequiredChannelRepository", _FakeChannelRepository)
+    service = MembershipService()
+
+    assert await service.get_active_channels(None) == ["@channel"]
+    assert await service.get_active_channels(None) == ["@channel"]
+    assert _FakeChannelRepository.calls == 1
+
+    service.invalidate_channels()
+    await service.get_active_channels(None)
+    assert _FakeChannelRepository.calls == 2